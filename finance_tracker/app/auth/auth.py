@@ -16,8 +16,8 @@ from fastapi.responses import RedirectResponse
 from starlette.responses import Response
 
 from .. import settings
-from ..repos.users_repo import create_user, get_user_by_email, get_user_by_username
-from ..security import create_access_token, hash_password, verify_password
+from ..repos.users_repo import create_user, get_user_by_email, get_user_by_username, update_password_hash
+from ..security import create_access_token, hash_password, password_needs_rehash, verify_password
 
 router = APIRouter()
 
@@ -121,7 +121,11 @@ def login_submit(
     if user is None or not verify_password(password, user["password_hash"]):
         return templates.TemplateResponse("login.html", {"request": request, "error": "Invalid email or password.", "user": None})
 
-    token = create_access_token(user_id=int(user["id"]), email=user["email"])
+    # Move legacy password hashes to the current scheme while we have the password.
+    if password_needs_rehash(user["password_hash"]):
+        update_password_hash(user["id"], hash_password(password))
+
+    token = create_access_token(user_id=user["id"], email=user["email"])
     resp = RedirectResponse(url="/dashboard", status_code=303)
     _set_auth_cookie(resp, token)
     return resp
@@ -5,25 +5,80 @@ SimpleDB integration layer.
 
 Step 1 responsibilities:
 - Open the SimpleDB database from settings.DB_DIR
-- Provide a global threading.Lock to serialize DB access
+- Provide a global lock to serialize DB writes
   (important because our DB is file-based and not designed for concurrent writes)
 - Provide small helper functions execute()/execute_script() so later code does not
   spread DB access logic everywhere.
+
+Reads and writes:
+- The global lock is a reader/writer lock: SELECTs run concurrently with each
+  other, everything else runs alone.
+- Repos call execute_read()/execute_write() directly; execute() classifies the
+  statement by its first keyword.
+- execute_prepared() takes a '?' template plus parameters. SimpleDB parses
+  each template once (Database.prepare cache) and binds the values into the
+  parsed statement, so no SQL text is built or escaped per call. Repos use it
+  for every statement that carries values; execute_read()/execute_write()
+  remain for fixed SQL.
+- The *_async() variants run the same calls in a worker thread. Anything that
+  touches _DB from an `async def` must use them: the locks block, and blocking
+  the event loop stalls every other request.
+- write_batch() holds exclusive locks across several statements, for
+  check-then-write sequences that must not interleave with other writers.
+- Results are not type-checked at runtime. Callers annotate what they expect
+  (`res: QueryResult = execute_read(...)`); a mismatch fails on attribute access.
+
+Per-table locks:
+- _DB_LOCK is the schema-level lock. Statements that name their tables
+  (SELECT/INSERT/UPDATE/DELETE) hold it shared, plus a per-table RWLock:
+  shared for SELECT, exclusive for writes. So a category rename and a
+  transaction insert no longer wait for each other.
+- DDL, scripts and anything unrecognised take _DB_LOCK exclusively, which also
+  excludes every per-table holder.
+- Locks are always taken schema lock first, then tables in sorted name order,
+  so two statements can never wait on each other in a cycle.
+- None of these locks is reentrant, by choice: a reentrant reader/writer lock
+  needs per-thread bookkeeping on every acquire, and re-acquiring a read lock
+  while a writer waits deadlocks anyway. So never call execute*() while
+  already holding a lock (inside write_batch(), or transitively from another
+  execute*()). Batches go through one call: execute_script() for fixed
+  statement lists, write_batch() when later statements depend on earlier
+  results.
+- Precondition (SimpleDB's storage model): each table's heap and index files
+  are private to that table; the shared catalog is only mutated by DDL; the
+  shared index and heap caches are dicts filled with per-table entries (single
+  dict operations are atomic). Revisit this if SimpleDB grows cross-table state.
 """
 
 from __future__ import annotations
 
+import re
 import threading
+from contextlib import contextmanager
+from functools import lru_cache
+from typing import Any, Callable, Iterator, Sequence
 
+import anyio
 from simpledb import Database
 
 from . import settings
+from .rwlock import RWLock
 
 # One Database instance for the whole process
 _DB = Database.open(settings.DB_DIR)
 
-# Serialize DB calls (web servers can handle requests concurrently)
-_DB_LOCK = threading.Lock()
+# Schema-level lock: shared by per-table statements, exclusive for DDL/scripts
+_DB_LOCK = RWLock()
+
+# table name -> RWLock, created on first use
+_TABLE_LOCKS: dict[str, RWLock] = {}
+_TABLE_LOCKS_GUARD = threading.Lock()
+
+# Tables a statement names. String and number literals are blanked first, so
+# user text like 'from mom' cannot add tables and the cache key repeats.
+_TABLE_RE = re.compile(r"\b(?:FROM|INTO|UPDATE|JOIN)\s+(\w+)", re.IGNORECASE)
+_LITERAL_RE = re.compile(r"'(?:[^']|'')*'|\b\d+\b")
+_TABLE_STMT_KEYWORDS = ("SELECT", "INSERT", "UPDATE", "DELETE")
 
 
 def get_db() -> Database:
@@ -36,6 +91,116 @@ def get_db() -> Database:
     return _DB
 
 
+def _is_read(sql: str) -> bool:
+    """
+    Classify a statement as read-only (SELECT) or not.
+
+    Args:
+        sql: SQL string.
+
+    Returns:
+        True if the statement starts with SELECT.
+    """
+    return sql.lstrip()[:6].upper() == "SELECT"
+
+
+@lru_cache(maxsize=512)
+def _tables_of_shape(shape: str) -> tuple[str, ...] | None:
+    """
+    Tables named by a literal-free statement, or None if it needs the schema lock.
+
+    Args:
+        shape: SQL with its literals blanked (see _tables_of).
+
+    Returns:
+        Sorted, de-duplicated table names; None for DDL or unrecognised input.
+    """
+    if shape.lstrip()[:6].upper() not in _TABLE_STMT_KEYWORDS:
+        return None
+    tables = sorted({m.lower() for m in _TABLE_RE.findall(shape)})
+    return tuple(tables) or None
+
+
+def _tables_of(sql: str) -> tuple[str, ...] | None:
+    """
+    Tables named by a statement (literals ignored), or None for DDL/unknown.
+    """
+    return _tables_of_shape(_LITERAL_RE.sub("0", sql))
+
+
+def _table_lock(table: str) -> RWLock:
+    """Return the RWLock for a table, creating it on first use."""
+    lock = _TABLE_LOCKS.get(table)
+    if lock is None:
+        with _TABLE_LOCKS_GUARD:
+            lock = _TABLE_LOCKS.setdefault(table, RWLock())
+    return lock
+
+
+@contextmanager
+def _locked(tables: tuple[str, ...] | None, write: bool) -> Iterator[None]:
+    """
+    Hold the schema lock and the given tables' locks, in the documented order.
+
+    Args:
+        tables: Sorted table names, or None for exclusive schema access.
+        write: Exclusive (True) or shared (False) access to the tables.
+    """
+    if tables is None:
+        with _DB_LOCK.write():
+            yield
+        return
+
+    locks = [_table_lock(t) for t in tables]
+    with _DB_LOCK.read():
+        taken: list[RWLock] = []
+        try:
+            for lock in locks:
+                if write:
+                    lock.acquire_write()
+                else:
+                    lock.acquire_read()
+                taken.append(lock)
+            yield
+        finally:
+            for lock in reversed(taken):
+                if write:
+                    lock.release_write()
+                else:
+                    lock.release_read()
+
+
+def execute_read(sql: str):
+    """
+    Execute a single read-only statement (SELECT) under shared locks.
+
+    Args:
+        sql: SQL string containing a single SELECT.
+
+    Returns:
+        QueryResult (from SimpleDB).
+    """
+    with _locked(_tables_of(sql), write=False):
+        return _DB.execute(sql)
+
+
+def execute_write(sql: str):
+    """
+    Execute a single statement that modifies data or schema.
+
+    Args:
+        sql: SQL string containing a single statement.
+
+    Returns:
+        CommandOk or QueryResult (from SimpleDB).
+
+    Notes:
+        INSERT/UPDATE/DELETE lock only their table; DDL locks the whole DB.
+    """
+    with _locked(_tables_of(sql), write=True):
+        return _DB.execute(sql)
+
+
 def execute(sql: str):
     """
     Execute a single SQL statement with locking.
@@ -46,8 +211,36 @@ def execute(sql: str):
     Returns:
         CommandOk or QueryResult (from SimpleDB).
     """
-    with _DB_LOCK:
-        return _DB.execute(sql)
+    if _is_read(sql):
+        return execute_read(sql)
+    return execute_write(sql)
+
+
+@lru_cache(maxsize=256)
+def _template_is_read(template: str) -> bool:
+    """Cached _is_read() for templates (they repeat on every call)."""
+    return _is_read(template)
+
+
+@lru_cache(maxsize=256)
+def _template_tables(template: str) -> tuple[str, ...] | None:
+    """Cached _tables_of() for templates: '?' carries no table names."""
+    return _tables_of(template)
+
+
+def execute_prepared(template: str, params: Sequence[Any] = ()):
+    """
+    Execute a single statement written with positional '?' placeholders.
+
+    Args:
+        template: SQL template, e.g. "SELECT id FROM users WHERE email = ?;"
+        params: Values for the placeholders, in order.
+
+    Returns:
+        CommandOk or QueryResult (from SimpleDB).
+    """
+    with _locked(_template_tables(template), write=not _template_is_read(template)):
+        return _DB.execute_prepared(template, params)
 
 
 def execute_script(sql: str):
@@ -60,5 +253,71 @@ def execute_script(sql: str):
     Returns:
         List of CommandOk/QueryResult results.
     """
-    with _DB_LOCK:
-        return _DB.execute_script(sql)
\ No newline at end of file
+    with _DB_LOCK.write():
+        return _DB.execute_script(sql)
+
+
+async def execute_async(sql: str):
+    """
+    execute() for async callers: runs in a worker thread.
+
+    Args:
+        sql: SQL string containing a single statement.
+
+    Returns:
+        CommandOk or QueryResult (from SimpleDB).
+    """
+    return await anyio.to_thread.run_sync(execute, sql)
+
+
+async def execute_prepared_async(template: str, params: Sequence[Any] = ()):
+    """
+    execute_prepared() for async callers: runs in a worker thread.
+
+    Args:
+        template: SQL template with '?' placeholders.
+        params: Values for the placeholders, in order.
+
+    Returns:
+        CommandOk or QueryResult (from SimpleDB).
+    """
+    return await anyio.to_thread.run_sync(execute_prepared, template, params)
+
+
+async def execute_script_async(sql: str):
+    """
+    execute_script() for async callers: runs in a worker thread.
+
+    Args:
+        sql: SQL script containing one or more statements separated by ';'.
+
+    Returns:
+        List of CommandOk/QueryResult results.
+    """
+    return await anyio.to_thread.run_sync(execute_script, sql)
+
+
+@contextmanager
+def write_batch(*tables: str) -> Iterator[Callable[[str], Any]]:
+    """
+    Hold exclusive locks for a group of statements.
+
+    Args:
+        tables: Every table the statements touch (read or written). If none
+            are given, the whole DB is locked.
+
+    Yields:
+        A function run(template, params=()) that executes one statement with
+        '?' placeholders, like execute_prepared() but without further locking.
+
+    Notes:
+        Use it as:
+          with write_batch("categories") as run:
+              res = run("SELECT ... WHERE user_id = ?;", (user_id,))
+              run("INSERT ...", (...))
+        Statements run without further locking, so a table missing from
+        `tables` is unprotected. Do not call execute*() inside the block: the
+        locks are not reentrant.
+    """
+    with _locked(tuple(sorted(set(tables))) or None, write=True):
+        yield _DB.execute_prepared
@@ -7,6 +7,8 @@ Step 1 responsibilities:
 - Ensure required tables exist (users, categories, transactions)
 - Ensure basic indexes exist to support later steps
 - Be idempotent: safe to call on every startup
+- Seed the id allocator (one id scan per table, instead of one per insert)
+- Migrate older databases (categories.name_lc)
 
 We rely on db.catalog checks so we don't crash on re-runs.
 """
@@ -15,7 +17,66 @@ from __future__ import annotations
 
 from simpledb import Database
 
-from .db_core import execute
+from .db_core import execute_read, execute_script
+from .id_gen import ids
+from .sql import sql_literal
+
+# (name, DDL) pairs, in creation order. Statements are kept as single-line
+# constants (no per-startup .strip()) and have no trailing ';': init_db joins the
+# missing ones into one script.
+
+TABLE_DDL: tuple[tuple[str, str], ...] = (
+    (
+        "users",
+        "CREATE TABLE users ("
+        "id INTEGER PRIMARY KEY, "
+        "username VARCHAR(32) UNIQUE NOT NULL, "
+        "email VARCHAR(255) UNIQUE NOT NULL, "
+        "password_hash TEXT NOT NULL)",
+    ),
+    (
+        "categories",
+        "CREATE TABLE categories ("
+        "id INTEGER PRIMARY KEY, "
+        "user_id INTEGER NOT NULL, "
+        "name VARCHAR(50) NOT NULL, "
+        "name_lc TEXT)",
+    ),
+    (
+        "transactions",
+        "CREATE TABLE transactions ("
+        "id INTEGER PRIMARY KEY, "
+        "user_id INTEGER NOT NULL, "
+        "category_id INTEGER NOT NULL, "
+        "amount_cents INTEGER NOT NULL, "
+        "type VARCHAR(7) NOT NULL, "
+        "description TEXT, "
+        "date DATE NOT NULL, "
+        "ym VARCHAR(7) NOT NULL)",
+    ),
+)
+
+# Equality lookups only: SimpleDB indexes are hash indexes. A composite index
+# is used only when every key column is bound (no prefix/range scans), so
+# idx_tx_user stays for the "all months" listing next to idx_tx_user_ym (the
+# planner picks whichever usable index yields the fewest rids, and the wider
+# key on a tie). There is deliberately no (user_id, type, ym) index: the
+# dashboard reads a month's income and expenses in one (user_id, ym) lookup
+# (transactions_repo.aggregate_month_for_user), so nothing would bind type.
+# Indexes on PRIMARY KEY / UNIQUE columns also let SimpleDB check key conflicts
+# on INSERT/UPDATE by lookup instead of scanning the table.
+INDEX_DDL: tuple[tuple[str, str], ...] = (
+    ("idx_users_id", "CREATE INDEX idx_users_id ON users(id)"),
+    ("idx_users_email", "CREATE INDEX idx_users_email ON users(email)"),
+    ("idx_users_username", "CREATE INDEX idx_users_username ON users(username)"),
+    ("idx_categories_id", "CREATE INDEX idx_categories_id ON categories(id)"),
+    ("idx_categories_user", "CREATE INDEX idx_categories_user ON categories(user_id)"),
+    ("idx_tx_id", "CREATE INDEX idx_tx_id ON transactions(id)"),
+    ("idx_tx_user", "CREATE INDEX idx_tx_user ON transactions(user_id)"),
+    ("idx_tx_ym", "CREATE INDEX idx_tx_ym ON transactions(ym)"),
+    ("idx_tx_category", "CREATE INDEX idx_tx_category ON transactions(category_id)"),
+    ("idx_tx_user_ym", "CREATE INDEX idx_tx_user_ym ON transactions(user_id, ym)"),
+)
 
 
 def init_db(db: Database) -> None:
@@ -24,69 +85,51 @@ def init_db(db: Database) -> None:
 
     Args:
         db: SimpleDB Database instance (used to inspect catalog state).
-    """
-    # ---- Tables ----
-    # Note: We create all tables now as part of "foundation".
-    # This does NOT implement features yet; it just prepares storage.
-
-    if "users" not in db.catalog.tables:
-        execute(
-            """
-            CREATE TABLE users (
-              id INTEGER PRIMARY KEY,
-              username VARCHAR(32) UNIQUE NOT NULL,
-              email VARCHAR(255) UNIQUE NOT NULL,
-              password_hash TEXT NOT NULL
-            );
-            """.strip()
-        )
-
-    if "categories" not in db.catalog.tables:
-        execute(
-            """
-            CREATE TABLE categories (
-              id INTEGER PRIMARY KEY,
-              user_id INTEGER NOT NULL,
-              name VARCHAR(50) NOT NULL
-            );
-            """.strip()
-        )
-
-    if "transactions" not in db.catalog.tables:
-        execute(
-            """
-            CREATE TABLE transactions (
-              id INTEGER PRIMARY KEY,
-              user_id INTEGER NOT NULL,
-              category_id INTEGER NOT NULL,
-              amount_cents INTEGER NOT NULL,
-              type VARCHAR(7) NOT NULL,
-              description TEXT,
-              date DATE NOT NULL,
-              ym VARCHAR(7) NOT NULL
-            );
-            """.strip()
-        )
-
-    # ---- Indexes ----
-    # SimpleDB supports single-column indexes. These help common equality lookups.
 
+    Notes:
+        All missing tables and indexes are created by a single execute_script()
+        call: one parse and one write-lock acquisition. Tables come first in
+        the script, so new indexes always find their table.
+    """
+    tables = db.catalog.tables
     indexes = db.catalog.indexes
 
-    if "idx_users_email" not in indexes:
-        execute("CREATE INDEX idx_users_email ON users(email);")
+    sql_parts = [stmt for name, stmt in TABLE_DDL if name not in tables]
+    sql_parts += [stmt for name, stmt in INDEX_DDL if name not in indexes]
+    if sql_parts:
+        execute_script(";\n".join(sql_parts) + ";")
+
+    _migrate_categories_name_lc(db)
 
-    if "idx_users_username" not in indexes:
-        execute("CREATE INDEX idx_users_username ON users(username);")
+    # ---- Id counters ----
+    for table in ("users", "categories", "transactions"):
+        ids.seed(table)
 
-    if "idx_categories_user" not in indexes:
-        execute("CREATE INDEX idx_categories_user ON categories(user_id);")
 
-    if "idx_tx_user" not in indexes:
-        execute("CREATE INDEX idx_tx_user ON transactions(user_id);")
+def _migrate_categories_name_lc(db: Database) -> None:
+    """
+    Add and backfill categories.name_lc (lowercased name, the listing sort key).
 
-    if "idx_tx_ym" not in indexes:
-        execute("CREATE INDEX idx_tx_ym ON transactions(ym);")
+    Args:
+        db: SimpleDB Database instance.
 
-    if "idx_tx_category" not in indexes:
-        execute("CREATE INDEX idx_tx_category ON transactions(category_id);")
\ No newline at end of file
+    Notes:
+        The column is nullable because ALTER TABLE cannot add a NOT NULL column
+        to a non-empty table; every write path sets it. The backfill (no LOWER()
+        in SimpleDB, so str.lower() here) only touches rows still missing it.
+    """
+    if db.catalog.tables["categories"].get_column("name_lc") is None:
+        execute_script("ALTER TABLE categories ADD COLUMN name_lc TEXT;")
+
+    res = execute_read("SELECT id, name, name_lc FROM categories;")
+    missing = [(cid, name) for cid, name, name_lc in res.rows if name_lc is None]
+    if not missing:
+        return
+
+    # One script: one parse pass and one lock acquisition for the whole backfill.
+    execute_script(
+        "".join(
+            f"UPDATE categories SET name_lc = {sql_literal(name.lower())} WHERE id = {sql_literal(cid)};\n"
+            for cid, name in missing
+        )
+    )
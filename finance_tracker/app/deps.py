@@ -6,34 +6,91 @@ Auth helpers.
 Step 10 updates:
 - Add require_user() helper to standardize redirect pattern.
 - Add helper to clear invalid auth cookie (optional hardening).
+
+Verified JWT payloads are cached (keyed by the token's SHA-256) so the hot auth
+path skips signature verification. Entries live at most 30s and never past the
+token's own "exp"; invalid tokens are never cached. Cookies that are not
+shaped like a JWT (header.payload.signature) or are oversized are rejected
+before any hashing or decoding.
 """
 
 from __future__ import annotations
 
+import hashlib
+import threading
+import time
+from typing import Any
+
+from cachetools import TLRUCache
 from fastapi import Request
 from fastapi.responses import RedirectResponse
 from starlette.responses import Response
 
 from . import settings
-from .repos.users_repo import get_user_by_id
+from .repos.users_repo import get_user_by_id, get_user_by_id_async
 from .security import decode_access_token
 
+_JWT_CACHE_TTL_SECONDS = 30
 
-def get_current_user(request: Request) -> dict | None:
+# Our tokens are a few hundred bytes; anything far larger is not one of ours.
+_MAX_TOKEN_LENGTH = 4096
+
+
+def _jwt_ttu(_key: bytes, payload: dict[str, Any], now: float) -> float:
     """
-    Read JWT cookie, validate it, and load the user.
+    Expiry time for a cached payload: now + TTL, clamped to the token's exp.
+    """
+    expires = now + _JWT_CACHE_TTL_SECONDS
+    exp = payload.get("exp")
+    if isinstance(exp, (int, float)):
+        expires = min(expires, exp)
+    return expires
+
+
+# sha256(token) -> decoded payload. Timer is wall-clock so it compares with "exp".
+_jwt_cache: TLRUCache = TLRUCache(maxsize=10000, ttu=_jwt_ttu, timer=time.time)
+_jwt_cache_lock = threading.Lock()
+
+
+def _cached_decode(token: str) -> dict[str, Any] | None:
+    """
+    decode_access_token() with a short-lived cache of successful results.
+
+    Args:
+        token: Raw JWT string from the cookie.
+
+    Returns:
+        Decoded payload, or None if the token is invalid/expired.
+    """
+    key = hashlib.sha256(token.encode("utf-8")).digest()
+    with _jwt_cache_lock:
+        payload = _jwt_cache.get(key)
+    if payload is not None:
+        return payload
+
+    payload = decode_access_token(token)
+    if payload:
+        with _jwt_cache_lock:
+            _jwt_cache[key] = payload
+    return payload
+
+
+def _user_id_from_request(request: Request) -> int | None:
+    """
+    Read the JWT cookie and return the authenticated user id (no DB access).
 
     Args:
         request: FastAPI request
 
     Returns:
-        User dict if authenticated, otherwise None.
+        User id from a valid token's "sub" claim, otherwise None.
     """
     token = request.cookies.get(settings.AUTH_COOKIE_NAME)
-    if not token:
+    # Cheap structural filter: garbage cookies never reach base64/HMAC work.
+    if not token or len(token) > _MAX_TOKEN_LENGTH or token.count(".") != 2:
         return None
 
-    payload = decode_access_token(token)
+    payload = _cached_decode(token)
     if not payload:
         return None
 
@@ -42,13 +99,37 @@ def get_current_user(request: Request) -> dict | None:
         return None
 
     try:
-        user_id = int(sub)
+        return int(sub)
     except ValueError:
         return None
 
+
+def get_current_user(request: Request) -> dict | None:
+    """
+    Read JWT cookie, validate it, and load the user.
+
+    Args:
+        request: FastAPI request
+
+    Returns:
+        User dict if authenticated, otherwise None.
+    """
+    user_id = _user_id_from_request(request)
+    if user_id is None:
+        return None
     return get_user_by_id(user_id)
 
 
+async def get_current_user_async(request: Request) -> dict | None:
+    """
+    get_current_user() for async routes: a user-cache miss runs in a worker thread.
+    """
+    user_id = _user_id_from_request(request)
+    if user_id is None:
+        return None
+    return await get_user_by_id_async(user_id)
+
+
 def clear_auth_cookie(resp: Response) -> None:
     """
     Remove auth cookie from client.
@@ -79,4 +160,14 @@ def require_user(request: Request) -> tuple[dict | None, Response | None]:
     user = get_current_user(request)
     if user:
         return user, None
-    return None, RedirectResponse(url="/login", status_code=303)
\ No newline at end of file
+    return None, RedirectResponse(url="/login", status_code=303)
+
+
+async def require_user_async(request: Request) -> tuple[dict | None, Response | None]:
+    """
+    require_user() for `async def` routes (same contract).
+    """
+    user = await get_current_user_async(request)
+    if user:
+        return user, None
+    return None, RedirectResponse(url="/login", status_code=303)
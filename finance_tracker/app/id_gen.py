@@ -0,0 +1,74 @@
+"""
+app/id_gen.py
+
+Process-local id allocation.
+
+SimpleDB has no auto-increment, so ids used to be computed as max(id)+1 by
+scanning the whole table on every insert. Instead we scan each table once
+(at startup, from init_db) and hand out ids from an in-memory counter.
+
+Implementation notes:
+- This relies on the app running as a single process (see Dockerfile); every
+  insert goes through this allocator, so the counter never falls behind the
+  table.
+- The allocator has its own small lock: handing out an id does not need to
+  wait for unrelated DB work behind the global DB lock.
+"""
+
+from __future__ import annotations
+
+import threading
+
+from simpledb import QueryResult
+
+from .db_core import execute_read
+
+
+class IdAllocator:
+    """
+    Monotonic per-table id counters.
+    """
+
+    def __init__(self) -> None:
+        self._m: dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def seed(self, table: str) -> None:
+        """
+        Seed the counter for a table from its current max(id).
+
+        Args:
+            table: Table name (trusted, not user input).
+        """
+        # SimpleDB has no MAX(); ORDER BY ... LIMIT 1 keeps the projection and
+        # the result set down to a single row.
+        res: QueryResult = execute_read(f"SELECT id FROM {table} ORDER BY id DESC LIMIT 1;")
+        max_id = (res.rows[0][0] or 0) if res.rows else 0
+
+        with self._lock:
+            # Never move a counter backwards if ids were handed out meanwhile.
+            self._m[table] = max(self._m.get(table, 0), max_id)
+
+    def next(self, table: str) -> int:
+        """
+        Allocate the next id for a table.
+
+        Args:
+            table: Table name.
+
+        Returns:
+            New unique id.
+        """
+        if table not in self._m:
+            # init_db seeds every table; this only covers callers that run
+            # before startup (scripts, tests).
+            self.seed(table)
+
+        with self._lock:
+            value = self._m[table] + 1
+            self._m[table] = value
+            return value
+
+
+# One allocator for the whole process
+ids = IdAllocator()
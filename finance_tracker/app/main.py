@@ -10,8 +10,10 @@ from __future__ import annotations
 from pathlib import Path
 
 from fastapi import FastAPI
+from jinja2 import FileSystemBytecodeCache
 from starlette.templating import Jinja2Templates
 
+from . import settings
 from .db_core import get_db
 from .db_init import init_db
 from .auth.auth import router as auth_router
@@ -27,7 +29,15 @@ def create_app() -> FastAPI:
     base_dir = Path(__file__).resolve().parent
     templates_dir = base_dir / "templates"
 
-    app.state.templates = Jinja2Templates(directory=str(templates_dir))
+    templates = Jinja2Templates(directory=str(templates_dir))
+    # Compiled templates stay in the environment's cache (no per-render stat()
+    # unless TEMPLATES_AUTO_RELOAD=1); the bytecode cache (system temp dir) lets
+    # a restarted process skip the parse/compile step.
+    env = templates.env
+    env.auto_reload = settings.TEMPLATES_AUTO_RELOAD
+    env.cache_size = 400
+    env.bytecode_cache = FileSystemBytecodeCache()
+    app.state.templates = templates
 
     app.include_router(pages_router)
     app.include_router(auth_router)
@@ -38,6 +48,9 @@ def create_app() -> FastAPI:
     def _startup() -> None:
         db = get_db()
         init_db(db)
+        # Compile every template now rather than on each page's first request.
+        for name in env.list_templates():
+            env.get_template(name)
 
     return app
 
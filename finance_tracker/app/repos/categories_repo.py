@@ -8,17 +8,26 @@ Step 4 adds:
 - rename_category()
 - delete_category() with "blocked if referenced by any transaction"
 - get_category_by_id_for_user() to enforce ownership
-- category_is_used() helper
 """
 
 from __future__ import annotations
 
+import threading
 from typing import Any
 
-from simpledb import QueryResult
+import anyio
+from cachetools import TTLCache
+from simpledb import CommandOk, QueryResult
 
-from ..db_core import execute
-from ..sql import sql_literal
+from ..db_core import execute_prepared, write_batch
+from ..id_gen import ids
+
+# user_id -> sorted category list. Categories change rarely, and every mutation
+# below invalidates its user's entry.
+_cat_cache: TTLCache = TTLCache(maxsize=5000, ttl=300)
+_cat_cache_lock = threading.Lock()
+# Bumped on every invalidation; a list read before a mutation is not cached after it.
+_cat_cache_gen = 0
 
 
 def _row_to_category(row: list[Any]) -> dict[str, Any]:
@@ -38,17 +47,56 @@ def list_categories_for_user(user_id: int) -> list[dict[str, Any]]:
         user_id: Owner user id.
 
     Returns:
-        List of categories sorted by name (Python-side sorting).
-    """
-    res = execute(
-        "SELECT id, user_id, name FROM categories "
-        f"WHERE user_id = {sql_literal(int(user_id))};"
+        List of categories sorted by name, case-insensitively.
+
+    Notes:
+        Ordered by name_lc (lowercased name, written alongside name), so the
+        sort runs in SimpleDB and "apple" still sorts before "Zoo". The list is
+        cached per user; callers get fresh copies of the cached dicts.
+    """
+    uid = int(user_id)
+    with _cat_cache_lock:
+        cached = _cat_cache.get(uid)
+        gen = _cat_cache_gen
+    if cached is not None:
+        return [dict(c) for c in cached]
+
+    res: QueryResult = execute_prepared(
+        "SELECT id, user_id, name FROM categories WHERE user_id = ? ORDER BY name_lc;", (uid,)
     )
-    assert isinstance(res, QueryResult)
 
     cats = [_row_to_category(r) for r in res.rows]
-    cats.sort(key=lambda c: (c["name"] or "").lower())
-    return cats
+    with _cat_cache_lock:
+        if gen == _cat_cache_gen:
+            _cat_cache[uid] = cats
+    return [dict(c) for c in cats]
+
+
+async def list_categories_for_user_async(user_id: int) -> list[dict[str, Any]]:
+    """
+    list_categories_for_user() for async callers.
+
+    Cache hits are answered inline; only a miss is sent to a worker thread.
+    """
+    uid = int(user_id)
+    with _cat_cache_lock:
+        cached = _cat_cache.get(uid)
+    if cached is not None:
+        return [dict(c) for c in cached]
+    return await anyio.to_thread.run_sync(list_categories_for_user, uid)
+
+
+def _invalidate(user_id: int) -> None:
+    """
+    Drop a user's cached category list. Call after any write to categories.
+
+    Args:
+        user_id: Owner user id.
+    """
+    global _cat_cache_gen
+    with _cat_cache_lock:
+        _cat_cache_gen += 1
+        _cat_cache.pop(int(user_id), None)
 
 
 def get_category_by_id_for_user(category_id: int, user_id: int) -> dict[str, Any] | None:
@@ -62,53 +110,38 @@ def get_category_by_id_for_user(category_id: int, user_id: int) -> dict[str, Any
     Returns:
         Category dict or None.
     """
-    res = execute(
-        "SELECT id, user_id, name FROM categories "
-        f"WHERE id = {sql_literal(int(category_id))} AND user_id = {sql_literal(int(user_id))};"
+    res: QueryResult = execute_prepared(
+        "SELECT id, user_id, name FROM categories WHERE id = ? AND user_id = ?;",
+        (int(category_id), int(user_id)),
     )
-    assert isinstance(res, QueryResult)
     if not res.rows:
         return None
     return _row_to_category(res.rows[0])
 
 
-def get_category_by_name_for_user(name: str, user_id: int) -> dict[str, Any] | None:
+async def get_category_by_id_for_user_async(category_id: int, user_id: int) -> dict[str, Any] | None:
     """
-    Check if a category with the same name exists for a user.
+    get_category_by_id_for_user() for async callers.
 
-    Args:
-        name: Category name.
-        user_id: Owner user id.
-
-    Returns:
-        Category dict or None.
+    Answered from the user's category list, which is cached (and invalidated
+    on every category write), so an ownership check on the transaction write
+    path usually costs no DB round-trip.
     """
-    res = execute(
-        "SELECT id, user_id, name FROM categories "
-        f"WHERE user_id = {sql_literal(int(user_id))} AND name = {sql_literal(name)};"
-    )
-    assert isinstance(res, QueryResult)
-
-    if not res.rows:
-        return None
-    return _row_to_category(res.rows[0])
+    cid = int(category_id)
+    for c in await list_categories_for_user_async(user_id):
+        if c["id"] == cid:
+            return c
+    return None
 
 
 def next_category_id() -> int:
     """
-    Generate next categories.id as max(id)+1.
+    Allocate the next categories.id.
 
     Returns:
         Next integer id.
     """
-    res = execute("SELECT id FROM categories;")
-    assert isinstance(res, QueryResult)
-
-    max_id = 0
-    for row in res.rows:
-        if row and isinstance(row[0], int):
-            max_id = max(max_id, row[0])
-    return max_id + 1
+    return ids.next("categories")
 
 
 def create_category(*, user_id: int, name: str) -> int:
@@ -124,16 +157,24 @@ def create_category(*, user_id: int, name: str) -> int:
 
     Raises:
         ValueError: if name already exists for the user.
-    """
-    existing = get_category_by_name_for_user(name, user_id)
-    if existing is not None:
-        raise ValueError("Category name already exists.")
 
+    Notes:
+        The duplicate check and the INSERT run under one acquisition of the write
+        lock, so two concurrent creates cannot both pass the check.
+    """
     category_id = next_category_id()
-    execute(
-        "INSERT INTO categories (id, user_id, name) VALUES "
-        f"({sql_literal(category_id)}, {sql_literal(int(user_id))}, {sql_literal(name)});"
-    )
+    with write_batch("categories") as run:
+        res: QueryResult = run(
+            "SELECT id FROM categories WHERE user_id = ? AND name = ? LIMIT 1;", (int(user_id), name)
+        )
+        if res.rows:
+            raise ValueError("Category name already exists.")
+
+        run(
+            "INSERT INTO categories (id, user_id, name, name_lc) VALUES (?, ?, ?, ?);",
+            (category_id, int(user_id), name, name.lower()),
+        )
+        _invalidate(user_id)
     return category_id
 
 
@@ -149,35 +190,21 @@ def rename_category(*, category_id: int, user_id: int, new_name: str) -> None:
     Raises:
         ValueError: if not found, or name conflicts with another category.
     """
-    cat = get_category_by_id_for_user(category_id, user_id)
-    if cat is None:
-        raise ValueError("Category not found.")
-
-    conflict = get_category_by_name_for_user(new_name, user_id)
-    if conflict is not None and int(conflict["id"]) != int(category_id):
-        raise ValueError("Another category with that name already exists.")
+    with write_batch("categories") as run:
+        res: QueryResult = run(
+            "SELECT id FROM categories WHERE user_id = ? AND name = ? LIMIT 1;", (int(user_id), new_name)
+        )
+        if res.rows and res.rows[0][0] != int(category_id):
+            raise ValueError("Another category with that name already exists.")
 
-    execute(
-        "UPDATE categories SET name = "
-        f"{sql_literal(new_name)} WHERE id = {sql_literal(int(category_id))};"
-    )
-
-
-def category_is_used(category_id: int) -> bool:
-    """
-    Check whether any transaction references this category.
-
-    Args:
-        category_id: Category id.
-
-    Returns:
-        True if used, otherwise False.
-    """
-    res = execute(
-        f"SELECT id FROM transactions WHERE category_id = {sql_literal(int(category_id))};"
-    )
-    assert isinstance(res, QueryResult)
-    return len(res.rows) > 0
+        # Ownership is in the WHERE clause: nothing updated means not found.
+        done: CommandOk = run(
+            "UPDATE categories SET name = ?, name_lc = ? WHERE id = ? AND user_id = ?;",
+            (new_name, new_name.lower(), int(category_id), int(user_id)),
+        )
+        if done.rows_affected == 0:
+            raise ValueError("Category not found.")
+        _invalidate(user_id)
 
 
 def delete_category(*, category_id: int, user_id: int) -> None:
@@ -191,11 +218,19 @@ def delete_category(*, category_id: int, user_id: int) -> None:
     Raises:
         ValueError: if not found or if category is used by transactions.
     """
-    cat = get_category_by_id_for_user(category_id, user_id)
-    if cat is None:
-        raise ValueError("Category not found.")
-
-    if category_is_used(category_id):
-        raise ValueError("Cannot delete: this category has transactions.")
-
-    execute(f"DELETE FROM categories WHERE id = {sql_literal(int(category_id))};")
\ No newline at end of file
+    with write_batch("categories", "transactions") as run:
+        # Only the owner's transactions can reference the category, so scoping
+        # the check by user_id keeps other users' usage out of the answer.
+        res: QueryResult = run(
+            "SELECT id FROM transactions WHERE category_id = ? AND user_id = ? LIMIT 1;",
+            (int(category_id), int(user_id)),
+        )
+        if res.rows:
+            raise ValueError("Cannot delete: this category has transactions.")
+
+        done: CommandOk = run(
+            "DELETE FROM categories WHERE id = ? AND user_id = ?;", (int(category_id), int(user_id))
+        )
+        if done.rows_affected == 0:
+            raise ValueError("Category not found.")
+        _invalidate(user_id)
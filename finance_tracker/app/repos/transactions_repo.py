@@ -10,27 +10,26 @@ Step 7 adds:
 
 Notes:
 - Ownership enforced by WHERE user_id = current_user
+- The *_async() variants run the same functions in a worker thread, for
+  `async def` routes (SimpleDB calls block).
 - Amount stored as integer cents; date stored as 'YYYY-MM-DD'; ym is 'YYYY-MM'
 """
 
 from __future__ import annotations
 
+from functools import partial
 from typing import Any
 
-from simpledb import QueryResult
+import anyio
+from simpledb import CommandOk, QueryResult
 
-from ..db_core import execute
-from ..sql import sql_literal
+from ..db_core import execute_prepared
+from ..id_gen import ids
+from .categories_repo import list_categories_for_user
 
 
 def next_transaction_id() -> int:
-    res = execute("SELECT id FROM transactions;")
-    assert isinstance(res, QueryResult)
-    max_id = 0
-    for row in res.rows:
-        if row and isinstance(row[0], int):
-            max_id = max(max_id, row[0])
-    return max_id + 1
+    return ids.next("transactions")
 
 
 def create_transaction(
@@ -44,53 +43,149 @@ def create_transaction(
     ym: str,
 ) -> int:
     tx_id = next_transaction_id()
-    execute(
-        "INSERT INTO transactions (id, user_id, category_id, amount_cents, type, description, date, ym) VALUES "
-        f"({sql_literal(tx_id)}, {sql_literal(int(user_id))}, {sql_literal(int(category_id))}, "
-        f"{sql_literal(int(amount_cents))}, {sql_literal(tx_type)}, {sql_literal(description)}, "
-        f"{sql_literal(date)}, {sql_literal(ym)});"
+    execute_prepared(
+        "INSERT INTO transactions (id, user_id, category_id, amount_cents, type, description, date, ym) "
+        "VALUES (?, ?, ?, ?, ?, ?, ?, ?);",
+        (tx_id, int(user_id), int(category_id), int(amount_cents), tx_type, description, date, ym),
     )
     return tx_id
 
 
+# Single-table listing; category names are attached from one category-map
+# lookup per call (see _attach_category_names) instead of a per-row JOIN probe.
+_LIST_TX_SQL = (
+    "SELECT id, date, ym, type, amount_cents, description, category_id "
+    "FROM transactions "
+    "WHERE {where} "
+    "ORDER BY date DESC, id DESC{limit};"
+)
+_LIST_TX_ALL_SQL = _LIST_TX_SQL.format(where="user_id = ?", limit="")
+_LIST_TX_MONTH_SQL = _LIST_TX_SQL.format(where="user_id = ? AND ym = ?", limit="")
+_LIST_TX_RECENT_SQL = _LIST_TX_SQL.format(where="user_id = ?", limit=" LIMIT ?")
+
+
+def _attach_category_names(user_id: int, rows: list[list[Any]]) -> list[dict[str, Any]]:
+    """
+    Convert _LIST_TX_SQL rows to transaction dicts with category_name.
+
+    Args:
+        user_id: Owner user id (categories are per user).
+        rows: Rows in _LIST_TX_SQL column order.
+
+    Returns:
+        Transaction dicts.
+
+    Notes:
+        Names come from list_categories_for_user(): one query for all rows,
+        and usually none at all because that list is cached.
+    """
+    if not rows:
+        return []
+    names = {c["id"]: c["name"] for c in list_categories_for_user(user_id)}
+    return [
+        {
+            "id": r[0],
+            "date": r[1],
+            "ym": r[2],
+            "type": r[3],
+            "amount_cents": r[4],
+            "description": r[5],
+            "category_id": r[6],
+            "category_name": names.get(r[6]),
+        }
+        for r in rows
+    ]
+
+
 def list_transactions_for_user(user_id: int, ym: str | None = None) -> list[dict[str, Any]]:
+    res: QueryResult
     if ym is None or ym.strip() == "":
-        where = f"WHERE transactions.user_id = {sql_literal(int(user_id))}"
+        res = execute_prepared(_LIST_TX_ALL_SQL, (int(user_id),))
     else:
-        where = (
-            f"WHERE transactions.user_id = {sql_literal(int(user_id))} "
-            f"AND transactions.ym = {sql_literal(ym)}"
-        )
+        res = execute_prepared(_LIST_TX_MONTH_SQL, (int(user_id), ym))
+    return _attach_category_names(user_id, res.rows)
 
-    sql = (
-        "SELECT transactions.id, transactions.date, transactions.ym, transactions.type, "
-        "transactions.amount_cents, transactions.description, "
-        "transactions.category_id, categories.name "
-        "FROM transactions "
-        "JOIN categories ON transactions.category_id = categories.id "
-        f"{where};"
-    )
 
-    res = execute(sql)
-    assert isinstance(res, QueryResult)
-
-    out: list[dict[str, Any]] = []
-    for r in res.rows:
-        out.append(
-            {
-                "id": r[0],
-                "date": r[1],
-                "ym": r[2],
-                "type": r[3],
-                "amount_cents": r[4],
-                "description": r[5],
-                "category_id": r[6],
-                "category_name": r[7],
-            }
+def list_recent_transactions_for_user(user_id: int, limit: int = 10) -> list[dict[str, Any]]:
+    """
+    Newest transactions for a user (date DESC, id DESC), at most `limit` rows.
+
+    Args:
+        user_id: Owner user id.
+        limit: Maximum number of rows.
+
+    Returns:
+        Transaction dicts, same shape as list_transactions_for_user().
+    """
+    res: QueryResult = execute_prepared(_LIST_TX_RECENT_SQL, (int(user_id), int(limit)))
+    return _attach_category_names(user_id, res.rows)
+
+
+def aggregate_totals_for_user(user_id: int, ym: str | None = None) -> dict[str, int]:
+    """
+    Sum a user's income and expense amounts, optionally for one month.
+
+    Args:
+        user_id: Owner user id.
+        ym: Optional 'YYYY-MM' filter.
+
+    Returns:
+        {"income": cents, "expense": cents}
+
+    Notes:
+        SimpleDB has no SUM/GROUP BY: this is one scan of a two-column
+        projection, accumulated into two scalars (no per-row dicts).
+    """
+    res: QueryResult
+    if ym is None:
+        res = execute_prepared("SELECT type, amount_cents FROM transactions WHERE user_id = ?;", (int(user_id),))
+    else:
+        res = execute_prepared(
+            "SELECT type, amount_cents FROM transactions WHERE user_id = ? AND ym = ?;",
+            (int(user_id), ym),
         )
 
-    out.sort(key=lambda x: (x["date"] or "", x["id"] or 0), reverse=True)
-    return out
+    income = 0
+    expense = 0
+    for typ, amt in res.rows:
+        if typ == "income":
+            income += amt
+        else:
+            expense += amt
+    return {"income": income, "expense": expense}
+
+
+def aggregate_month_for_user(user_id: int, ym: str) -> dict[str, Any]:
+    """
+    Sum a user's income/expense for one month, plus expenses per category.
+
+    Args:
+        user_id: Owner user id.
+        ym: 'YYYY-MM' month.
+
+    Returns:
+        {"income": cents, "expense": cents, "by_category": {category_id: expense cents}}
+
+    Notes:
+        One scan (via idx_tx_user_ym) of a three-column projection feeds all
+        three results; per-scan cost in SimpleDB dwarfs this loop.
+    """
+    res: QueryResult = execute_prepared(
+        "SELECT type, amount_cents, category_id FROM transactions WHERE user_id = ? AND ym = ?;",
+        (int(user_id), ym),
+    )
+
+    income = 0
+    expense = 0
+    by_category: dict[int, int] = {}
+    get = by_category.get
+    for typ, amt, cid in res.rows:
+        if typ == "income":
+            income += amt
+        else:
+            expense += amt
+            by_category[cid] = get(cid, 0) + amt
+    return {"income": income, "expense": expense, "by_category": by_category}
 
 
 def get_transaction_by_id_for_user(tx_id: int, user_id: int) -> dict[str, Any] | None:
@@ -104,12 +199,11 @@ def get_transaction_by_id_for_user(tx_id: int, user_id: int) -> dict[str, Any] |
     Returns:
         Transaction dict or None.
     """
-    res = execute(
+    res: QueryResult = execute_prepared(
         "SELECT id, user_id, category_id, amount_cents, type, description, date, ym "
-        "FROM transactions "
-        f"WHERE id = {sql_literal(int(tx_id))} AND user_id = {sql_literal(int(user_id))};"
+        "FROM transactions WHERE id = ? AND user_id = ?;",
+        (int(tx_id), int(user_id)),
     )
-    assert isinstance(res, QueryResult)
     if not res.rows:
         return None
 
@@ -152,21 +246,18 @@ def update_transaction_for_user(
 
     Raises:
         ValueError if transaction not found.
-    """
-    existing = get_transaction_by_id_for_user(tx_id, user_id)
-    if existing is None:
-        raise ValueError("Transaction not found.")
 
-    execute(
-        "UPDATE transactions SET "
-        f"category_id = {sql_literal(int(category_id))}, "
-        f"amount_cents = {sql_literal(int(amount_cents))}, "
-        f"type = {sql_literal(tx_type)}, "
-        f"description = {sql_literal(description)}, "
-        f"date = {sql_literal(date)}, "
-        f"ym = {sql_literal(ym)} "
-        f"WHERE id = {sql_literal(int(tx_id))};"
+    Notes:
+        Ownership is part of the WHERE clause; a missing or foreign id shows up
+        as rows_affected == 0, so there is no separate lookup round-trip.
+    """
+    res: CommandOk = execute_prepared(
+        "UPDATE transactions SET category_id = ?, amount_cents = ?, type = ?, description = ?, "
+        "date = ?, ym = ? WHERE id = ? AND user_id = ?;",
+        (int(category_id), int(amount_cents), tx_type, description, date, ym, int(tx_id), int(user_id)),
     )
+    if res.rows_affected == 0:
+        raise ValueError("Transaction not found.")
 
 
 def delete_transaction_for_user(*, tx_id: int, user_id: int) -> None:
@@ -180,8 +271,75 @@ def delete_transaction_for_user(*, tx_id: int, user_id: int) -> None:
     Raises:
         ValueError if not found.
     """
-    existing = get_transaction_by_id_for_user(tx_id, user_id)
-    if existing is None:
+    res: CommandOk = execute_prepared(
+        "DELETE FROM transactions WHERE id = ? AND user_id = ?;", (int(tx_id), int(user_id))
+    )
+    if res.rows_affected == 0:
         raise ValueError("Transaction not found.")
 
-    execute(f"DELETE FROM transactions WHERE id = {sql_literal(int(tx_id))};")
\ No newline at end of file
+
+async def create_transaction_async(
+    *,
+    user_id: int,
+    category_id: int,
+    amount_cents: int,
+    tx_type: str,
+    description: str | None,
+    date: str,
+    ym: str,
+) -> int:
+    """create_transaction() for async callers (runs in a worker thread)."""
+    return await anyio.to_thread.run_sync(
+        partial(
+            create_transaction,
+            user_id=user_id,
+            category_id=category_id,
+            amount_cents=amount_cents,
+            tx_type=tx_type,
+            description=description,
+            date=date,
+            ym=ym,
+        )
+    )
+
+
+async def list_transactions_for_user_async(user_id: int, ym: str | None = None) -> list[dict[str, Any]]:
+    """list_transactions_for_user() for async callers (runs in a worker thread)."""
+    return await anyio.to_thread.run_sync(list_transactions_for_user, user_id, ym)
+
+
+async def get_transaction_by_id_for_user_async(tx_id: int, user_id: int) -> dict[str, Any] | None:
+    """get_transaction_by_id_for_user() for async callers (runs in a worker thread)."""
+    return await anyio.to_thread.run_sync(get_transaction_by_id_for_user, tx_id, user_id)
+
+
+async def update_transaction_for_user_async(
+    *,
+    tx_id: int,
+    user_id: int,
+    category_id: int,
+    amount_cents: int,
+    tx_type: str,
+    description: str | None,
+    date: str,
+    ym: str,
+) -> None:
+    """update_transaction_for_user() for async callers (runs in a worker thread)."""
+    await anyio.to_thread.run_sync(
+        partial(
+            update_transaction_for_user,
+            tx_id=tx_id,
+            user_id=user_id,
+            category_id=category_id,
+            amount_cents=amount_cents,
+            tx_type=tx_type,
+            description=description,
+            date=date,
+            ym=ym,
+        )
+    )
+
+
+async def delete_transaction_for_user_async(*, tx_id: int, user_id: int) -> None:
+    """delete_transaction_for_user() for async callers (runs in a worker thread)."""
+    await anyio.to_thread.run_sync(partial(delete_transaction_for_user, tx_id=tx_id, user_id=user_id))
@@ -9,18 +9,28 @@ Step 2 responsibilities:
 - Generate new user ids (SimpleDB doesn't auto-increment)
 
 Implementation notes:
-- Because our DB access is serialized by a global lock, max(id)+1 is safe enough
-  for this demo app.
+- Ids come from the process-local allocator in app/id_gen.py (seeded once at
+  startup) instead of a max(id)+1 scan per insert.
+- get_user_by_id() runs on every authenticated request, so its results are kept
+  in a small TTL cache. Anything that updates or deletes a user row must call
+  _invalidate(user_id).
 """
 
 from __future__ import annotations
 
+import threading
 from typing import Any
 
+import anyio
+from cachetools import TTLCache
 from simpledb import QueryResult
 
-from ..db_core import execute
-from ..sql import sql_literal
+from ..db_core import execute_prepared
+from ..id_gen import ids
+
+# user_id -> user dict; user rows change rarely, so a short TTL is plenty.
+_user_cache: TTLCache = TTLCache(maxsize=5000, ttl=30)
+_user_cache_lock = threading.Lock()
 
 
 def _row_to_user(row: list[Any]) -> dict[str, Any]:
@@ -47,11 +57,10 @@ def get_user_by_email(email: str) -> dict[str, Any] | None:
     Returns:
         User dict or None.
     """
-    res = execute(
-        "SELECT id, username, email, password_hash FROM users "
-        f"WHERE email = {sql_literal(email)};"
+    res: QueryResult = execute_prepared(
+        "SELECT id, username, email, password_hash FROM users WHERE email = ?;",
+        (email,),
     )
-    assert isinstance(res, QueryResult)
     if not res.rows:
         return None
     return _row_to_user(res.rows[0])
@@ -67,11 +76,10 @@ def get_user_by_username(username: str) -> dict[str, Any] | None:
     Returns:
         User dict or None.
     """
-    res = execute(
-        "SELECT id, username, email, password_hash FROM users "
-        f"WHERE username = {sql_literal(username)};"
+    res: QueryResult = execute_prepared(
+        "SELECT id, username, email, password_hash FROM users WHERE username = ?;",
+        (username,),
     )
-    assert isinstance(res, QueryResult)
     if not res.rows:
         return None
     return _row_to_user(res.rows[0])
@@ -86,31 +94,72 @@ def get_user_by_id(user_id: int) -> dict[str, Any] | None:
 
     Returns:
         User dict or None.
+
+    Notes:
+        Served from the TTL cache when possible (no DB access, no DB lock).
     """
-    res = execute(
-        "SELECT id, username, email, password_hash FROM users "
-        f"WHERE id = {sql_literal(int(user_id))};"
+    user_id = int(user_id)
+    with _user_cache_lock:
+        user = _user_cache.get(user_id)
+    if user is not None:
+        return dict(user)
+
+    res: QueryResult = execute_prepared(
+        "SELECT id, username, email, password_hash FROM users WHERE id = ?;",
+        (user_id,),
     )
-    assert isinstance(res, QueryResult)
     if not res.rows:
         return None
-    return _row_to_user(res.rows[0])
+
+    user = _row_to_user(res.rows[0])
+    with _user_cache_lock:
+        _user_cache[user_id] = user
+    return dict(user)
+
+
+def _invalidate(user_id: int) -> None:
+    """
+    Drop a cached user row. Call after any UPDATE/DELETE on users.
+
+    Args:
+        user_id: Integer user id.
+    """
+    with _user_cache_lock:
+        _user_cache.pop(int(user_id), None)
+
+
+async def get_user_by_email_async(email: str) -> dict[str, Any] | None:
+    """get_user_by_email() for async callers (runs in a worker thread)."""
+    return await anyio.to_thread.run_sync(get_user_by_email, email)
+
+
+async def get_user_by_username_async(username: str) -> dict[str, Any] | None:
+    """get_user_by_username() for async callers (runs in a worker thread)."""
+    return await anyio.to_thread.run_sync(get_user_by_username, username)
+
+
+async def get_user_by_id_async(user_id: int) -> dict[str, Any] | None:
+    """
+    get_user_by_id() for async callers.
+
+    Cache hits are answered inline; only a miss is sent to a worker thread.
+    """
+    user_id = int(user_id)
+    with _user_cache_lock:
+        user = _user_cache.get(user_id)
+    if user is not None:
+        return dict(user)
+    return await anyio.to_thread.run_sync(get_user_by_id, user_id)
 
 
 def next_user_id() -> int:
     """
-    Compute next user id as max(id)+1.
+    Allocate the next user id.
 
     Returns:
         Next id.
     """
-    res = execute("SELECT id FROM users;")
-    assert isinstance(res, QueryResult)
-    max_id = 0
-    for row in res.rows:
-        if row and isinstance(row[0], int):
-            max_id = max(max_id, row[0])
-    return max_id + 1
+    return ids.next("users")
 
 
 def create_user(*, username: str, email: str, password_hash: str) -> int:
@@ -126,8 +175,22 @@ def create_user(*, username: str, email: str, password_hash: str) -> int:
         New user id.
     """
     user_id = next_user_id()
-    execute(
-        "INSERT INTO users (id, username, email, password_hash) VALUES "
-        f"({sql_literal(user_id)}, {sql_literal(username)}, {sql_literal(email)}, {sql_literal(password_hash)});"
+    execute_prepared(
+        "INSERT INTO users (id, username, email, password_hash) VALUES (?, ?, ?, ?);",
+        (user_id, username, email, password_hash),
+    )
+    return user_id
+
+
+def update_password_hash(user_id: int, password_hash: str) -> None:
+    """
+    Replace a user's stored password hash (e.g. re-hash on login).
+
+    Args:
+        user_id: User id.
+        password_hash: New hashed password.
+    """
+    execute_prepared(
+        "UPDATE users SET password_hash = ? WHERE id = ?;", (password_hash, int(user_id))
     )
-    return user_id
\ No newline at end of file
+    _invalidate(user_id)
@@ -18,7 +18,7 @@ router = APIRouter()
 
 def _render_categories(request: Request, user: dict, error: str | None):
     templates = request.app.state.templates
-    categories = list_categories_for_user(int(user["id"]))
+    categories = list_categories_for_user(user["id"])
     return templates.TemplateResponse(
         "categories.html",
         {"request": request, "user": user, "categories": categories, "error": error},
@@ -44,7 +44,7 @@ def categories_create(request: Request, name: str = Form(...)):
         return _render_categories(request, user, error="Category name cannot be empty.")  # type: ignore[arg-type]
 
     try:
-        create_category(user_id=int(user["id"]), name=name)  # type: ignore[index]
+        create_category(user_id=user["id"], name=name)  # type: ignore[index]
     except ValueError as e:
         return _render_categories(request, user, error=str(e))  # type: ignore[arg-type]
 
@@ -62,7 +62,7 @@ def categories_rename(request: Request, category_id: int, new_name: str = Form(.
         return _render_categories(request, user, error="New category name cannot be empty.")  # type: ignore[arg-type]
 
     try:
-        rename_category(category_id=int(category_id), user_id=int(user["id"]), new_name=new_name)  # type: ignore[index]
+        rename_category(category_id=category_id, user_id=user["id"], new_name=new_name)  # type: ignore[index]
     except ValueError as e:
         return _render_categories(request, user, error=str(e))  # type: ignore[arg-type]
 
@@ -76,7 +76,7 @@ def categories_delete(request: Request, category_id: int):
         return redirect
 
     try:
-        delete_category(category_id=int(category_id), user_id=int(user["id"]))  # type: ignore[index]
+        delete_category(category_id=category_id, user_id=user["id"])  # type: ignore[index]
     except ValueError as e:
         return _render_categories(request, user, error=str(e))  # type: ignore[arg-type]
 
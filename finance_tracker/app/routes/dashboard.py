@@ -23,29 +23,41 @@ def dashboard(request: Request):
     if redirect:
         return redirect
 
-    data = compute_dashboard(int(user["id"]))  # type: ignore[index]
+    data = compute_dashboard(user["id"])  # type: ignore[index]
 
-    spending_rows = [{"category_name": row["category_name"], "expense_cents": int(row["expense_cents"])} for row in data.spending_by_category]
-    chart_labels = [r["category_name"] for r in spending_rows]
-    chart_values = [round(r["expense_cents"] / 100.0, 2) for r in spending_rows]
+    # One pass per list; format_cents bound locally (called once per row).
+    # Amounts are already ints (INTEGER columns / computed sums): no casts.
+    _fmt = format_cents
+
+    spending: list[dict[str, str]] = []
+    chart_labels: list[str] = []
+    chart_values: list[float] = []
+    for row in data.spending_by_category:
+        name = row["category_name"]
+        cents = row["expense_cents"]
+        spending.append({"category_name": name, "expense": _fmt(cents)})
+        chart_labels.append(name)
+        chart_values.append(round(cents / 100.0, 2))
+
+    # The template takes |length of both lists, so they stay lists. The recent
+    # rows are fresh dicts from the repo: annotate them in place, no copies.
+    recent = data.recent_transactions
+    for t in recent:
+        sign = -1 if t["type"] == "expense" else 1
+        t["amount_display"] = _fmt(sign * t["amount_cents"])
 
     ctx = {
         "request": request,
         "user": user,
         "ym": data.ym,
-        "balance": format_cents(data.balance_cents),
-        "month_income": format_cents(data.month_income_cents),
-        "month_expense": format_cents(data.month_expense_cents),
-        "spending_by_category": [{"category_name": r["category_name"], "expense": format_cents(r["expense_cents"])} for r in spending_rows],
-        "recent_transactions": [
-            {
-                **t,
-                "amount_display": format_cents(-int(t["amount_cents"]) if t["type"] == "expense" else int(t["amount_cents"])),
-            }
-            for t in data.recent_transactions
-        ],
-        "chart_labels_json": json.dumps(chart_labels),
-        "chart_values_json": json.dumps(chart_values),
+        "balance": _fmt(data.balance_cents),
+        "month_income": _fmt(data.month_income_cents),
+        "month_expense": _fmt(data.month_expense_cents),
+        "spending_by_category": spending,
+        "recent_transactions": recent,
+        # Compact separators: the JSON is inlined into the page's <script>.
+        "chart_labels_json": json.dumps(chart_labels, separators=(",", ":")),
+        "chart_values_json": json.dumps(chart_values, separators=(",", ":")),
     }
 
     templates = request.app.state.templates
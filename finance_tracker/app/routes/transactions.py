@@ -4,98 +4,148 @@ app/routes/transactions.py
 Step 10 update:
 - Use require_user() helper for cleaner protected routes.
 - No functional changes beyond refactor for maintainability.
+
+Handlers are `async def`: they run on the event loop instead of each taking a
+threadpool slot for the whole request. DB work goes through the *_async repo
+helpers (worker thread per call; cache hits stay inline).
 """
 
 from __future__ import annotations
 
-from datetime import datetime
+import re
 
 from fastapi import APIRouter, Form, Request
 from fastapi.responses import RedirectResponse
 
-from ..deps import require_user
-from ..repos.categories_repo import get_category_by_id_for_user, list_categories_for_user
+from ..deps import require_user_async
+from ..repos.categories_repo import get_category_by_id_for_user_async, list_categories_for_user_async
 from ..repos.transactions_repo import (
-    create_transaction,
-    delete_transaction_for_user,
-    get_transaction_by_id_for_user,
-    list_transactions_for_user,
-    update_transaction_for_user,
+    create_transaction_async,
+    delete_transaction_for_user_async,
+    get_transaction_by_id_for_user_async,
+    list_transactions_for_user_async,
+    update_transaction_for_user_async,
 )
 
 router = APIRouter()
 
 
+# Whole part (may be empty, as in ".5") and optional fraction. ASCII digits
+# only: str.isdigit() also accepted characters int() cannot parse.
+_AMOUNT_RE = re.compile(r"([0-9]*)(?:\.([0-9]+))?")
+
+
 def _parse_amount_to_cents(amount_str: str) -> int:
     s = amount_str.strip()
     if not s:
         raise ValueError("Amount is required.")
-    if "." in s:
-        left, right = s.split(".", 1)
-        if not left:
-            left = "0"
-        if not (left.isdigit() and right.isdigit()):
-            raise ValueError("Amount must be a number.")
-        if len(right) > 2:
-            raise ValueError("Amount can have at most 2 decimal places.")
-        right = right.ljust(2, "0")
-        cents = int(left) * 100 + int(right[:2])
+    m = _AMOUNT_RE.fullmatch(s)
+    if m is None:
+        raise ValueError("Amount must be a number.")
+    whole, frac = m.groups()
+    if frac is None:
+        cents = int(whole) * 100
     else:
-        if not s.isdigit():
-            raise ValueError("Amount must be a number.")
-        cents = int(s) * 100
+        if len(frac) > 2:
+            raise ValueError("Amount can have at most 2 decimal places.")
+        cents = int(whole or "0") * 100 + int(frac.ljust(2, "0"))
     if cents <= 0:
         raise ValueError("Amount must be greater than 0.")
     return cents
 
 
-def _validate_date(date_str: str) -> tuple[str, str]:
-    s = date_str.strip()
-    try:
-        dt = datetime.strptime(s, "%Y-%m-%d")
-    except ValueError:
+_DAYS_IN_MONTH = (0, 31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+
+
+def _parse_date(s: str) -> tuple[str, str]:
+    """
+    Validate a strict 'YYYY-MM-DD' date without building a datetime.
+
+    Returns:
+        (date, ym) where ym is the 'YYYY-MM' prefix.
+
+    Raises:
+        ValueError if the string is not a real calendar date in that format.
+    """
+    # isascii() + isdigit(): int() would also take signs, spaces and non-ASCII digits.
+    if (
+        len(s) != 10
+        or s[4] != "-"
+        or s[7] != "-"
+        or not s.isascii()
+        or not (s[:4] + s[5:7] + s[8:]).isdigit()
+    ):
         raise ValueError("Date must be in YYYY-MM-DD format.")
-    return s, dt.strftime("%Y-%m")
+    y, m, d = int(s[:4]), int(s[5:7]), int(s[8:])
+    if not 1 <= m <= 12 or y < 1:
+        raise ValueError("Date must be in YYYY-MM-DD format.")
+    leap = m == 2 and y % 4 == 0 and (y % 100 != 0 or y % 400 == 0)
+    if not 1 <= d <= _DAYS_IN_MONTH[m] + leap:
+        raise ValueError("Date must be in YYYY-MM-DD format.")
+    return s, s[:7]
+
+
+def _validate_date(date_str: str) -> tuple[str, str]:
+    return _parse_date(date_str.strip())
+
+
+# Display prefix per transaction type. Stored amounts are always positive
+# (_parse_amount_to_cents rejects <= 0), so the sign comes from the type alone.
+_SIGN_PREFIX = {"expense": "-", "income": ""}
+
 
+async def _render_new(request: Request, user: dict, error: str | None):
+    """Render the new-transaction form; categories are only fetched when rendering."""
+    templates = request.app.state.templates
+    categories = await list_categories_for_user_async(user["id"])
+    return templates.TemplateResponse(
+        "transaction_new.html",
+        {"request": request, "user": user, "categories": categories, "error": error},
+    )
 
-def _format_cents(cents: int) -> str:
-    sign = "-" if cents < 0 else ""
-    cents = abs(int(cents))
-    return f"{sign}{cents // 100}.{cents % 100:02d}"
+
+async def _render_edit(request: Request, user: dict, tx: dict, amount_str: str, error: str | None):
+    """Render the edit form; categories are only fetched when rendering."""
+    templates = request.app.state.templates
+    categories = await list_categories_for_user_async(user["id"])
+    return templates.TemplateResponse(
+        "transaction_edit.html",
+        {"request": request, "user": user, "tx": tx, "categories": categories, "amount_str": amount_str, "error": error},
+    )
 
 
 @router.get("/transactions")
-def transactions_list(request: Request):
-    user, redirect = require_user(request)
+async def transactions_list(request: Request):
+    user, redirect = await require_user_async(request)
     if redirect:
         return redirect
 
     ym = request.query_params.get("ym")
-    txs = list_transactions_for_user(int(user["id"]), ym=ym)  # type: ignore[index]
+    txs = await list_transactions_for_user_async(user["id"], ym=ym)  # type: ignore[index]
 
+    # SimpleDB has no printf/CASE, so format here: table lookup instead of a
+    # branch, inline f-string instead of a call. The template takes |length, so
+    # txs stays a list; its dicts are fresh per request and annotated in place.
+    prefix = _SIGN_PREFIX
     for t in txs:
-        amt = int(t["amount_cents"])
-        if t["type"] == "expense":
-            amt = -amt
-        t["amount_display"] = _format_cents(amt)
+        c = t["amount_cents"]
+        t["amount_display"] = f"{prefix[t['type']]}{c // 100}.{c % 100:02d}"
 
     templates = request.app.state.templates
     return templates.TemplateResponse("transactions.html", {"request": request, "user": user, "transactions": txs, "ym": ym or ""})
 
 
 @router.get("/transactions/new")
-def transaction_new_form(request: Request):
-    user, redirect = require_user(request)
+async def transaction_new_form(request: Request):
+    user, redirect = await require_user_async(request)
     if redirect:
         return redirect
 
-    categories = list_categories_for_user(int(user["id"]))  # type: ignore[index]
-    templates = request.app.state.templates
-    return templates.TemplateResponse("transaction_new.html", {"request": request, "user": user, "categories": categories, "error": None})
+    return await _render_new(request, user, error=None)  # type: ignore[arg-type]
 
 
 @router.post("/transactions/new")
-def transaction_new_submit(
+async def transaction_new_submit(
     request: Request,
     amount: str = Form(...),
     tx_type: str = Form(...),
@@ -103,32 +153,31 @@ def transaction_new_submit(
     date: str = Form(...),
     description: str = Form(""),
 ):
-    user, redirect = require_user(request)
+    user, redirect = await require_user_async(request)
     if redirect:
         return redirect
 
-    templates = request.app.state.templates
-    categories = list_categories_for_user(int(user["id"]))  # type: ignore[index]
-
+    # Categories are only needed to re-render the form on an error, so they
+    # are fetched there (_render_new) rather than up front.
     tx_type = tx_type.strip().lower()
     if tx_type not in ("income", "expense"):
-        return templates.TemplateResponse("transaction_new.html", {"request": request, "user": user, "categories": categories, "error": "Type must be 'income' or 'expense'."})
+        return await _render_new(request, user, error="Type must be 'income' or 'expense'.")  # type: ignore[arg-type]
 
-    cat = get_category_by_id_for_user(int(category_id), int(user["id"]))  # type: ignore[index]
+    cat = await get_category_by_id_for_user_async(category_id, user["id"])  # type: ignore[index]
     if cat is None:
-        return templates.TemplateResponse("transaction_new.html", {"request": request, "user": user, "categories": categories, "error": "Invalid category selection."})
+        return await _render_new(request, user, error="Invalid category selection.")  # type: ignore[arg-type]
 
     try:
         amount_cents = _parse_amount_to_cents(amount)
         date_iso, ym = _validate_date(date)
     except ValueError as e:
-        return templates.TemplateResponse("transaction_new.html", {"request": request, "user": user, "categories": categories, "error": str(e)})
+        return await _render_new(request, user, error=str(e))  # type: ignore[arg-type]
 
     desc = description.strip() or None
 
-    create_transaction(
-        user_id=int(user["id"]),  # type: ignore[index]
-        category_id=int(category_id),
+    await create_transaction_async(
+        user_id=user["id"],  # type: ignore[index]
+        category_id=category_id,
         amount_cents=amount_cents,
         tx_type=tx_type,
         description=desc,
@@ -139,25 +188,22 @@ def transaction_new_submit(
 
 
 @router.get("/transactions/{tx_id}/edit")
-def transaction_edit_form(request: Request, tx_id: int):
-    user, redirect = require_user(request)
+async def transaction_edit_form(request: Request, tx_id: int):
+    user, redirect = await require_user_async(request)
     if redirect:
         return redirect
 
-    tx = get_transaction_by_id_for_user(int(tx_id), int(user["id"]))  # type: ignore[index]
+    tx = await get_transaction_by_id_for_user_async(tx_id, user["id"])  # type: ignore[index]
     if tx is None:
         return RedirectResponse(url="/transactions", status_code=303)
 
-    categories = list_categories_for_user(int(user["id"]))  # type: ignore[index]
-    amount_cents = int(tx["amount_cents"])
+    amount_cents = tx["amount_cents"]
     amount_str = f"{amount_cents // 100}.{amount_cents % 100:02d}"
-
-    templates = request.app.state.templates
-    return templates.TemplateResponse("transaction_edit.html", {"request": request, "user": user, "tx": tx, "categories": categories, "amount_str": amount_str, "error": None})
+    return await _render_edit(request, user, tx, amount_str, error=None)  # type: ignore[arg-type]
 
 
 @router.post("/transactions/{tx_id}/edit")
-def transaction_edit_submit(
+async def transaction_edit_submit(
     request: Request,
     tx_id: int,
     amount: str = Form(...),
@@ -166,38 +212,35 @@ def transaction_edit_submit(
     date: str = Form(...),
     description: str = Form(""),
 ):
-    user, redirect = require_user(request)
+    user, redirect = await require_user_async(request)
     if redirect:
         return redirect
 
-    templates = request.app.state.templates
-    categories = list_categories_for_user(int(user["id"]))  # type: ignore[index]
-
-    tx = get_transaction_by_id_for_user(int(tx_id), int(user["id"]))  # type: ignore[index]
+    tx = await get_transaction_by_id_for_user_async(tx_id, user["id"])  # type: ignore[index]
     if tx is None:
         return RedirectResponse(url="/transactions", status_code=303)
 
     tx_type = tx_type.strip().lower()
     if tx_type not in ("income", "expense"):
-        return templates.TemplateResponse("transaction_edit.html", {"request": request, "user": user, "tx": tx, "categories": categories, "amount_str": amount, "error": "Invalid type."})
+        return await _render_edit(request, user, tx, amount, error="Invalid type.")  # type: ignore[arg-type]
 
-    cat = get_category_by_id_for_user(int(category_id), int(user["id"]))  # type: ignore[index]
+    cat = await get_category_by_id_for_user_async(category_id, user["id"])  # type: ignore[index]
     if cat is None:
-        return templates.TemplateResponse("transaction_edit.html", {"request": request, "user": user, "tx": tx, "categories": categories, "amount_str": amount, "error": "Invalid category."})
+        return await _render_edit(request, user, tx, amount, error="Invalid category.")  # type: ignore[arg-type]
 
     try:
         amount_cents = _parse_amount_to_cents(amount)
         date_iso, ym = _validate_date(date)
     except ValueError as e:
-        return templates.TemplateResponse("transaction_edit.html", {"request": request, "user": user, "tx": tx, "categories": categories, "amount_str": amount, "error": str(e)})
+        return await _render_edit(request, user, tx, amount, error=str(e))  # type: ignore[arg-type]
 
     desc = description.strip() or None
 
     try:
-        update_transaction_for_user(
-            tx_id=int(tx_id),
-            user_id=int(user["id"]),  # type: ignore[index]
-            category_id=int(category_id),
+        await update_transaction_for_user_async(
+            tx_id=tx_id,
+            user_id=user["id"],  # type: ignore[index]
+            category_id=category_id,
             amount_cents=amount_cents,
             tx_type=tx_type,
             description=desc,
@@ -205,19 +248,19 @@ def transaction_edit_submit(
             ym=ym,
         )
     except ValueError as e:
-        return templates.TemplateResponse("transaction_edit.html", {"request": request, "user": user, "tx": tx, "categories": categories, "amount_str": amount, "error": str(e)})
+        return await _render_edit(request, user, tx, amount, error=str(e))  # type: ignore[arg-type]
 
     return RedirectResponse(url="/transactions", status_code=303)
 
 
 @router.post("/transactions/{tx_id}/delete")
-def transaction_delete(request: Request, tx_id: int):
-    user, redirect = require_user(request)
+async def transaction_delete(request: Request, tx_id: int):
+    user, redirect = await require_user_async(request)
     if redirect:
         return redirect
 
     try:
-        delete_transaction_for_user(tx_id=int(tx_id), user_id=int(user["id"]))  # type: ignore[index]
+        await delete_transaction_for_user_async(tx_id=tx_id, user_id=user["id"])  # type: ignore[index]
     except ValueError:
         pass
 
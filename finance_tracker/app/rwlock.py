@@ -0,0 +1,79 @@
+"""
+app/rwlock.py
+
+A small reader/writer lock.
+
+Many readers may hold the lock at once; a writer holds it alone. Waiting writers
+block new readers, so a steady stream of SELECTs cannot starve an INSERT.
+
+Implementation notes:
+- Not reentrant: a thread holding the lock (in either mode) must not acquire it
+  again, or it can deadlock against a waiting writer.
+"""
+
+from __future__ import annotations
+
+import threading
+from contextlib import contextmanager
+from typing import Iterator
+
+
+class RWLock:
+    """
+    Writer-preferring reader/writer lock.
+    """
+
+    def __init__(self) -> None:
+        self._cond = threading.Condition(threading.Lock())
+        self._readers = 0
+        self._writer = False
+        self._writers_waiting = 0
+
+    def acquire_read(self) -> None:
+        """Block until shared (read) access is granted."""
+        with self._cond:
+            while self._writer or self._writers_waiting:
+                self._cond.wait()
+            self._readers += 1
+
+    def release_read(self) -> None:
+        """Release shared access."""
+        with self._cond:
+            self._readers -= 1
+            if self._readers == 0:
+                self._cond.notify_all()
+
+    def acquire_write(self) -> None:
+        """Block until exclusive (write) access is granted."""
+        with self._cond:
+            self._writers_waiting += 1
+            try:
+                while self._writer or self._readers:
+                    self._cond.wait()
+            finally:
+                self._writers_waiting -= 1
+            self._writer = True
+
+    def release_write(self) -> None:
+        """Release exclusive access."""
+        with self._cond:
+            self._writer = False
+            self._cond.notify_all()
+
+    @contextmanager
+    def read(self) -> Iterator[None]:
+        """Context manager for shared access."""
+        self.acquire_read()
+        try:
+            yield
+        finally:
+            self.release_read()
+
+    @contextmanager
+    def write(self) -> Iterator[None]:
+        """Context manager for exclusive access."""
+        self.acquire_write()
+        try:
+            yield
+        finally:
+            self.release_write()
@@ -6,11 +6,18 @@ Security primitives:
 - JWT creation + validation using PyJWT
 
 Standardized to bypass passlib version bugs and bcrypt 72-byte limits.
+
+Password hashes are versioned: "v2$<bcrypt>" uses a base64 SHA-256 pre-hash;
+unprefixed hashes (hex pre-hash) still verify and are re-hashed on the next
+successful login (see password_needs_rehash()).
 """
 
 from __future__ import annotations
 
+import base64
 import hashlib
+import hmac
+import json
 import bcrypt  # Use native bcrypt instead of passlib
 from datetime import datetime, timedelta, timezone
 from typing import Any
@@ -18,12 +25,41 @@ from typing import Any
 import jwt
 from . import settings
 
+try:
+    import orjson
+except ImportError:  # optional: stdlib json gives the same compact output
+    orjson = None
+
+# Prefix of hashes made with the current pre-hash. Unprefixed hashes are legacy
+# (hex pre-hash) and are replaced on the user's next successful login.
+_HASH_V2_PREFIX = "v2$"
+
+# HMAC key prepared once: PyJWT otherwise re-encodes the str secret on every
+# encode/decode. Bytes keys are accepted by every PyJWT 2.x release.
+_JWT_KEY: bytes = settings.JWT_SECRET.encode("utf-8")
+_JWT_ALGORITHMS = [settings.JWT_ALG]
+
+# HS256 tokens are built by hand: the header segment never changes, and the
+# keyed HMAC state is copied instead of re-deriving the key pads per token.
+# Same key order and compact separators as jwt.encode(); orjson (if present)
+# only differs in writing non-ASCII as raw UTF-8, which decodes identically.
+_JWT_HEADER_B64 = base64.urlsafe_b64encode(b'{"alg":"HS256","typ":"JWT"}').rstrip(b"=")
+_JWT_HMAC = hmac.new(_JWT_KEY, digestmod=hashlib.sha256)
+
+
 def _pre_hash(password: str) -> bytes:
     """
     Industry standard fix for bcrypt's 72-byte limit.
-    Converts password to SHA-256 hex, then returns bytes for bcrypt.
+    Returns the base64 of the raw SHA-256 digest (44 bytes).
+
+    Base64 rather than the raw 32-byte digest: bcrypt rejects/truncates at NUL
+    bytes, which a raw digest can contain.
     """
-    # hex-digest is 64 chars, safely under the 72-byte limit.
+    return base64.b64encode(hashlib.sha256(password.encode("utf-8")).digest())
+
+
+def _pre_hash_legacy(password: str) -> bytes:
+    """Pre-hash used by unprefixed (legacy) hashes: SHA-256 hex, 64 bytes."""
     return hashlib.sha256(password.encode("utf-8")).hexdigest().encode("utf-8")
 
 
@@ -36,22 +72,38 @@ def hash_password(password: str) -> str:
     # 2. Generate salt and hash
     salt = bcrypt.gensalt()
     hashed = bcrypt.hashpw(prepared_password, salt)
-    # 3. Return as string for database storage
-    return hashed.decode("utf-8")
+    # 3. Return as string for database storage (versioned)
+    return _HASH_V2_PREFIX + hashed.decode("utf-8")
 
 
 def verify_password(password: str, password_hash: str) -> bool:
     """
     Verify a plaintext password against a stored bcrypt hash string.
+
+    Accepts both current (v2$-prefixed) and legacy hashes.
     """
     try:
-        prepared_password = _pre_hash(password)
+        if password_hash.startswith(_HASH_V2_PREFIX):
+            prepared_password = _pre_hash(password)
+            stored = password_hash[len(_HASH_V2_PREFIX):]
+        else:
+            prepared_password = _pre_hash_legacy(password)
+            stored = password_hash
         # We encode the hash from the DB back to bytes for bcrypt to compare
-        return bcrypt.checkpw(prepared_password, password_hash.encode("utf-8"))
+        return bcrypt.checkpw(prepared_password, stored.encode("utf-8"))
     except Exception:
         return False
 
 
+def password_needs_rehash(password_hash: str) -> bool:
+    """
+    True if a stored hash uses the legacy pre-hash.
+
+    Call after a successful verify_password() and store hash_password(password).
+    """
+    return not password_hash.startswith(_HASH_V2_PREFIX)
+
+
 def create_access_token(*, user_id: int, email: str) -> str:
     now = datetime.now(timezone.utc)
     exp = now + timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
@@ -62,11 +114,23 @@ def create_access_token(*, user_id: int, email: str) -> str:
         "iat": int(now.timestamp()),
         "exp": int(exp.timestamp()),
     }
-    return jwt.encode(payload, settings.JWT_SECRET, algorithm=settings.JWT_ALG)
+    if settings.JWT_ALG != "HS256":
+        return jwt.encode(payload, _JWT_KEY, algorithm=settings.JWT_ALG)
+
+    if orjson is not None:
+        payload_json = orjson.dumps(payload)
+    else:
+        payload_json = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+    payload_b64 = base64.urlsafe_b64encode(payload_json).rstrip(b"=")
+    signing_input = _JWT_HEADER_B64 + b"." + payload_b64
+    mac = _JWT_HMAC.copy()
+    mac.update(signing_input)
+    signature_b64 = base64.urlsafe_b64encode(mac.digest()).rstrip(b"=")
+    return (signing_input + b"." + signature_b64).decode("ascii")
 
 
 def decode_access_token(token: str) -> dict[str, Any] | None:
     try:
-        return jwt.decode(token, settings.JWT_SECRET, algorithms=[settings.JWT_ALG])
+        return jwt.decode(token, _JWT_KEY, algorithms=_JWT_ALGORITHMS)
     except jwt.PyJWTError:
         return None
\ No newline at end of file
@@ -4,7 +4,8 @@ app/services/dashboard_service.py
 Dashboard computations for Step 8.
 
 Responsibilities:
-- Aggregate transactions in Python (because SimpleDB has no SUM/GROUP BY)
+- Aggregate transactions via the repo's aggregate helpers (SimpleDB has no
+  SUM/GROUP BY, so they scan narrow projections and return only the sums)
 - Compute:
     - all-time balance
     - current month income + expense totals
@@ -22,7 +23,12 @@ from dataclasses import dataclass
 from datetime import datetime
 from typing import Any
 
-from ..repos.transactions_repo import list_transactions_for_user
+from ..repos.categories_repo import list_categories_for_user
+from ..repos.transactions_repo import (
+    aggregate_month_for_user,
+    aggregate_totals_for_user,
+    list_recent_transactions_for_user,
+)
 
 
 @dataclass(frozen=True)
@@ -52,48 +58,26 @@ def compute_dashboard(user_id: int, *, now: datetime | None = None) -> Dashboard
     if now is None:
         now = datetime.now()
 
-    ym = now.strftime("%Y-%m")
+    ym = f"{now.year:04d}-{now.month:02d}"
 
-    # All transactions for balance (could be large; fine for demo).
-    all_txs = list_transactions_for_user(user_id, ym=None)
-
-    balance = 0
-    for t in all_txs:
-        amt = int(t["amount_cents"])
-        if t["type"] == "income":
-            balance += amt
-        else:
-            balance -= amt
-
-    # Current month transactions (cheap filter because we use ym equality)
-    month_txs = list_transactions_for_user(user_id, ym=ym)
-
-    month_income = 0
-    month_expense = 0
-    spend_map: dict[str, int] = {}
-
-    for t in month_txs:
-        amt = int(t["amount_cents"])
-        if t["type"] == "income":
-            month_income += amt
-        else:
-            month_expense += amt
-            cname = t["category_name"] or "Uncategorized"
-            spend_map[cname] = spend_map.get(cname, 0) + amt
+    totals = aggregate_totals_for_user(user_id)
+    month = aggregate_month_for_user(user_id, ym)
+    by_category = month["by_category"]
 
+    # Category names come from the (cached) category list, not a JOIN.
+    names = {c["id"]: c["name"] for c in list_categories_for_user(user_id)} if by_category else {}
     spending_by_category = [
-        {"category_name": k, "expense_cents": v}
-        for k, v in spend_map.items()
+        {"category_name": names.get(cid) or "Uncategorized", "expense_cents": cents}
+        for cid, cents in by_category.items()
     ]
     spending_by_category.sort(key=lambda x: x["expense_cents"], reverse=True)
 
-    # Recent transactions: take first N from all_txs (already sorted desc by repo)
-    recent = all_txs[:10]
+    recent = list_recent_transactions_for_user(user_id, limit=10)
 
     return DashboardData(
-        balance_cents=balance,
-        month_income_cents=month_income,
-        month_expense_cents=month_expense,
+        balance_cents=totals["income"] - totals["expense"],
+        month_income_cents=month["income"],
+        month_expense_cents=month["expense"],
         spending_by_category=spending_by_category,
         recent_transactions=recent,
         ym=ym,
@@ -111,5 +95,5 @@ def format_cents(cents: int) -> str:
         String "123.45" (with negative sign if needed).
     """
     sign = "-" if cents < 0 else ""
-    cents = abs(int(cents))
+    cents = abs(cents)
     return f"{sign}{cents // 100}.{cents % 100:02d}"
\ No newline at end of file
@@ -10,13 +10,18 @@ Step 2 adds:
 
 from __future__ import annotations
 
+import os
 from pathlib import Path
 
 # finance_tracker/ (project root)
 BASE_DIR = Path(__file__).resolve().parent.parent
 
-# SimpleDB database directory (persisted on disk)
-DB_DIR = BASE_DIR / "db"
+# SimpleDB database directory (persisted on disk).
+# DB_PATH (set in the Dockerfile) overrides the local default.
+DB_DIR = Path(os.getenv("DB_PATH") or BASE_DIR / "db")
+
+# Templates: re-check template files on every render only when asked to (dev).
+TEMPLATES_AUTO_RELOAD = os.getenv("TEMPLATES_AUTO_RELOAD", "") == "1"
 
 # JWT / Auth
 JWT_SECRET = "change-me-in-production"  # For demo. In real use, load from env var.
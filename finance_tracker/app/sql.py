@@ -4,9 +4,10 @@ app/sql.py
 SQL string helpers for safely building SQL for SimpleDB.
 
 Why needed:
-- SimpleDB doesn't support parameterized queries yet.
-- Therefore we must escape string literals ourselves to avoid syntax errors and
-  reduce risk of basic SQL injection.
+- Repos pass values to SimpleDB as prepared-statement parameters
+  (db_core.execute_prepared), which needs no escaping at all.
+- sql_literal() remains for SQL that must be built as text, i.e. scripts
+  (execute_script has no parameters) such as db_init's migrations.
 
 Rules we follow:
 - User input is only inserted as *literals* (never as table/column identifiers).
@@ -15,6 +16,7 @@ Rules we follow:
 
 from __future__ import annotations
 
+from functools import lru_cache
 from typing import Any
 
 
@@ -31,7 +33,18 @@ def sql_escape_string(value: str) -> str:
     Example:
         "O'Reilly" -> "O''Reilly"
     """
-    return value.replace("'", "''")
+    # Most text has no quote at all; the membership test is a C-level memchr.
+    return value if "'" not in value else value.replace("'", "''")
+
+
+@lru_cache(maxsize=4096)
+def _int_literal(value: int) -> str:
+    """
+    Cached str() for int literals (ids repeat in almost every WHERE clause).
+
+    Only ints are cached: string keys would be unbounded user input.
+    """
+    return str(value)
 
 
 def sql_literal(value: Any) -> str:
@@ -51,6 +64,10 @@ def sql_literal(value: Any) -> str:
     Raises:
         TypeError if unsupported type.
     """
+    # Exact-type check first: ints are by far the most common parameter, and
+    # type() is not bool-confusable the way isinstance() is.
+    if type(value) is int:
+        return _int_literal(value)
     if value is None:
         return "NULL"
     if isinstance(value, bool):
@@ -59,4 +76,4 @@ def sql_literal(value: Any) -> str:
         return str(value)
     if isinstance(value, str):
         return "'" + sql_escape_string(value) + "'"
-    raise TypeError(f"Unsupported literal type: {type(value).__name__}")
\ No newline at end of file
+    raise TypeError(f"Unsupported literal type: {type(value).__name__}")
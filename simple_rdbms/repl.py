@@ -159,7 +159,7 @@ def cmd_schema(db: Database, table: str) -> None:
     if t.indexes:
         print("INDEXES")
         for iname, idx in t.indexes.items():
-            print(f"  - {iname} ON {idx.table_name}({idx.column_name})")
+            print(f"  - {iname} ON {idx.table_name}({', '.join(idx.column_names)})")
 
 
 def repl(db_dir: Path) -> int:
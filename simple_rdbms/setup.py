@@ -0,0 +1,24 @@
+"""
+Optional mypyc build of the SQL front end.
+
+`pip install .` builds the pure-Python package. With SIMPLEDB_MYPYC=1 (and
+mypy installed, hence --no-build-isolation) lexer.py and parser.py are
+compiled to C extensions, which import in place of the .py modules:
+
+    pip install mypy
+    SIMPLEDB_MYPYC=1 pip install --no-build-isolation ./simple_rdbms
+
+Everything else is configured in pyproject.toml.
+"""
+
+import os
+
+from setuptools import setup
+
+ext_modules = []
+if os.environ.get("SIMPLEDB_MYPYC") == "1":
+    from mypyc.build import mypycify
+
+    ext_modules = mypycify(["--follow-imports=silent", "simpledb/lexer.py", "simpledb/parser.py"])
+
+setup(ext_modules=ext_modules)
@@ -1,9 +1,11 @@
 from .db import Database
+from .prepared import PreparedStatement
 from .errors import SimpleDBError, SqlSyntaxError, ExecutionError, ConstraintError
 from .result import QueryResult, CommandOk
 
 __all__ = [
     "Database",
+    "PreparedStatement",
     "SimpleDBError",
     "SqlSyntaxError",
     "ExecutionError",
@@ -10,11 +10,14 @@ Design notes:
 - We keep the AST small and explicit, supporting only the required SQL subset.
 - Column references can be qualified (table.column) to support JOIN queries.
 - WHERE supports only conjunctions of equality predicates (col = literal AND ...).
+- SELECT may end with ORDER BY col [ASC|DESC], ... and LIMIT n.
+- Prepared statements put Param nodes where literals go (and in LIMIT); they
+  are replaced by values before execution (see simpledb/prepared.py).
 """
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Any
 
 
@@ -69,6 +72,17 @@ class ColumnRef:
     table: str | None = None
 
 
+@dataclass(frozen=True)
+class Param:
+    """
+    Positional parameter placeholder ('?') in a prepared statement.
+
+    Attributes:
+        index: 0-based position of the placeholder in the SQL text.
+    """
+    index: int
+
+
 @dataclass(frozen=True)
 class Condition:
     """
@@ -77,7 +91,7 @@ class Condition:
     Attributes:
         left: ColumnRef on the left side.
         op: Operator string (Phase: only "=").
-        right: Literal value (int | str | bool | None).
+        right: Literal value (int | str | bool | None) or Param.
     """
     left: ColumnRef
     op: str
@@ -104,20 +118,58 @@ class CreateTable(Statement):
     columns: list[ColumnDef]
 
 
+@dataclass(frozen=True)
+class AlterTableAddColumn(Statement):
+    """
+    ALTER TABLE ... ADD [COLUMN] statement.
+
+    Attributes:
+        table_name: Table being altered.
+        column: New column definition.
+    """
+    table_name: str
+    column: ColumnDef
+
+
 @dataclass(frozen=True)
 class CreateIndex(Statement):
-    """CREATE INDEX statement."""
+    """
+    CREATE INDEX statement.
+
+    Attributes:
+        index_name: Index name.
+        table_name: Indexed table.
+        column_names: Key columns (more than one => composite index).
+    """
     index_name: str
     table_name: str
-    column_name: str
+    column_names: list[str]
+
+    @property
+    def column_name(self) -> str:
+        """First key column (the only one for single-column indexes)."""
+        return self.column_names[0]
 
 
 @dataclass(frozen=True)
 class Insert(Statement):
-    """INSERT statement."""
+    """
+    INSERT statement.
+
+    Attributes:
+        table_name: Target table.
+        columns: Column names, in VALUES order.
+        values: The first (often only) row of values.
+        extra_rows: Further rows of a multi-row VALUES list.
+    """
     table_name: str
     columns: list[str]
     values: list[Any]
+    extra_rows: list[list[Any]] = field(default_factory=list)
+
+    def rows(self) -> list[list[Any]]:
+        """Return every VALUES row, in order."""
+        return [self.values, *self.extra_rows]
 
 
 @dataclass(frozen=True)
@@ -135,6 +187,19 @@ class JoinClause:
     right: ColumnRef
 
 
+@dataclass(frozen=True)
+class OrderItem:
+    """
+    One ORDER BY key.
+
+    Attributes:
+        column: Column to sort by.
+        descending: True for DESC, False for ASC (default).
+    """
+    column: ColumnRef
+    descending: bool = False
+
+
 @dataclass(frozen=True)
 class Select(Statement):
     """
@@ -145,11 +210,15 @@ class Select(Statement):
         from_table: Base table.
         joins: List of JoinClause; only INNER JOIN equality supported.
         where: Optional WHERE clause (AND of equality).
+        order_by: ORDER BY keys (empty list means unordered).
+        limit: Optional LIMIT row count (int, or Param before binding).
     """
     columns: list[ColumnRef] | None
     from_table: str
     joins: list[JoinClause]
     where: WhereClause | None
+    order_by: list[OrderItem] = field(default_factory=list)
+    limit: int | Param | None = None
 
 
 @dataclass(frozen=True)
@@ -10,28 +10,106 @@ Responsibilities:
 
 Persistence:
 - Stored at: <db_dir>/catalog.json
+- Uses orjson when it is installed (optional; stdlib json otherwise). Both
+  write compact, key-sorted JSON, so either can read the file.
+- Saves are atomic: written to catalog.json.tmp, then renamed over the old
+  file, so a crash mid-save never leaves a truncated catalog.
 
 Design notes:
 - This is a small educational RDBMS, so the catalog is intentionally simple.
 - We support a single-column PRIMARY KEY per table (Phase 1 simplification).
 - Index names are globally unique (simplifies management).
+- Indexes may span several columns (composite); they are only usable when every
+  key column is bound by an equality predicate.
 """
 
 from __future__ import annotations
 
 import json
-from dataclasses import dataclass
+import os
+from sys import intern
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable
 
 from .ast import ColumnDef, TypeSpec
 from .errors import ExecutionError
 
+try:
+    import orjson
+except ImportError:  # optional speedup
+    orjson = None
+
 CATALOG_FILE = "catalog.json"
 
 SUPPORTED_TYPES = {"INTEGER", "VARCHAR", "TEXT", "DATE", "BOOLEAN"}
 
 
+def _json_loads(data: bytes) -> Any:
+    """Parse UTF-8 JSON bytes (orjson if available)."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data.decode("utf-8"))
+
+
+def _json_dumps(obj: Any) -> bytes:
+    """Serialize to compact, key-sorted UTF-8 JSON bytes (orjson if available)."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_SORT_KEYS)
+    return json.dumps(obj, separators=(",", ":"), sort_keys=True, ensure_ascii=False).encode("utf-8")
+
+
+def _column_validator(table_name: str, col: ColumnDef) -> Callable[[Any], None]:
+    """
+    Build the type check for one column's non-NULL values.
+
+    The type dispatch (and the VARCHAR length) is resolved here, once per
+    schema change, instead of on every validated row.
+
+    Args:
+        table_name: Table name (for error messages).
+        col: Column definition.
+
+    Returns:
+        A function that raises ExecutionError if a value does not fit the column.
+    """
+    t = col.typ.name.upper()
+    qual = f"{table_name}.{col.name}"
+
+    if t == "INTEGER":
+        def check_int(val: Any) -> None:
+            # bool is a subclass of int in Python, so explicitly reject.
+            if type(val) is not int and (not isinstance(val, int) or isinstance(val, bool)):
+                raise ExecutionError(f"Type error: {qual} expects INTEGER")
+        return check_int
+
+    if t == "VARCHAR":
+        max_len = col.typ.params[0]
+
+        def check_varchar(val: Any) -> None:
+            if not isinstance(val, str):
+                raise ExecutionError(f"Type error: {qual} expects TEXT/DATE")
+            if len(val) > max_len:
+                raise ExecutionError(f"Type error: {qual} exceeds VARCHAR({max_len})")
+        return check_varchar
+
+    if t in ("TEXT", "DATE"):
+        def check_text(val: Any) -> None:
+            if not isinstance(val, str):
+                raise ExecutionError(f"Type error: {qual} expects TEXT/DATE")
+        return check_text
+
+    if t == "BOOLEAN":
+        def check_bool(val: Any) -> None:
+            if not isinstance(val, bool):
+                raise ExecutionError(f"Type error: {qual} expects BOOLEAN")
+        return check_bool
+
+    def check_unsupported(val: Any) -> None:
+        raise ExecutionError(f"Unsupported type: {t}")
+    return check_unsupported
+
+
 @dataclass
 class IndexMeta:
     """
@@ -40,11 +118,25 @@ class IndexMeta:
     Attributes:
         name: Index name (globally unique across DB).
         table_name: Table the index belongs to.
-        column_name: Column the index indexes.
+        column_name: First (or only) indexed column.
+        column_names: All key columns, in order (composite if more than one).
     """
     name: str
     table_name: str
     column_name: str
+    column_names: list[str] = field(default_factory=list)
+
+    def __post_init__(self) -> None:
+        if not self.column_names:
+            self.column_names = [self.column_name]
+
+    def to_dict(self) -> dict[str, Any]:
+        """Serialize for catalog.json."""
+        return {
+            "table_name": self.table_name,
+            "column_name": self.column_name,
+            "column_names": list(self.column_names),
+        }
 
 
 @dataclass
@@ -56,21 +148,69 @@ class TableMeta:
         name: Table name.
         columns: Column definitions (name/type/constraints).
         indexes: Index metadata keyed by index name.
+
+    Notes:
+        Column lookups are precomputed from `columns`. Change the column list
+        only through add_column(), which keeps them in sync.
     """
     name: str
     columns: list[ColumnDef]
     indexes: dict[str, IndexMeta]
-
-    def column_names(self) -> set[str]:
+    _by_name: dict[str, ColumnDef] = field(init=False, repr=False, compare=False)
+    _col_names: frozenset[str] = field(init=False, repr=False, compare=False)
+    _pk: str | None = field(init=False, repr=False, compare=False)
+    _unique: tuple[str, ...] = field(init=False, repr=False, compare=False)
+    _required: tuple[ColumnDef, ...] = field(init=False, repr=False, compare=False)
+    _validators: list[tuple[str, Callable[[Any], None]]] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self._refresh_columns()
+
+    def _refresh_columns(self) -> None:
+        """Recompute the cached column lookups from `columns`."""
+        self._by_name = {c.name: c for c in self.columns}
+        self._col_names = frozenset(self._by_name)
+        self._pk = next((c.name for c in self.columns if c.primary_key), None)
+        self._unique = tuple(c.name for c in self.columns if c.unique)
+        self._required = tuple(c for c in self.columns if c.not_null or c.primary_key)
+        self._validators = [(c.name, _column_validator(self.name, c)) for c in self.columns]
+
+    def add_column(self, column: ColumnDef) -> None:
+        """Append a column (ALTER TABLE ... ADD COLUMN) and refresh the lookups."""
+        self.columns.append(column)
+        self._refresh_columns()
+
+    def column_names(self) -> frozenset[str]:
         """Return the set of column names in this table."""
-        return {c.name for c in self.columns}
+        return self._col_names
 
     def get_column(self, name: str) -> ColumnDef | None:
         """Return ColumnDef by name, or None if not found."""
-        for c in self.columns:
-            if c.name == name:
-                return c
-        return None
+        return self._by_name.get(name)
+
+    def validate_row(self, row: dict[str, Any]) -> None:
+        """
+        Check that every non-NULL value in `row` fits its column's type.
+
+        Args:
+            row: Dict of column -> value (missing columns and None are skipped).
+
+        Raises:
+            ExecutionError on type mismatch.
+        """
+        get = row.get
+        for name, check in self._validators:
+            val = get(name)
+            if val is not None:
+                check(val)
+
+    def unique_columns(self) -> tuple[str, ...]:
+        """Return the names of UNIQUE columns, in schema order."""
+        return self._unique
+
+    def required_columns(self) -> tuple[ColumnDef, ...]:
+        """Return the columns that reject NULL (NOT NULL or PRIMARY KEY), in schema order."""
+        return self._required
 
     def primary_key_column(self) -> str | None:
         """
@@ -79,10 +219,7 @@ class TableMeta:
         Note:
             This DB supports only ONE primary key column per table.
         """
-        pks = [c.name for c in self.columns if c.primary_key]
-        if not pks:
-            return None
-        return pks[0]
+        return self._pk
 
 
 @dataclass
@@ -119,7 +256,7 @@ class Catalog:
         if not path.exists():
             return cls.empty()
 
-        raw = json.loads(path.read_text(encoding="utf-8"))
+        raw = _json_loads(path.read_bytes())
         version = int(raw.get("version", 1))
 
         tables: dict[str, TableMeta] = {}
@@ -136,7 +273,7 @@ class Catalog:
                 )
                 cols.append(
                     ColumnDef(
-                        name=c["name"],
+                        name=intern(c["name"]),
                         typ=typ,
                         not_null=bool(c.get("not_null", False)),
                         unique=bool(c.get("unique", False)),
@@ -149,11 +286,13 @@ class Catalog:
                 idx = IndexMeta(
                     name=iname,
                     table_name=im["table_name"],
-                    column_name=im["column_name"],
+                    column_name=intern(im["column_name"]),
+                    column_names=[intern(n) for n in im.get("column_names", [])],
                 )
                 t_indexes[iname] = idx
                 indexes[iname] = idx
 
+            tname = intern(tname)
             tables[tname] = TableMeta(name=tname, columns=cols, indexes=t_indexes)
 
         # Optional: merge any global index list (kept for forward compatibility)
@@ -163,6 +302,7 @@ class Catalog:
                     name=iname,
                     table_name=im["table_name"],
                     column_name=im["column_name"],
+                    column_names=list(im.get("column_names", [])),
                 )
 
         return cls(version=version, tables=tables, indexes=indexes)
@@ -189,22 +329,18 @@ class Catalog:
         for tname, t in self.tables.items():
             tables_dict[tname] = {
                 "columns": [col_to_dict(c) for c in t.columns],
-                "indexes": {
-                    iname: {"table_name": idx.table_name, "column_name": idx.column_name}
-                    for iname, idx in t.indexes.items()
-                },
+                "indexes": {iname: idx.to_dict() for iname, idx in t.indexes.items()},
             }
 
         out = {
             "version": self.version,
             "tables": tables_dict,
-            "indexes": {
-                iname: {"table_name": idx.table_name, "column_name": idx.column_name}
-                for iname, idx in self.indexes.items()
-            },
+            "indexes": {iname: idx.to_dict() for iname, idx in self.indexes.items()},
         }
 
-        path.write_text(json.dumps(out, indent=2, sort_keys=True), encoding="utf-8")
+        tmp = path.with_name(path.name + ".tmp")
+        tmp.write_bytes(_json_dumps(out))
+        os.replace(tmp, path)
 
     # ---------- lookup helpers ----------
 
@@ -280,19 +416,48 @@ class Catalog:
         for c in columns:
             self.validate_type(c.typ)
 
-    def validate_create_index(self, index_name: str, table_name: str, column_name: str) -> None:
+    def validate_add_column(self, table_name: str, column: ColumnDef, table_has_rows: bool) -> None:
+        """
+        Validate ALTER TABLE ... ADD COLUMN request.
+
+        Checks:
+        - Table exists and has no column with that name
+        - Supported type + parameter validation
+        - No PRIMARY KEY (a table's key is fixed at CREATE TABLE)
+        - NOT NULL only on an empty table (existing rows read the new column as NULL)
+
+        Args:
+            table_name: Table name.
+            column: New column definition.
+            table_has_rows: Whether the table currently holds any active row.
+
+        Raises:
+            ExecutionError: if invalid.
+        """
+        table = self.require_table(table_name)
+        if column.name in table.column_names():
+            raise ExecutionError(f"Column already exists: {table_name}.{column.name}")
+
+        self.validate_type(column.typ)
+
+        if column.primary_key:
+            raise ExecutionError("Cannot add a PRIMARY KEY column")
+        if column.not_null and table_has_rows:
+            raise ExecutionError(f"Cannot add NOT NULL column to non-empty table: {table_name}")
+
+    def validate_create_index(self, index_name: str, table_name: str, column_names: list[str]) -> None:
         """
         Validate CREATE INDEX request.
 
         Checks:
         - Index name not already used
         - Table exists
-        - Column exists in table
+        - Every key column exists in table, with no repeats
 
         Args:
             index_name: Index name.
             table_name: Table name.
-            column_name: Column name.
+            column_names: Key column names (one, or several for a composite index).
 
         Raises:
             ExecutionError: if invalid.
@@ -301,5 +466,9 @@ class Catalog:
             raise ExecutionError(f"Index already exists: {index_name}")
 
         table = self.require_table(table_name)
-        if column_name not in table.column_names():
-            raise ExecutionError(f"Column not found: {table_name}.{column_name}")
\ No newline at end of file
+        table_cols = table.column_names()
+        for column_name in column_names:
+            if column_name not in table_cols:
+                raise ExecutionError(f"Column not found: {table_name}.{column_name}")
+        if len(set(column_names)) != len(column_names):
+            raise ExecutionError("Duplicate column in CREATE INDEX")
\ No newline at end of file
@@ -8,8 +8,17 @@ Responsibilities:
     - Database.open(path)
     - db.execute(sql) -> CommandOk | QueryResult
     - db.execute_script(sql_script) -> list[CommandOk|QueryResult]
+    - db.prepare(sql[, name]) -> PreparedStatement (handle.execute(params))
+    - db.execute_prepared(sql_or_prepared, params) -> CommandOk | QueryResult
+    - db.execute_named(name, params) / db.deallocate(name)
+    - db.executemany(sql_or_prepared, param_rows) -> CommandOk
 - Load/persist the schema catalog
-- Maintain an index cache shared across executions (performance + fewer disk reads)
+- Maintain index and heap caches shared across executions (performance + fewer disk reads)
+- Maintain LRU caches of parsed statements keyed by SQL text (plain, prepared
+  and scripts)
+- Reuse the parse of plain DML across statements that differ only in literal
+  values (statement shapes, see simpledb/prepared.py)
+- Reuse one Executor (it only holds references to the shared state above)
 
 This module is intentionally minimal so it can be used from:
 - the REPL (repl.py)
@@ -19,12 +28,31 @@ This module is intentionally minimal so it can be used from:
 from __future__ import annotations
 
 from dataclasses import dataclass, field
+from functools import lru_cache, partial
 from pathlib import Path
+from typing import Any, Callable, Iterable, Sequence
 
 from .catalog import Catalog
+from .errors import ExecutionError
 from .exec.executor import Executor
 from .index.hash_index import HashIndex
+from .storage.heap import HeapTable
+from .ast import Insert, Select, Statement
 from .parser import parse_script, parse_sql
+from .prepared import PreparedStatement, literal_shape, prepare_shape, prepare_sql
+from .result import CommandOk, rows_ok
+
+# Distinct SQL strings kept parsed per Database
+PARSE_CACHE_SIZE = 512
+PREPARED_CACHE_SIZE = 256
+SCRIPT_CACHE_SIZE = 64
+# Distinct statement shapes remembered per Database
+SHAPE_CACHE_SIZE = 256
+
+
+def _parse_script_tuple(sql: str) -> tuple[Statement, ...]:
+    """parse_script() as a tuple, so a cached script cannot be altered by callers."""
+    return tuple(parse_script(sql))
 
 
 @dataclass
@@ -36,10 +64,39 @@ class Database:
         root_dir: DB root folder on disk.
         catalog: Loaded schema catalog.
         index_cache: Cache of opened HashIndex objects.
+        heap_cache: Cache of open HeapTable objects.
     """
     root_dir: Path
     catalog: Catalog
     index_cache: dict[str, HashIndex] = field(default_factory=dict)
+    heap_cache: dict[str, HeapTable] = field(default_factory=dict)
+    _parse_cached: Callable[[str], Statement] = field(init=False, repr=False)
+    _prepare_cached: Callable[[str], PreparedStatement] = field(init=False, repr=False)
+    _parse_script_cached: Callable[[str], tuple[Statement, ...]] = field(init=False, repr=False)
+    _executor: Executor = field(init=False, repr=False)
+    _run: Callable[[Statement], Any] = field(init=False, repr=False)
+    _named: dict[str, PreparedStatement] = field(init=False, repr=False, default_factory=dict)
+    _shapes: dict[tuple[Any, ...], PreparedStatement | None] = field(init=False, repr=False, default_factory=dict)
+
+    def __post_init__(self) -> None:
+        # functools.lru_cache is thread-safe. Parsed statements do not depend on
+        # the catalog (names are resolved at execution), so DDL does not need
+        # to invalidate them; the AST is frozen and the executor never mutates it.
+        # The Executor keeps no per-statement state, so one instance serves all calls.
+        self._executor = Executor(
+            db_dir=self.root_dir,
+            catalog=self.catalog,
+            index_cache=self.index_cache,
+            heap_cache=self.heap_cache,
+        )
+        # Bound once: `self._executor.execute` would build a new bound-method
+        # object on every call.
+        self._run = self._executor.execute
+        self._parse_cached = lru_cache(maxsize=PARSE_CACHE_SIZE)(self._parse_by_shape)
+        self._parse_script_cached = lru_cache(maxsize=SCRIPT_CACHE_SIZE)(_parse_script_tuple)
+        self._prepare_cached = lru_cache(maxsize=PREPARED_CACHE_SIZE)(
+            partial(prepare_sql, executor=self._executor)
+        )
 
     @classmethod
     def open(cls, path: str | Path) -> "Database":
@@ -57,6 +114,29 @@ class Database:
         catalog = Catalog.load(root)
         return cls(root_dir=root, catalog=catalog)
 
+    def _parse_by_shape(self, sql: str) -> Statement:
+        """
+        parse_sql() for a statement missing from the text cache.
+
+        The second time a DML shape (the text minus INT/STRING literal values)
+        is seen, it is prepared with placeholders; from then on statements of
+        that shape are bound without being lexed or parsed. The first sighting
+        parses normally, so one-off statements pay only the shape key.
+        """
+        if "?" in sql:
+            return parse_sql(sql)  # rejects placeholders outside string literals
+        key, values = literal_shape(sql)
+        shapes = self._shapes
+        template = shapes.get(key)
+        if template is not None:
+            return template.bind(values)
+        stmt = parse_sql(sql)
+        if key in shapes:
+            shapes[key] = prepare_shape(sql)  # None (kept unprepared) for DDL
+        elif len(shapes) < SHAPE_CACHE_SIZE:
+            shapes[key] = None
+        return stmt
+
     def execute(self, sql: str):
         """
         Execute a single SQL statement.
@@ -70,10 +150,116 @@ class Database:
         Raises:
             SqlSyntaxError: on parse errors.
             ExecutionError / ConstraintError: on execution failure.
+
+        Notes:
+            The parse is cached by SQL text, so repeating a statement skips
+            lexing and parsing; a new statement of an already seen DML shape
+            skips parsing (see _parse_by_shape).
         """
-        stmt = parse_sql(sql)
-        ex = Executor(db_dir=self.root_dir, catalog=self.catalog, index_cache=self.index_cache)
-        return ex.execute(stmt)
+        return self._run(self._parse_cached(sql))
+
+    def prepare(self, sql: str, name: str | None = None) -> PreparedStatement:
+        """
+        Parse a statement with '?' placeholders, or return the cached parse.
+
+        Args:
+            sql: SQL string containing exactly one statement.
+            name: Optional name to register the statement under (see
+                execute_named); re-preparing a name replaces it.
+
+        Returns:
+            PreparedStatement (shared; treat as immutable). Its execute(params)
+            runs on this Database.
+
+        Raises:
+            SqlSyntaxError: on parse errors.
+        """
+        prepared = self._prepare_cached(sql)
+        if name is not None:
+            self._named[name] = prepared
+        return prepared
+
+    def execute_named(self, name: str, params: Sequence[Any] = ()):
+        """
+        Execute a statement registered with prepare(sql, name=...).
+
+        Args:
+            name: Statement name.
+            params: Values for the '?' placeholders, in order.
+
+        Returns:
+            CommandOk for non-SELECT statements, or QueryResult for SELECT.
+
+        Raises:
+            ExecutionError: if no statement has that name, or on execution failure.
+        """
+        prepared = self._named.get(name)
+        if prepared is None:
+            raise ExecutionError(f"Unknown prepared statement: {name}")
+        return self._run(prepared.bind(params))
+
+    def deallocate(self, name: str) -> None:
+        """
+        Forget a named prepared statement (no-op if the name is unknown).
+
+        Args:
+            name: Statement name.
+        """
+        self._named.pop(name, None)
+
+    def execute_prepared(self, sql: str | PreparedStatement, params: Sequence[Any] = ()):
+        """
+        Execute a prepared statement with positional parameters.
+
+        Args:
+            sql: PreparedStatement, or SQL text (prepared and cached on first use).
+            params: Values for the '?' placeholders, in order.
+
+        Returns:
+            CommandOk for non-SELECT statements, or QueryResult for SELECT.
+
+        Raises:
+            SqlSyntaxError: on parse errors.
+            ExecutionError / ConstraintError: on bad parameters or execution failure.
+        """
+        prepared = sql if isinstance(sql, PreparedStatement) else self._prepare_cached(sql)
+        return self._run(prepared.bind(params))
+
+    def executemany(self, sql: str | PreparedStatement, param_rows: Iterable[Sequence[Any]]) -> CommandOk:
+        """
+        Execute one prepared statement for every parameter row.
+
+        Args:
+            sql: PreparedStatement, or SQL text (prepared and cached on first use).
+            param_rows: One sequence of '?' values per execution.
+
+        Returns:
+            CommandOk with the total number of rows affected.
+
+        Raises:
+            ExecutionError: for SELECT, or on bad parameters / execution failure.
+            ConstraintError: on constraint violations.
+
+        Notes:
+            An INSERT runs as a single multi-row INSERT: one constraint check
+            and one heap write for the whole batch, which is all-or-nothing.
+            UPDATE/DELETE run once per parameter row.
+        """
+        prepared = sql if isinstance(sql, PreparedStatement) else self._prepare_cached(sql)
+        stmt = prepared.stmt
+        if isinstance(stmt, Select):
+            raise ExecutionError("executemany() does not support SELECT")
+
+        if isinstance(stmt, Insert):
+            rows = [r for params in param_rows for r in prepared.bind(params).rows()]
+            if not rows:
+                return rows_ok(0, "{n} rows inserted")
+            batch = Insert(table_name=stmt.table_name, columns=stmt.columns, values=rows[0], extra_rows=rows[1:])
+            return self._run(batch)
+
+        run = self._run
+        total = sum(run(prepared.bind(params)).rows_affected for params in param_rows)
+        return rows_ok(total, "{n} rows affected")
 
     def execute_script(self, sql: str):
         """
@@ -84,7 +270,11 @@ class Database:
 
         Returns:
             List of results in statement order.
+
+        Notes:
+            The parse is cached by script text, like execute(). All statements
+            are parsed before any runs, so a syntax error executes nothing.
         """
-        stmts = parse_script(sql)
-        ex = Executor(db_dir=self.root_dir, catalog=self.catalog, index_cache=self.index_cache)
-        return [ex.execute(s) for s in stmts]
\ No newline at end of file
+        stmts = self._parse_script_cached(sql)
+        run = self._run
+        return [run(s) for s in stmts]
\ No newline at end of file
@@ -5,11 +5,12 @@ Statement execution engine for the SimpleDB mini-RDBMS.
 
 Responsibilities:
 - Execute AST statements produced by the parser:
-    - DDL: CREATE TABLE, CREATE INDEX
+    - DDL: CREATE TABLE, CREATE INDEX, ALTER TABLE ... ADD COLUMN
     - DML: INSERT, SELECT, UPDATE, DELETE
 - Enforce constraints (PRIMARY KEY, UNIQUE, NOT NULL)
 - Maintain and use basic hash indexes for equality lookups
 - Execute simple INNER JOINs (delegates join mechanics to simpledb/exec/join.py)
+- Apply ORDER BY / LIMIT to SELECT results
 
 Core design:
 - Storage is provided by HeapTable (JSONL heap + rid directory + tombstones).
@@ -19,11 +20,14 @@ Core design:
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+import heapq
+from dataclasses import dataclass, field
+from operator import itemgetter
 from pathlib import Path
-from typing import Any, Iterable
+from typing import Any, Callable, Collection, Iterable, Iterator
 
 from ..ast import (
+    AlterTableAddColumn,
     ColumnRef,
     CreateIndex,
     CreateTable,
@@ -36,9 +40,89 @@ from ..ast import (
 from ..catalog import Catalog, IndexMeta, TableMeta
 from ..errors import ConstraintError, ExecutionError
 from ..index.hash_index import HashIndex
-from ..result import CommandOk, QueryResult
+from ..result import CommandOk, QueryResult, rows_ok
 from ..storage.heap import HeapTable
-from .join import CombinedRow, inner_join, where_matches
+from .codegen import run_scan
+from .join import CombinedRow, JoinKeys, inner_join, resolve_position, where_filter
+
+
+def _stop_after_key(rows: Iterable[dict[str, Any]], col: str, value: Any) -> Iterator[dict[str, Any]]:
+    """
+    Yield the first row whose `col` equals `value`, then stop.
+
+    Used when `col` is PRIMARY KEY / UNIQUE: no later row can have the value,
+    so the (lazy) scan or candidate fetch can stop there.
+    """
+    for r in rows:
+        if r.get(col) == value:
+            yield r
+            return
+
+
+def _sort_rows(rows: list[Any], keys: list[tuple[Callable[[Any], Any], bool]]) -> list[Any]:
+    """
+    Sort rows in place by several keys with independent directions.
+
+    Args:
+        rows: Rows to sort (any representation).
+        keys: (getter, descending) pairs in ORDER BY order.
+
+    Returns:
+        The same list, sorted.
+
+    Notes:
+        - Applies one stable sort per key, last key first.
+        - NULLs sort first ascending and last descending (same as SQLite).
+    """
+    for get, descending in reversed(keys):
+        rows.sort(key=lambda r: (get(r) is not None, get(r)), reverse=descending)
+    return rows
+
+
+class _Desc:
+    """Sort-key wrapper that inverts ordering (a DESC key inside a composite key)."""
+
+    __slots__ = ("v",)
+
+    def __init__(self, v: Any) -> None:
+        self.v = v
+
+    def __lt__(self, other: "_Desc") -> bool:
+        return other.v < self.v
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, _Desc) and self.v == other.v
+
+
+def _top_rows(
+    rows: Iterable[Any],
+    keys: list[tuple[Callable[[Any], Any], bool]],
+    limit: int,
+) -> list[Any]:
+    """
+    First `limit` rows of _sort_rows(rows, keys), without sorting everything.
+
+    Args:
+        rows: Rows to rank (consumed once).
+        keys: (getter, descending) pairs in ORDER BY order.
+        limit: Number of rows to keep.
+
+    Returns:
+        Up to `limit` rows, in ORDER BY order.
+
+    Notes:
+        heapq.nsmallest keeps a bounded heap (O(N log limit)) and is stable, so
+        ties come out in input order exactly as with the full sort.
+    """
+    def sort_key(r: Any) -> tuple[Any, ...]:
+        out = []
+        for get, descending in keys:
+            v = get(r)
+            k = (v is not None, v)
+            out.append(_Desc(k) if descending else k)
+        return tuple(out)
+
+    return heapq.nsmallest(limit, rows, key=sort_key)
 
 
 @dataclass
@@ -50,10 +134,12 @@ class Executor:
         db_dir: Database root directory.
         catalog: In-memory Catalog (also persisted as catalog.json).
         index_cache: Cache of loaded HashIndex objects (kept at Database level).
+        heap_cache: Cache of open HeapTable objects (kept at Database level).
     """
     db_dir: Path
     catalog: Catalog
     index_cache: dict[str, HashIndex]
+    heap_cache: dict[str, HeapTable] = field(default_factory=dict)
 
     # --------------------------
     # public entry point
@@ -72,25 +158,19 @@ class Executor:
         Raises:
             ExecutionError / ConstraintError on failure.
         """
-        if isinstance(stmt, CreateTable):
-            return self._create_table(stmt)
-        if isinstance(stmt, CreateIndex):
-            return self._create_index(stmt)
-        if isinstance(stmt, Insert):
-            return self._insert(stmt)
-        if isinstance(stmt, Select):
-            return self._select(stmt)
-        if isinstance(stmt, Update):
-            return self._update(stmt)
-        if isinstance(stmt, Delete):
-            return self._delete(stmt)
-
-        raise ExecutionError(f"Unsupported statement: {type(stmt).__name__}")
+        handler = _DISPATCH.get(type(stmt))
+        if handler is None:
+            raise ExecutionError(f"Unsupported statement: {type(stmt).__name__}")
+        return handler(self, stmt)
 
     # --------------------------
     # index helpers
     # --------------------------
 
+    def _get_heap(self, table_name: str) -> HeapTable:
+        """Return the table's heap storage (opened once, then cached)."""
+        return HeapTable.open_cached(self.heap_cache, self.db_dir, table_name)
+
     def _index_path(self, index_name: str) -> Path:
         """Return the filesystem path for an index JSON file."""
         return self.db_dir / "indexes" / f"{index_name}.json"
@@ -114,6 +194,7 @@ class Executor:
             name=meta.name,
             table_name=meta.table_name,
             column_name=meta.column_name,
+            column_names=meta.column_names,
         )
         self.index_cache[meta.name] = idx
         return idx
@@ -130,6 +211,25 @@ class Executor:
         """
         return [self._open_index(m) for m in table.indexes.values()]
 
+    def _key_indexes(self, table: TableMeta) -> dict[str, HashIndex]:
+        """
+        Single-column indexes on PRIMARY KEY / UNIQUE columns, by column.
+
+        Args:
+            table: Table metadata.
+
+        Returns:
+            Dict column name -> HashIndex (first such index per column).
+        """
+        out: dict[str, HashIndex] = {}
+        for m in table.indexes.values():
+            if len(m.column_names) != 1 or m.column_name in out:
+                continue
+            col_def = table.get_column(m.column_name)
+            if col_def is not None and (col_def.primary_key or col_def.unique):
+                out[m.column_name] = self._open_index(m)
+        return out
+
     # --------------------------
     # DDL
     # --------------------------
@@ -147,12 +247,13 @@ class Executor:
         """
         self.catalog.validate_create_table(stmt.table_name, stmt.columns)
 
-        table = TableMeta(name=stmt.table_name, columns=stmt.columns, indexes={})
+        table = TableMeta(name=stmt.table_name, columns=list(stmt.columns), indexes={})
         self.catalog.tables[stmt.table_name] = table
         self.catalog.save(self.db_dir)
 
-        # Ensure storage exists
-        HeapTable.open(self.db_dir, stmt.table_name)
+        # Ensure storage exists (drop any handle cached under this name)
+        self.heap_cache.pop(stmt.table_name, None)
+        self._get_heap(stmt.table_name)
 
         return CommandOk(rows_affected=0, message=f"Table created: {stmt.table_name}")
 
@@ -167,9 +268,14 @@ class Executor:
         Returns:
             CommandOk
         """
-        self.catalog.validate_create_index(stmt.index_name, stmt.table_name, stmt.column_name)
+        self.catalog.validate_create_index(stmt.index_name, stmt.table_name, stmt.column_names)
 
-        idx_meta = IndexMeta(name=stmt.index_name, table_name=stmt.table_name, column_name=stmt.column_name)
+        idx_meta = IndexMeta(
+            name=stmt.index_name,
+            table_name=stmt.table_name,
+            column_name=stmt.column_name,
+            column_names=list(stmt.column_names),
+        )
         self.catalog.indexes[stmt.index_name] = idx_meta
 
         table = self.catalog.require_table(stmt.table_name)
@@ -177,18 +283,42 @@ class Executor:
         self.catalog.save(self.db_dir)
 
         # Build index from storage
-        heap = HeapTable.open(self.db_dir, stmt.table_name)
+        heap = self._get_heap(stmt.table_name)
         idx = self._open_index(idx_meta)
         idx.clear()
         for row in heap.scan_active():
-            idx.add(row.get(stmt.column_name), int(row["_rid"]))
+            idx.add(idx.key_of(row), row["_rid"])
         idx.save()
 
         return CommandOk(
             rows_affected=0,
-            message=f"Index created and built: {stmt.index_name} ON {stmt.table_name}({stmt.column_name})",
+            message=f"Index created and built: {stmt.index_name} ON {stmt.table_name}({', '.join(stmt.column_names)})",
         )
 
+    def _add_column(self, stmt: AlterTableAddColumn) -> CommandOk:
+        """
+        ALTER TABLE ... ADD COLUMN execution.
+
+        - Validates the new column against the table and its current contents
+        - Adds the column to TableMeta + persists catalog.json
+
+        Heap rows are not rewritten: a row without the column reads it as NULL
+        (rows are dicts and every reader uses .get()), so this is O(1) in the
+        table size.
+
+        Returns:
+            CommandOk
+        """
+        table = self.catalog.require_table(stmt.table_name)
+        heap = self._get_heap(stmt.table_name)
+        has_rows = next(iter(heap.scan_active()), None) is not None
+        self.catalog.validate_add_column(stmt.table_name, stmt.column, has_rows)
+
+        table.add_column(stmt.column)
+        self.catalog.save(self.db_dir)
+
+        return CommandOk(rows_affected=0, message=f"Column added: {stmt.table_name}.{stmt.column.name}")
+
     # --------------------------
     # validation helpers
     # --------------------------
@@ -204,33 +334,7 @@ class Executor:
         Raises:
             ExecutionError on type mismatch.
         """
-        for col_def in table.columns:
-            if col_def.name not in row:
-                continue
-            val = row[col_def.name]
-            if val is None:
-                continue
-
-            t = col_def.typ.name.upper()
-
-            if t == "INTEGER":
-                # bool is a subclass of int in Python, so explicitly reject.
-                if not isinstance(val, int) or isinstance(val, bool):
-                    raise ExecutionError(f"Type error: {table.name}.{col_def.name} expects INTEGER")
-            elif t in ("TEXT", "DATE", "VARCHAR"):
-                if not isinstance(val, str):
-                    raise ExecutionError(f"Type error: {table.name}.{col_def.name} expects TEXT/DATE")
-                if t == "VARCHAR":
-                    max_len = col_def.typ.params[0]
-                    if len(val) > max_len:
-                        raise ExecutionError(
-                            f"Type error: {table.name}.{col_def.name} exceeds VARCHAR({max_len})"
-                        )
-            elif t == "BOOLEAN":
-                if not isinstance(val, bool):
-                    raise ExecutionError(f"Type error: {table.name}.{col_def.name} expects BOOLEAN")
-            else:
-                raise ExecutionError(f"Unsupported type: {t}")
+        table.validate_row(row)
 
     def _resolve_col_single_table(self, table_name: str, colref: ColumnRef, ctx: str) -> str:
         """
@@ -251,27 +355,58 @@ class Executor:
             raise ExecutionError(f"{ctx}: column qualifier {colref.table}.{colref.column} does not match {table_name}")
         return colref.column
 
-    def _row_matches_where_single_table(self, table_name: str, row: dict[str, Any], where) -> bool:
+    def _where_pairs(self, table_name: str, where) -> list[tuple[str, Any]]:
         """
-        Evaluate WHERE conditions against a single-table row dict.
+        Resolve a single-table WHERE clause to (column, constant) equality pairs.
 
         Args:
             table_name: Table in scope.
-            row: Row dict (includes _rid and columns).
             where: WhereClause or None.
 
         Returns:
-            True if all conditions match.
+            Pairs in WHERE order (empty if there is no WHERE).
+
+        Raises:
+            ExecutionError on unsupported operators or mismatched qualifiers.
         """
         if where is None:
-            return True
+            return []
+        pairs: list[tuple[str, Any]] = []
         for cond in where.conditions:
             if cond.op != "=":
                 raise ExecutionError("Only '=' is supported in WHERE")
-            col = self._resolve_col_single_table(table_name, cond.left, "WHERE")
-            if row.get(col) != cond.right:
-                return False
-        return True
+            pairs.append((self._resolve_col_single_table(table_name, cond.left, "WHERE"), cond.right))
+        return pairs
+
+    def _where_predicate(self, table_name: str, where) -> Callable[[dict[str, Any]], bool] | None:
+        """
+        Compile a single-table WHERE clause into a row predicate.
+
+        Columns and constants are resolved once per statement, so the per-row
+        work is only the dict lookups and comparisons.
+
+        Args:
+            table_name: Table in scope.
+            where: WhereClause or None.
+
+        Returns:
+            Predicate over row dicts, or None if every row matches (no WHERE).
+
+        Raises:
+            ExecutionError on unsupported operators or mismatched qualifiers.
+        """
+        if where is None:
+            return None
+        pairs = self._where_pairs(table_name, where)
+
+        # Specialise the common shapes: one or two equality predicates
+        if len(pairs) == 1:
+            (c1, v1), = pairs
+            return lambda row: row.get(c1) == v1
+        if len(pairs) == 2:
+            (c1, v1), (c2, v2) = pairs
+            return lambda row: row.get(c1) == v1 and row.get(c2) == v2
+        return lambda row: all(row.get(c) == v for c, v in pairs)
 
     # --------------------------
     # constraint enforcement
@@ -280,9 +415,10 @@ class Executor:
     def _enforce_constraints_batch(
         self,
         table: TableMeta,
-        existing_rows: list[dict[str, Any]],
+        existing_rows: Iterable[dict[str, Any]],
         new_rows: list[dict[str, Any]],
         exclude_rids: set[int],
+        key_columns: Collection[str] | None = None,
     ) -> None:
         """
         Enforce NOT NULL / PRIMARY KEY / UNIQUE constraints for a batch of new rows.
@@ -293,33 +429,67 @@ class Executor:
 
         Args:
             table: Table metadata.
-            existing_rows: Active rows currently in table (including _rid).
+            existing_rows: Active rows currently in table (including _rid). May be
+                a lazy scan: it is consumed once, and not at all if every
+                PRIMARY KEY / UNIQUE column has a single-column index.
             new_rows: Candidate logical rows (no _rid required).
             exclude_rids: Existing rids to ignore during conflict checks (rows being updated).
+            key_columns: Only check PRIMARY KEY / UNIQUE conflicts on these
+                columns (None: all). UPDATE passes its SET columns: a key the
+                statement does not assign keeps its (already unique) values.
 
         Raises:
             ConstraintError if a constraint is violated.
         """
-        # Existing rows excluding those we are replacing (UPDATE case)
-        existing_kept = [r for r in existing_rows if int(r.get("_rid")) not in exclude_rids]
-
         # NOT NULL + PK implies NOT NULL
+        required = table.required_columns()
         for nr in new_rows:
-            for c in table.columns:
-                if c.not_null or c.primary_key:
-                    if nr.get(c.name) is None:
-                        if c.primary_key:
-                            raise ConstraintError(f"PRIMARY KEY column cannot be NULL: {table.name}.{c.name}")
-                        raise ConstraintError(f"NOT NULL constraint failed: {table.name}.{c.name}")
+            for c in required:
+                if nr.get(c.name) is None:
+                    if c.primary_key:
+                        raise ConstraintError(f"PRIMARY KEY column cannot be NULL: {table.name}.{c.name}")
+                    raise ConstraintError(f"NOT NULL constraint failed: {table.name}.{c.name}")
 
-        # PRIMARY KEY uniqueness (single column)
         pk_col = table.primary_key_column()
+        unique_cols = list(table.unique_columns())
+        if key_columns is not None:
+            if pk_col not in key_columns:
+                pk_col = None
+            unique_cols = [c for c in unique_cols if c in key_columns]
+        key_cols = ([pk_col] if pk_col is not None else []) + unique_cols
+        if not key_cols:
+            return
+
+        # Key columns with a single-column index are checked by index lookup
+        # (O(1) per new row); the others need the existing values.
+        key_indexes = self._key_indexes(table)
+        existing_vals: dict[str, set[Any]] = {c: set() for c in key_cols if c not in key_indexes}
+
+        # One pass over existing rows (minus those being replaced) collects the
+        # values of every unindexed key column. NULLs never conflict: new PKs are
+        # non-NULL (checked above) and UNIQUE ignores NULLs.
+        if existing_vals:
+            val_sets = list(existing_vals.items())
+            for r in existing_rows:
+                if exclude_rids and r["_rid"] in exclude_rids:
+                    continue
+                for col, vals in val_sets:
+                    v = r.get(col)
+                    if v is not None:
+                        vals.add(v)
+
+        def exists(col: str, value: Any) -> bool:
+            idx = key_indexes.get(col)
+            if idx is not None:
+                return idx.contains(value, exclude_rids)
+            return value in existing_vals[col]
+
+        # PRIMARY KEY uniqueness (single column)
         if pk_col is not None:
-            existing_pks = {r.get(pk_col) for r in existing_kept}
             seen_new: set[Any] = set()
             for nr in new_rows:
                 pk_val = nr.get(pk_col)
-                if pk_val in existing_pks:
+                if exists(pk_col, pk_val):
                     raise ConstraintError(
                         f"PRIMARY KEY constraint failed: duplicate value {pk_val!r} for {table.name}.{pk_col}"
                     )
@@ -330,15 +500,13 @@ class Executor:
                 seen_new.add(pk_val)
 
         # UNIQUE uniqueness (NULLs ignored)
-        unique_cols = [c.name for c in table.columns if c.unique]
         for ucol in unique_cols:
-            existing_vals = {r.get(ucol) for r in existing_kept if r.get(ucol) is not None}
             seen_new_vals: set[Any] = set()
             for nr in new_rows:
                 v = nr.get(ucol)
                 if v is None:
                     continue
-                if v in existing_vals:
+                if exists(ucol, v):
                     raise ConstraintError(
                         f"UNIQUE constraint failed: duplicate value {v!r} for {table.name}.{ucol}"
                     )
@@ -361,9 +529,11 @@ class Executor:
         Attempt to choose an index to reduce candidates for WHERE.
 
         Strategy:
-        - For each condition of form col = literal, if there is an index on `col`,
-          compute candidate rid list from that index.
-        - Choose the smallest candidate list.
+        - Collect conditions of form col = literal on this table.
+        - An index is usable if every one of its key columns is bound that way
+          (single-column indexes need one condition, composite ones need all).
+        - Choose the smallest candidate list; on a tie, the index with more key
+          columns (it already applies more of the WHERE clause).
 
         Args:
             table: Table metadata.
@@ -375,50 +545,136 @@ class Executor:
         if where is None:
             return None
 
-        best: tuple[str, list[int]] | None = None
-
+        # col -> literal for equality predicates on this table
+        bound: dict[str, Any] = {}
         for cond in where.conditions:
             if cond.op != "=":
                 continue
             # Ignore conditions qualified to some other table
             if cond.left.table is not None and cond.left.table != table.name:
                 continue
+            bound.setdefault(cond.left.column, cond.right)
+
+        best: tuple[str, list[int]] | None = None
+        best_width = 0
 
-            col = cond.left.column
-            idx_meta = next((m for m in table.indexes.values() if m.column_name == col), None)
-            if idx_meta is None:
+        for idx_meta in table.indexes.values():
+            cols = idx_meta.column_names
+            if not all(c in bound for c in cols):
                 continue
 
-            idx = self._open_index(idx_meta)
-            rids = idx.lookup(cond.right)
+            key = bound[cols[0]] if len(cols) == 1 else tuple(bound[c] for c in cols)
+            rids = self._open_index(idx_meta).lookup(key)
 
-            if best is None or len(rids) < len(best[1]):
+            if (
+                best is None
+                or len(rids) < len(best[1])
+                or (len(rids) == len(best[1]) and len(cols) > best_width)
+            ):
                 best = (idx_meta.name, rids)
+                best_width = len(cols)
 
         return best
 
-    def _fetch_rows_by_candidates(
-        self,
-        heap: HeapTable,
-        rids: list[int],
-    ) -> list[dict[str, Any]]:
+    def _unique_bound(self, table: TableMeta, where) -> tuple[str, Any] | None:
         """
-        Fetch rows for a candidate rid list using heap.get_by_rid.
+        Find a WHERE equality on a PRIMARY KEY or UNIQUE column.
 
         Args:
-            heap: HeapTable.
-            rids: Candidate row ids.
+            table: Table metadata.
+            where: WhereClause or None.
 
         Returns:
-            List of row dicts for those rids that still exist and are not deleted.
+            (column, value), or None. `col = NULL` never qualifies: UNIQUE
+            allows several NULLs.
         """
-        out: list[dict[str, Any]] = []
-        for rid in rids:
-            row = heap.get_by_rid(rid)
-            if row is None:
+        if where is None:
+            return None
+        for cond in where.conditions:
+            if cond.op != "=" or cond.right is None:
                 continue
-            out.append(row)
-        return out
+            if cond.left.table is not None and cond.left.table != table.name:
+                continue
+            col_def = table.get_column(cond.left.column)
+            if col_def is not None and (col_def.primary_key or col_def.unique):
+                return col_def.name, cond.right
+        return None
+
+    def _column_equality(self, table: TableMeta, where) -> tuple[str, Any] | None:
+        """
+        Find a WHERE equality on a non-key column of this table.
+
+        Any column type works: the column vector is searched with ==, like
+        the row filter, which still runs on the rows it returns.
+
+        PRIMARY KEY / UNIQUE equalities are left to the scan, which stops at
+        the single possible match (and usually have an index anyway).
+
+        Args:
+            table: Table metadata.
+            where: WhereClause or None.
+
+        Returns:
+            (column, value) of the first such condition, or None.
+        """
+        if where is None:
+            return None
+        for cond in where.conditions:
+            if cond.op != "=":
+                continue
+            if cond.left.table is not None and cond.left.table != table.name:
+                continue
+            col_def = table.get_column(cond.left.column)
+            if col_def is None or col_def.primary_key or col_def.unique:
+                continue
+            return col_def.name, cond.right
+        return None
+
+    def _candidate_rows(self, table: TableMeta, heap: HeapTable, where) -> tuple[Iterable[dict[str, Any]], dict[str, Any]]:
+        """
+        Rows that may satisfy WHERE (a superset), produced lazily.
+
+        Plans:
+        - index: fetch the chosen index's candidate rids
+        - scan over a column vector: with an equality on a non-key column,
+          matching rids come from the heap's in-memory column
+          (stats["column"]) and only those rows are read
+        - scan: full heap scan
+        Either way, if WHERE binds a PRIMARY KEY / UNIQUE column, the stream
+        stops at the row holding that value (at most one row can match).
+
+        Args:
+            table: Table metadata.
+            heap: Table storage.
+            where: WhereClause or None.
+
+        Returns:
+            (rows, stats) where stats describes the plan.
+        """
+        chosen = self._choose_index_candidates(table, where)
+        unique = self._unique_bound(table, where)
+        col_eq = self._column_equality(table, where) if chosen is None else None
+        # Building a column vector costs one full scan; with a unique key bound
+        # the early-stopping scan is cheaper unless the vector already exists.
+        if col_eq is not None and unique is not None and col_eq[0] not in heap.columns:
+            col_eq = None
+
+        if chosen is not None:
+            idx_name, rids = chosen
+            rows: Iterable[dict[str, Any]] = heap.get_many(rids)
+            stats: dict[str, Any] = {"plan": "index", "index": idx_name, "candidates": len(rids)}
+        elif col_eq is not None:
+            col, value = col_eq
+            rids = heap.rids_where_equal(col, value)
+            rows = heap.get_many(rids)
+            stats = {"plan": "scan", "column": col, "candidates": len(rids)}
+        else:
+            rows = heap.scan_active()
+            stats = {"plan": "scan"}
+
+        if unique is not None:
+            rows = _stop_after_key(rows, *unique)
+        return rows, stats
 
     # --------------------------
     # DML: INSERT
@@ -426,19 +682,22 @@ class Executor:
 
     def _insert(self, stmt: Insert) -> CommandOk:
         """
-        INSERT execution.
+        INSERT execution (one or more VALUES rows).
 
         - Validates table and columns
-        - Builds a full row dict with missing columns as None
-        - Type checks
-        - Constraint enforcement (NOT NULL / PK / UNIQUE)
-        - Appends row to heap storage and updates indexes
+        - Builds a full row dict per VALUES row with missing columns as None
+        - Type checks every row
+        - Constraint enforcement (NOT NULL / PK / UNIQUE) once for the whole batch
+        - Appends rows to heap storage and updates indexes
+
+        The statement is all-or-nothing: every check runs before any row is
+        written.
 
         Returns:
-            CommandOk(rows_affected=1)
+            CommandOk(rows_affected=N)
         """
         table = self.catalog.require_table(stmt.table_name)
-        heap = HeapTable.open(self.db_dir, stmt.table_name)
+        heap = self._get_heap(stmt.table_name)
 
         # Validate referenced columns
         cols_set = table.column_names()
@@ -446,25 +705,28 @@ class Executor:
             if c not in cols_set:
                 raise ExecutionError(f"Unknown column in INSERT: {stmt.table_name}.{c}")
 
-        # Build full row with all columns
-        row: dict[str, Any] = {c.name: None for c in table.columns}
-        for c, v in zip(stmt.columns, stmt.values):
-            row[c] = v
+        # Build full rows with all columns
+        template: dict[str, Any] = {c.name: None for c in table.columns}
+        rows: list[dict[str, Any]] = []
+        for values in stmt.rows():
+            row = dict(template)
+            row.update(zip(stmt.columns, values))
+            self._validate_types(table, row)
+            rows.append(row)
 
-        # Type + constraint checks
-        self._validate_types(table, row)
-        existing = list(heap.scan_active())
-        self._enforce_constraints_batch(table, existing_rows=existing, new_rows=[row], exclude_rids=set())
+        # Constraint checks: one sweep for the whole batch
+        self._enforce_constraints_batch(table, existing_rows=heap.scan_active(), new_rows=rows, exclude_rids=set())
 
-        # Write row and update indexes
-        rid = heap.insert(row)
+        # Write rows and update indexes
+        rids = heap.insert_many(rows)
         indexes = self._table_indexes(table)
         for idx in indexes:
-            idx.add(row.get(idx.column_name), rid)
-        for idx in indexes:
+            for row, rid in zip(rows, rids):
+                idx.add(idx.key_of(row), rid)
             idx.save()
 
-        return CommandOk(rows_affected=1, message="1 row inserted")
+        n = len(rows)
+        return rows_ok(n, "{n} row inserted" if n == 1 else "{n} rows inserted")
 
     # --------------------------
     # DML: SELECT (single table or JOIN)
@@ -492,56 +754,65 @@ class Executor:
         """
         Execute a SELECT without JOINs (single-table query).
 
-        Uses index if possible for WHERE equality predicates.
+        Uses index if possible for WHERE equality predicates, then applies
+        ORDER BY / LIMIT. Filtering and projection always run in one compiled
+        per-shape loop (codegen.py), so rows that fail WHERE are never copied.
         """
         table = self.catalog.require_table(stmt.from_table)
-        heap = HeapTable.open(self.db_dir, stmt.from_table)
+        heap = self._get_heap(stmt.from_table)
+
+        table_cols = table.column_names()
 
         # Determine output columns
         if stmt.columns is None:
             out_cols = [c.name for c in table.columns]
         else:
             out_cols = []
-            table_cols = table.column_names()
             for c in stmt.columns:
                 col = self._resolve_col_single_table(stmt.from_table, c, "SELECT")
                 if col not in table_cols:
                     raise ExecutionError(f"Unknown column in SELECT: {stmt.from_table}.{col}")
                 out_cols.append(col)
 
-        # Choose index plan if possible
-        chosen = self._choose_index_candidates(table, stmt.where)
-        rows_out: list[list[Any]] = []
-
-        if chosen is not None:
-            idx_name, rids = chosen
-            candidate_rows = self._fetch_rows_by_candidates(heap, rids)
-
-            for row in candidate_rows:
-                if not self._row_matches_where_single_table(stmt.from_table, row, stmt.where):
-                    continue
-                rows_out.append([row.get(c) for c in out_cols])
-
-            return QueryResult(
-                columns=out_cols,
-                rows=rows_out,
-                stats={"plan": "index", "index": idx_name, "candidates": len(rids)},
-            )
-
-        # Fallback scan plan
-        for row in heap.scan_active():
-            if not self._row_matches_where_single_table(stmt.from_table, row, stmt.where):
-                continue
-            rows_out.append([row.get(c) for c in out_cols])
-
-        return QueryResult(columns=out_cols, rows=rows_out, stats={"plan": "scan"})
+        # Resolve ORDER BY columns
+        sort_cols: list[tuple[str, bool]] = []
+        for item in stmt.order_by:
+            col = self._resolve_col_single_table(stmt.from_table, item.column, "ORDER BY")
+            if col not in table_cols:
+                raise ExecutionError(f"Unknown column in ORDER BY: {stmt.from_table}.{col}")
+            sort_cols.append((col, item.descending))
+
+        # Index plan if possible, else scan; lazy so LIMIT / unique keys stop early
+        source, stats = self._candidate_rows(table, heap, stmt.where)
+        where_pairs = self._where_pairs(stmt.from_table, stmt.where)
+
+        if not sort_cols:
+            # Filter + project + LIMIT in one generated loop (see codegen.py)
+            rows_out = run_scan(source, where_pairs, out_cols, stmt.limit)
+            return QueryResult(columns=out_cols, rows=rows_out, stats=stats)
+
+        # Same fused loop, projecting any ORDER BY columns the output lacks
+        # after the output columns; rows are sorted by position and trimmed.
+        width = len(out_cols)
+        scan_cols = out_cols + [c for c in dict.fromkeys(c for c, _ in sort_cols) if c not in out_cols]
+        pos = {c: i for i, c in reversed(list(enumerate(scan_cols)))}
+        sort_keys = [(itemgetter(pos[c]), desc) for c, desc in sort_cols]
+
+        rows_out = run_scan(source, where_pairs, scan_cols, None)
+        if stmt.limit is not None:
+            rows_out = _top_rows(rows_out, sort_keys, stmt.limit)
+        else:
+            rows_out = _sort_rows(rows_out, sort_keys)
+        if len(scan_cols) > width:
+            rows_out = [r[:width] for r in rows_out]
+        return QueryResult(columns=out_cols, rows=rows_out, stats=stats)
 
     def _select_join(self, stmt: Select) -> QueryResult:
         """
         Execute a SELECT with one or more JOIN clauses.
 
         Implementation:
-        - Seed intermediate combined rows from base table (qualified keys)
+        - Seed positional combined rows from base table, laid out by (table, column) keys
         - Apply join steps sequentially using join.inner_join()
         - Apply WHERE on combined rows
         - Project selected columns
@@ -551,66 +822,66 @@ class Executor:
           to avoid ambiguity.
         """
         base_table = self.catalog.require_table(stmt.from_table)
-        base_heap = HeapTable.open(self.db_dir, stmt.from_table)
-
-        # Seed combined rows from base table
-        combined_rows: list[CombinedRow] = []
-        for r in base_heap.scan_active():
-            cr: CombinedRow = {}
-            for k, v in r.items():
-                if k == "_rid":
-                    continue
-                cr[(stmt.from_table, k)] = v
-            combined_rows.append(cr)
+        base_heap = self._get_heap(stmt.from_table)
+
+        # Seed combined rows from base table, positional by schema columns
+        # (pre-ALTER rows expose added columns as NULL)
+        base_cols = [c.name for c in base_table.columns]
+        keys: JoinKeys = [(stmt.from_table, c) for c in base_cols]
+        combined_rows: list[CombinedRow] = run_scan(base_heap.scan_active(), [], base_cols, None)
 
         plan_steps: list[dict[str, Any]] = []
         for j in stmt.joins:
-            combined_rows, step = inner_join(
+            combined_rows, keys, step = inner_join(
                 catalog=self.catalog,
                 db_dir=self.db_dir,
                 index_cache=self.index_cache,
+                heap_cache=self.heap_cache,
                 left_rows=combined_rows,
+                left_keys=keys,
                 join=j,
             )
             plan_steps.append({"right_table": step.right_table, "method": step.method, "index": step.index_name})
 
         # Apply WHERE after joins
-        combined_rows = [r for r in combined_rows if where_matches(r, stmt.where)]
+        pred = where_filter(keys, stmt.where)
+        if pred is not None:
+            combined_rows = list(filter(pred, combined_rows))
+
+        # ORDER BY / LIMIT on joined rows (before projection, so keys need not be selected)
+        if stmt.order_by:
+            join_keys = [
+                (lambda r, i=resolve_position(keys, item.column): r[i], item.descending) for item in stmt.order_by
+            ]
+            if stmt.limit is not None:
+                combined_rows = _top_rows(combined_rows, join_keys, stmt.limit)
+            else:
+                _sort_rows(combined_rows, join_keys)
+        elif stmt.limit is not None:
+            combined_rows = combined_rows[: stmt.limit]
 
         # Output projection
+        positions = {k: i for i, k in enumerate(keys)}
         if stmt.columns is None:
             # SELECT * => all columns from base + join tables, qualified
-            out_cols: list[str] = []
-            out_cols += [f"{stmt.from_table}.{c.name}" for c in base_table.columns]
-
-            for j in stmt.joins:
-                t = self.catalog.require_table(j.table_name)
-                out_cols += [f"{j.table_name}.{c.name}" for c in t.columns]
-
-            rows_out: list[list[Any]] = []
-            for r in combined_rows:
-                vals: list[Any] = []
-                for qc in out_cols:
-                    tname, cname = qc.split(".", 1)
-                    vals.append(r.get((tname, cname)))
-                rows_out.append(vals)
-
-            return QueryResult(
-                columns=out_cols,
-                rows=rows_out,
-                stats={"plan": "join", "steps": plan_steps, "rows": len(rows_out)},
-            )
-
-        # Explicit column list => require qualification
-        out_cols = []
-        for c in stmt.columns:
-            if c.table is None:
-                raise ExecutionError("In JOIN queries, qualify selected columns with table (e.g., users.id).")
-            out_cols.append(f"{c.table}.{c.column}")
+            out_cols = [f"{t}.{c}" for t, c in keys]
+            if len(positions) == len(keys):
+                rows_out: list[list[Any]] = combined_rows
+            else:
+                # Self-join: a repeated (table, column) reads its last occurrence
+                idxs = [positions[k] for k in keys]
+                rows_out = [[r[i] for i in idxs] for r in combined_rows]
+        else:
+            # Explicit column list => require qualification
+            out_cols = []
+            for c in stmt.columns:
+                if c.table is None:
+                    raise ExecutionError("In JOIN queries, qualify selected columns with table (e.g., users.id).")
+                out_cols.append(f"{c.table}.{c.column}")
 
-        rows_out = []
-        for r in combined_rows:
-            rows_out.append([r.get((c.table, c.column)) for c in stmt.columns])  # type: ignore[union-attr]
+            # Columns missing from the joined tables read as NULL
+            idxs = [positions.get((c.table, c.column)) for c in stmt.columns]  # type: ignore[misc]
+            rows_out = [[None if i is None else r[i] for i in idxs] for r in combined_rows]
 
         return QueryResult(
             columns=out_cols,
@@ -634,35 +905,28 @@ class Executor:
             CommandOk(rows_affected=N)
         """
         table = self.catalog.require_table(stmt.table_name)
-        heap = HeapTable.open(self.db_dir, stmt.table_name)
+        heap = self._get_heap(stmt.table_name)
         indexes = self._table_indexes(table)
 
         # Determine candidate rows using index if possible
-        chosen = self._choose_index_candidates(table, stmt.where)
-        if chosen is not None:
-            _, rids = chosen
-            candidates = self._fetch_rows_by_candidates(heap, rids)
-        else:
-            candidates = list(heap.scan_active())
+        candidates, _ = self._candidate_rows(table, heap, stmt.where)
 
-        matched: list[dict[str, Any]] = []
-        for row in candidates:
-            if self._row_matches_where_single_table(stmt.table_name, row, stmt.where):
-                matched.append(row)
+        pred = self._where_predicate(stmt.table_name, stmt.where)
+        matched = list(candidates if pred is None else filter(pred, candidates))
 
         # Apply deletions
         for row in matched:
-            rid = int(row["_rid"])
+            rid = row["_rid"]
             # Remove from indexes first (keeps index-backed queries correct)
             for idx in indexes:
-                idx.remove(row.get(idx.column_name), rid)
+                idx.remove(idx.key_of(row), rid)
             # Tombstone storage (keeps scan-backed queries correct)
             heap.tombstone(rid)
 
         for idx in indexes:
             idx.save()
 
-        return CommandOk(rows_affected=len(matched), message=f"{len(matched)} rows deleted")
+        return rows_ok(len(matched), "{n} rows deleted")
 
     # --------------------------
     # DML: UPDATE
@@ -686,7 +950,7 @@ class Executor:
             CommandOk(rows_affected=N)
         """
         table = self.catalog.require_table(stmt.table_name)
-        heap = HeapTable.open(self.db_dir, stmt.table_name)
+        heap = self._get_heap(stmt.table_name)
         indexes = self._table_indexes(table)
 
         table_cols = table.column_names()
@@ -697,24 +961,17 @@ class Executor:
                 raise ExecutionError(f"Unknown column in UPDATE: {stmt.table_name}.{a.column}")
 
         # Determine candidate rows using index if possible
-        chosen = self._choose_index_candidates(table, stmt.where)
-        if chosen is not None:
-            _, rids = chosen
-            candidates = self._fetch_rows_by_candidates(heap, rids)
-        else:
-            candidates = list(heap.scan_active())
+        candidates, _ = self._candidate_rows(table, heap, stmt.where)
 
         # Filter to rows that match full WHERE
-        to_update: list[dict[str, Any]] = []
-        for row in candidates:
-            if self._row_matches_where_single_table(stmt.table_name, row, stmt.where):
-                to_update.append(row)
+        pred = self._where_predicate(stmt.table_name, stmt.where)
+        to_update = list(candidates if pred is None else filter(pred, candidates))
 
         if not to_update:
-            return CommandOk(rows_affected=0, message="0 rows updated")
+            return rows_ok(0, "{n} rows updated")
 
         # Build new candidate rows and collect exclude_rids
-        exclude_rids = {int(r["_rid"]) for r in to_update}
+        exclude_rids = {r["_rid"] for r in to_update}
         new_rows: list[dict[str, Any]] = []
 
         for old in to_update:
@@ -729,29 +986,40 @@ class Executor:
             self._validate_types(table, candidate)
             new_rows.append(candidate)
 
-        # Constraint enforcement must consider existing active rows excluding old rids
-        existing_all = list(heap.scan_active())
+        # Constraint enforcement must consider existing active rows excluding old
+        # rids; keys the SET list leaves alone cannot start to conflict.
         self._enforce_constraints_batch(
             table,
-            existing_rows=existing_all,
+            existing_rows=heap.scan_active(),
             new_rows=new_rows,
             exclude_rids=exclude_rids,
+            key_columns={a.column for a in stmt.assignments},
         )
 
         # Apply updates
         for old, candidate in zip(to_update, new_rows):
-            old_rid = int(old["_rid"])
+            old_rid = old["_rid"]
             new_rid = heap.insert(candidate)
             heap.tombstone(old_rid)
 
             # Maintain indexes (remove old rid from old value, add new rid for new value)
             for idx in indexes:
-                old_val = old.get(idx.column_name)
-                new_val = candidate.get(idx.column_name)
-                idx.remove(old_val, old_rid)
-                idx.add(new_val, new_rid)
+                idx.remove(idx.key_of(old), old_rid)
+                idx.add(idx.key_of(candidate), new_rid)
 
         for idx in indexes:
             idx.save()
 
-        return CommandOk(rows_affected=len(to_update), message=f"{len(to_update)} rows updated")
\ No newline at end of file
+        return rows_ok(len(to_update), "{n} rows updated")
+
+
+# Statement type -> handler (one dict lookup per execute instead of an isinstance chain)
+_DISPATCH: dict[type, Callable[[Executor, Any], Any]] = {
+    CreateTable: Executor._create_table,
+    CreateIndex: Executor._create_index,
+    AlterTableAddColumn: Executor._add_column,
+    Insert: Executor._insert,
+    Select: Executor._select,
+    Update: Executor._update,
+    Delete: Executor._delete,
+}
@@ -5,7 +5,8 @@ JOIN execution logic for the SimpleDB mini-RDBMS.
 
 Responsibilities:
 - Implement INNER JOIN on equality: t1.col = t2.col
-- Produce combined rows as a mapping keyed by (table, column) tuples
+- Produce combined rows as positional lists, laid out by a list of
+  (table, column) keys that is computed once per join step
 - Support WHERE filtering on joined rows
 - Provide a simple plan step indicating whether an index-assisted join was used
 
@@ -17,12 +18,14 @@ Design notes:
 - This module is intentionally separated to keep Executor readable and modular.
 - We require qualified columns in JOIN ON (e.g., transactions.category_id = categories.id).
 - For SELECT on joined results, we recommend fully qualifying column names to avoid ambiguity.
+- Column references are resolved to row positions once per statement, so
+  unknown/ambiguous columns are reported even when no rows match.
 """
 
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Any, Iterable
+from typing import Any, Callable, Iterable
 
 from ..ast import ColumnRef, JoinClause, WhereClause
 from ..catalog import Catalog
@@ -30,59 +33,66 @@ from ..errors import ExecutionError
 from ..index.hash_index import HashIndex
 from ..storage.heap import HeapTable
 
-# Combined row representation: (table, column) -> value
-CombinedRow = dict[tuple[str, str], Any]
+# Combined row representation: values in the order of a JoinKeys list
+CombinedRow = list[Any]
 
+# (table, column) for each position of a CombinedRow
+JoinKeys = list[tuple[str, str]]
 
-def _resolve_in_combined(row: CombinedRow, colref: ColumnRef) -> Any:
+
+def resolve_position(keys: JoinKeys, colref: ColumnRef) -> int:
     """
-    Resolve a ColumnRef within a combined (joined) row.
+    Resolve a ColumnRef to its position in combined rows with layout `keys`.
 
     Args:
-        row: CombinedRow mapping (table, column) -> value.
+        keys: (table, column) per position of the combined rows.
         colref: Column reference; may or may not be qualified.
 
     Returns:
-        The value from the combined row.
+        Index into the combined rows. If a (table, column) pair occurs more
+        than once (self-join), the last occurrence wins.
 
     Raises:
         ExecutionError if the reference is unknown or ambiguous when unqualified.
     """
+    positions = {k: i for i, k in enumerate(keys)}
     if colref.table is not None:
-        key = (colref.table, colref.column)
-        if key not in row:
+        pos = positions.get((colref.table, colref.column))
+        if pos is None:
             raise ExecutionError(f"Unknown column in joined row: {colref.table}.{colref.column}")
-        return row[key]
+        return pos
 
     # Unqualified: require uniqueness across all joined tables.
-    matches = [(t, c) for (t, c) in row.keys() if c == colref.column]
+    matches = [k for k in positions if k[1] == colref.column]
     if not matches:
         raise ExecutionError(f"Unknown column: {colref.column}")
     if len(matches) > 1:
         raise ExecutionError(f"Ambiguous column: {colref.column} (qualify with table.)")
-    return row[matches[0]]
+    return positions[matches[0]]
 
 
-def where_matches(row: CombinedRow, where: WhereClause | None) -> bool:
+def where_filter(keys: JoinKeys, where: WhereClause | None) -> Callable[[CombinedRow], bool] | None:
     """
-    Evaluate a WHERE clause against a combined row.
+    Compile a WHERE clause into a predicate over combined rows.
 
     Args:
-        row: CombinedRow produced by JOIN pipeline.
+        keys: Layout of the combined rows.
         where: WhereClause or None.
 
     Returns:
-        True if the row satisfies all conditions; False otherwise.
+        Predicate, or None if every row matches (no WHERE).
+
+    Raises:
+        ExecutionError on unsupported operators or unknown/ambiguous columns.
     """
     if where is None:
-        return True
+        return None
+    pairs: list[tuple[int, Any]] = []
     for cond in where.conditions:
         if cond.op != "=":
             raise ExecutionError("Only '=' supported in WHERE")
-        left_val = _resolve_in_combined(row, cond.left)
-        if left_val != cond.right:
-            return False
-    return True
+        pairs.append((resolve_position(keys, cond.left), cond.right))
+    return lambda row: all(row[i] == v for i, v in pairs)
 
 
 @dataclass(frozen=True)
@@ -105,9 +115,11 @@ def inner_join(
     catalog: Catalog,
     db_dir,
     index_cache: dict[str, HashIndex],
+    heap_cache: dict[str, HeapTable],
     left_rows: Iterable[CombinedRow],
+    left_keys: JoinKeys,
     join: JoinClause,
-) -> tuple[list[CombinedRow], JoinPlanStep]:
+) -> tuple[list[CombinedRow], JoinKeys, JoinPlanStep]:
     """
     Perform one INNER JOIN step, joining left_rows with join.table_name.
 
@@ -115,17 +127,20 @@ def inner_join(
         catalog: Catalog for schema/index metadata.
         db_dir: Database directory Path.
         index_cache: Cache of opened HashIndex objects.
+        heap_cache: Cache of open HeapTable objects.
         left_rows: Intermediate combined rows from previous steps (or base table).
+        left_keys: Layout of left_rows.
         join: JoinClause defining right table and equality condition.
 
     Returns:
-        (joined_rows, join_plan_step)
+        (joined_rows, joined_keys, join_plan_step); joined rows are the left
+        row's values followed by the right table's columns.
 
     Raises:
         ExecutionError for invalid join definitions.
     """
     right_table = catalog.require_table(join.table_name)
-    right_heap = HeapTable.open(db_dir, join.table_name)
+    right_heap = HeapTable.open_cached(heap_cache, db_dir, join.table_name)
 
     # Determine which side of ON references the right table.
     # We require qualified ON columns for safety.
@@ -140,10 +155,16 @@ def inner_join(
             "JOIN ON must reference the joining table with qualification, e.g. t1.x = t2.y"
         )
 
-    # If the right join column has an index, do an index nested-loop join.
-    idx_meta = next((m for m in right_table.indexes.values() if m.column_name == right_col), None)
+    # If the right join column has a single-column index, do an index nested-loop join.
+    idx_meta = next((m for m in right_table.indexes.values() if m.column_names == [right_col]), None)
 
     out: list[CombinedRow] = []
+    append = out.append
+    # Schema columns, not row keys: rows written before ALTER TABLE ... ADD
+    # COLUMN lack the new key and must still expose it (as NULL).
+    right_cols = [c.name for c in right_table.columns]
+    out_keys = left_keys + [(join.table_name, c) for c in right_cols]
+    left_pos = resolve_position(left_keys, left_colref)
 
     if idx_meta is not None:
         idx = index_cache.get(idx_meta.name)
@@ -154,36 +175,25 @@ def inner_join(
                 name=idx_meta.name,
                 table_name=idx_meta.table_name,
                 column_name=idx_meta.column_name,
+                column_names=idx_meta.column_names,
             )
             index_cache[idx_meta.name] = idx
 
         for lrow in left_rows:
-            key_val = _resolve_in_combined(lrow, left_colref)
-            rids = idx.lookup(key_val)
-            for rid in rids:
+            for rid in idx.lookup(lrow[left_pos]):
                 r = right_heap.get_by_rid(rid)
                 if r is None:
                     continue  # deleted or missing
-                combined = dict(lrow)
-                for k, v in r.items():
-                    if k == "_rid":
-                        continue
-                    combined[(join.table_name, k)] = v
-                out.append(combined)
+                append(lrow + [r.get(c) for c in right_cols])
 
-        return out, JoinPlanStep(right_table=join.table_name, method="index", index_name=idx_meta.name)
+        return out, out_keys, JoinPlanStep(right_table=join.table_name, method="index", index_name=idx_meta.name)
 
     # Fallback: nested-loop scan join
-    right_rows = list(right_heap.scan_active())
+    right_rows = [(r.get(right_col), [r.get(c) for c in right_cols]) for r in right_heap.scan_active()]
     for lrow in left_rows:
-        key_val = _resolve_in_combined(lrow, left_colref)
-        for r in right_rows:
-            if r.get(right_col) == key_val:
-                combined = dict(lrow)
-                for k, v in r.items():
-                    if k == "_rid":
-                        continue
-                    combined[(join.table_name, k)] = v
-                out.append(combined)
-
-    return out, JoinPlanStep(right_table=join.table_name, method="scan", index_name=None)
\ No newline at end of file
+        key_val = lrow[left_pos]
+        for rkey, rvals in right_rows:
+            if rkey == key_val:
+                append(lrow + rvals)
+
+    return out, out_keys, JoinPlanStep(right_table=join.table_name, method="scan", index_name=None)
\ No newline at end of file
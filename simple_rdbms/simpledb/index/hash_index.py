@@ -10,17 +10,20 @@ Responsibilities:
     - add(value, rid)
     - remove(value, rid)
     - lookup(value) -> list[rid]
+    - contains(value, exclude_rids) -> bool
 
 Design notes:
 - This index is intentionally simple and only supports equality lookups.
 - Key encoding includes type information to avoid collisions (e.g., int 1 vs str "1").
 - We do not index NULL values (consistent with many SQL systems' index behavior).
+- Composite indexes key on a tuple of column values; a row with NULL in any key
+  column is not indexed.
 """
 
 from __future__ import annotations
 
 import json
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
 
@@ -39,10 +42,14 @@ def encode_key(value: Any) -> str:
           - i:123
           - s:hello
           - b:true
+          - t:["i:1","s:2024-01"] (composite key)
 
     Raises:
         ExecutionError if the type is unsupported.
     """
+    if isinstance(value, tuple):
+        # JSON keeps part boundaries unambiguous even if strings contain separators
+        return "t:" + json.dumps([encode_key(v) for v in value], separators=(",", ":"))
     if value is None:
         # We don't index NULLs, but returning a key is harmless if needed.
         return "n:null"
@@ -55,6 +62,13 @@ def encode_key(value: Any) -> str:
     raise ExecutionError(f"Unsupported index key type: {type(value).__name__}")
 
 
+def _has_null(value: Any) -> bool:
+    """True for NULL, or a composite key with any NULL part."""
+    if value is None:
+        return True
+    return isinstance(value, tuple) and None in value
+
+
 @dataclass
 class HashIndex:
     """
@@ -63,18 +77,32 @@ class HashIndex:
     Attributes:
         name: Index name.
         table_name: Table name.
-        column_name: Indexed column name.
+        column_name: First (or only) indexed column name.
         path: Path to JSON index file.
         mapping: Dict of encoded keys -> set of rids.
+        column_names: All key columns (composite if more than one).
     """
     name: str
     table_name: str
     column_name: str
     path: Path
     mapping: dict[str, set[int]]
+    column_names: list[str] = field(default_factory=list)
+
+    def __post_init__(self) -> None:
+        if not self.column_names:
+            self.column_names = [self.column_name]
 
     @classmethod
-    def open(cls, path: Path, *, name: str, table_name: str, column_name: str) -> "HashIndex":
+    def open(
+        cls,
+        path: Path,
+        *,
+        name: str,
+        table_name: str,
+        column_name: str,
+        column_names: list[str] | None = None,
+    ) -> "HashIndex":
         """
         Open an index from disk if it exists; otherwise create a new empty one.
 
@@ -83,6 +111,7 @@ class HashIndex:
             name: Index name.
             table_name: Target table.
             column_name: Indexed column.
+            column_names: Key columns for a composite index (defaults to [column_name]).
 
         Returns:
             HashIndex instance.
@@ -96,8 +125,16 @@ class HashIndex:
                 column_name=str(raw.get("column_name", column_name)),
                 path=path,
                 mapping=mp,
+                column_names=list(raw.get("column_names", column_names or [])),
             )
-        return cls(name=name, table_name=table_name, column_name=column_name, path=path, mapping={})
+        return cls(
+            name=name,
+            table_name=table_name,
+            column_name=column_name,
+            path=path,
+            mapping={},
+            column_names=list(column_names or []),
+        )
 
     def save(self) -> None:
         """
@@ -109,11 +146,26 @@ class HashIndex:
             "name": self.name,
             "table_name": self.table_name,
             "column_name": self.column_name,
+            "column_names": self.column_names,
             "mapping": {k: sorted(list(v)) for k, v in self.mapping.items()},
         }
         self.path.parent.mkdir(parents=True, exist_ok=True)
         self.path.write_text(json.dumps(out, indent=2, sort_keys=True), encoding="utf-8")
 
+    def key_of(self, row: dict[str, Any]) -> Any:
+        """
+        Extract this index's key from a row dict.
+
+        Args:
+            row: Row dict.
+
+        Returns:
+            The column value, or a tuple of values for a composite index.
+        """
+        if len(self.column_names) == 1:
+            return row.get(self.column_name)
+        return tuple(row.get(c) for c in self.column_names)
+
     def clear(self) -> None:
         """Remove all entries from the index in memory (call save() to persist)."""
         self.mapping.clear()
@@ -126,7 +178,7 @@ class HashIndex:
             value: Column value to index (NULL is ignored).
             rid: Row id to reference.
         """
-        if value is None:
+        if _has_null(value):
             return
         k = encode_key(value)
         self.mapping.setdefault(k, set()).add(int(rid))
@@ -139,7 +191,7 @@ class HashIndex:
             value: Column value (NULL is ignored).
             rid: Row id.
         """
-        if value is None:
+        if _has_null(value):
             return
         k = encode_key(value)
         s = self.mapping.get(k)
@@ -161,7 +213,27 @@ class HashIndex:
             Sorted list of rids matching the value.
             Returns empty list if value is NULL or no match.
         """
-        if value is None:
+        if _has_null(value):
             return []
         k = encode_key(value)
-        return sorted(self.mapping.get(k, set()))
\ No newline at end of file
+        return sorted(self.mapping.get(k, set()))
+
+    def contains(self, value: Any, exclude_rids: set[int] | frozenset[int] = frozenset()) -> bool:
+        """
+        Check whether any row other than `exclude_rids` has the given value.
+
+        Args:
+            value: Column value to check.
+            exclude_rids: Rids to ignore (rows being replaced by an UPDATE).
+
+        Returns:
+            True if a matching rid outside `exclude_rids` exists; False for NULL.
+        """
+        if _has_null(value):
+            return False
+        rids = self.mapping.get(encode_key(value))
+        if not rids:
+            return False
+        if not exclude_rids:
+            return True
+        return not rids <= exclude_rids
@@ -6,20 +6,25 @@ SQL-like tokenizer (lexer) for the SimpleDB mini-RDBMS.
 
 Responsibilities:
 - Convert an input SQL string into a list of tokens with line/column positions
+  (one precompiled master regex, dispatched on the matching group)
 - Recognize keywords, identifiers, literals, and punctuation used by our SQL subset
 - Provide reliable error messages for unexpected characters and unterminated strings
 
 Notes:
 - This is a deliberately small SQL subset.
-- String literals use single quotes: 'hello'
+- String literals use single quotes: 'hello'; a doubled quote escapes one: 'it''s'
 - Booleans: true/false (case-insensitive)
 - NULL is tokenized as a keyword; the parser/executor decide where it is valid.
+- '?' is a positional parameter placeholder (prepared statements); its token
+  value is the 0-based ordinal of the placeholder in the input.
 """
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+import re
 from enum import Enum, auto
+from sys import intern
+from typing import Any
 
 from .errors import Position, SqlSyntaxError
 
@@ -43,9 +48,13 @@ class TokenType(Enum):
     EQ = auto()       # =
     STAR = auto()     # *
     DOT = auto()      # .
+    PARAM = auto()    # ?
 
     # Keywords (subset)
     CREATE = auto()
+    ALTER = auto()
+    ADD = auto()
+    COLUMN = auto()
     TABLE = auto()
     INDEX = auto()
     INSERT = auto()
@@ -64,10 +73,18 @@ class TokenType(Enum):
     KEY = auto()
     UNIQUE = auto()
     NOT = auto()
+    ORDER = auto()
+    BY = auto()
+    ASC = auto()
+    DESC = auto()
+    LIMIT = auto()
 
 
 KEYWORDS: dict[str, TokenType] = {
     "CREATE": TokenType.CREATE,
+    "ALTER": TokenType.ALTER,
+    "ADD": TokenType.ADD,
+    "COLUMN": TokenType.COLUMN,
     "TABLE": TokenType.TABLE,
     "INDEX": TokenType.INDEX,
     "INSERT": TokenType.INSERT,
@@ -87,10 +104,14 @@ KEYWORDS: dict[str, TokenType] = {
     "UNIQUE": TokenType.UNIQUE,
     "NOT": TokenType.NOT,
     "NULL": TokenType.NULL,
+    "ORDER": TokenType.ORDER,
+    "BY": TokenType.BY,
+    "ASC": TokenType.ASC,
+    "DESC": TokenType.DESC,
+    "LIMIT": TokenType.LIMIT,
 }
 
 
-@dataclass(frozen=True)
 class Token:
     """
     A lexical token.
@@ -104,12 +125,109 @@ class Token:
                - STRING -> str (without quotes)
                - BOOL -> bool
                - NULL -> None
-        pos: Position in input (line/col)
+               - PARAM -> int (placeholder ordinal)
+        line: 1-based line of the token's first character
+        col: 1-based column of the token's first character
+
+    Notes:
+        Tokens are the most numerous objects the lexer makes, so this is a
+        plain __slots__ class: no per-instance dict and no frozen-dataclass
+        __setattr__ detour on construction. Treat tokens as immutable.
+        The Position used in error messages is built only when asked for (pos).
     """
-    typ: TokenType
-    lexeme: str
-    value: object | None
-    pos: Position
+
+    __slots__ = ("typ", "lexeme", "value", "line", "col")
+
+    def __init__(self, typ: TokenType, lexeme: str, value: Any, line: int, col: int) -> None:
+        self.typ = typ
+        self.lexeme = lexeme
+        self.value = value
+        self.line = line
+        self.col = col
+
+    @property
+    def pos(self) -> Position:
+        """Position in input (line/col)."""
+        return Position(line=self.line, col=self.col)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Token):
+            return NotImplemented
+        return (self.typ, self.lexeme, self.value, self.line, self.col) == (
+            other.typ, other.lexeme, other.value, other.line, other.col
+        )
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"Token({self.typ}, {self.lexeme!r}, {self.value!r}, line={self.line}, col={self.col})"
+
+
+# One master pattern, applied with finditer(). Each match is one token plus
+# the whitespace before it, so whitespace never costs a match of its own.
+# Groups are numbered and never nested, so m.lastindex is the number of the
+# group that matched (an int compare per token, not a group-name compare).
+# The last alternative takes any other non-space character, so finditer()
+# cannot skip input silently; it is reported as an error (an unterminated
+# string literal if it is a quote). Trailing whitespace matches nothing.
+# String literals use the unrolled form '[^']*(?:''[^']*)*': the regex engine
+# runs each quote-free stretch as one class loop, instead of an alternation
+# per character as (?:[^']|'')* would.
+# Digit and identifier runs are class loops in the same match, so there is no
+# per-character Python step left to replace with a translate()/find() mask.
+_TOKEN_RE = re.compile(
+    r"""
+    \s*
+    (?:
+        ([^\W\d]\w*)
+      | (\d+)
+      | ('[^']*(?:''[^']*)*')
+      | ([(),;=*.])
+      | (\?)
+      | (\S)
+    )
+    """,
+    re.VERBOSE,
+)
+_WORD, _INT, _STRING, _SYM, _PARAM, _OTHER = range(1, 7)
+
+_SYMBOLS: dict[str, TokenType] = {
+    "(": TokenType.LPAREN,
+    ")": TokenType.RPAREN,
+    ",": TokenType.COMMA,
+    ";": TokenType.SEMI,
+    "=": TokenType.EQ,
+    "*": TokenType.STAR,
+    ".": TokenType.DOT,
+}
+
+# Upper-cased words with a fixed token type and value (keywords, booleans, NULL)
+_WORDS: dict[str, tuple[TokenType, Any]] = {
+    **{kw: (typ, kw) for kw, typ in KEYWORDS.items()},
+    "TRUE": (TokenType.BOOL, True),
+    "FALSE": (TokenType.BOOL, False),
+    "NULL": (TokenType.NULL, None),
+}
+
+# Raw word -> (token type, value), so repeated words skip upper() and the
+# keyword lookup. Bounded: only the first WORD_CACHE_SIZE distinct words are
+# kept (queries reuse a small vocabulary of keywords and schema names).
+WORD_CACHE_SIZE = 4096
+_WORD_CACHE: dict[str, tuple[TokenType, Any]] = {}
+
+
+def _classify_word(lex: str) -> tuple[TokenType, Any]:
+    """
+    Token type and value of a word: keyword, boolean, NULL or identifier.
+
+    Identifiers are interned, so names in cached ASTs share the catalog's
+    string objects and compare by pointer.
+    """
+    # Keywords are usually written in capitals: skip the upper() copy then
+    fixed = _WORDS.get(lex if lex.isupper() else lex.upper())
+    if fixed is None:
+        return TokenType.IDENT, intern(lex)
+    return fixed
 
 
 def tokenize(sql: str) -> list[Token]:
@@ -124,129 +242,67 @@ def tokenize(sql: str) -> list[Token]:
 
     Raises:
         SqlSyntaxError: for unexpected characters or unterminated strings.
+
+    Notes:
+        A doubled quote inside a string literal is an escaped quote:
+        'O''Reilly' -> O'Reilly.
     """
+    # A bound append beats pre-sizing: [None] * estimate plus tokens[ti] = ...;
+    # ti += 1 measured ~45% slower per token (list growth is amortized, the
+    # extra index bookkeeping is not).
     tokens: list[Token] = []
-    i = 0
+    append = tokens.append
+    word_cache = _WORD_CACHE
+    symbols = _SYMBOLS
+
+    # Line/col bookkeeping: tokens come in offset order, so the line only has
+    # to move forward past each newline once (n stands in for "no more").
+    n = len(sql)
     line = 1
-    col = 1
-
-    def cur_pos() -> Position:
-        return Position(line=line, col=col)
-
-    def peek(offset: int = 0) -> str:
-        j = i + offset
-        if j >= len(sql):
-            return ""
-        return sql[j]
-
-    def advance(n: int = 1) -> None:
-        """Advance the cursor by n characters while tracking line/column."""
-        nonlocal i, line, col
-        for _ in range(n):
-            if i >= len(sql):
-                return
-            ch = sql[i]
-            i += 1
-            if ch == "\n":
-                line += 1
-                col = 1
-            else:
-                col += 1
-
-    while i < len(sql):
-        ch = peek(0)
-
-        # Skip whitespace
-        if ch.isspace():
-            advance(1)
-            continue
-
-        # Single-character symbols
-        if ch == "(":
-            tokens.append(Token(TokenType.LPAREN, ch, None, cur_pos()))
-            advance(1)
-            continue
-        if ch == ")":
-            tokens.append(Token(TokenType.RPAREN, ch, None, cur_pos()))
-            advance(1)
-            continue
-        if ch == ",":
-            tokens.append(Token(TokenType.COMMA, ch, None, cur_pos()))
-            advance(1)
-            continue
-        if ch == ";":
-            tokens.append(Token(TokenType.SEMI, ch, None, cur_pos()))
-            advance(1)
-            continue
-        if ch == "=":
-            tokens.append(Token(TokenType.EQ, ch, None, cur_pos()))
-            advance(1)
-            continue
-        if ch == "*":
-            tokens.append(Token(TokenType.STAR, ch, None, cur_pos()))
-            advance(1)
-            continue
-        if ch == ".":
-            tokens.append(Token(TokenType.DOT, ch, None, cur_pos()))
-            advance(1)
-            continue
-
-        # String literal: '...'
-        if ch == "'":
-            start = cur_pos()
-            advance(1)  # consume opening quote
-            buf: list[str] = []
-            while True:
-                if i >= len(sql):
-                    raise SqlSyntaxError("Unterminated string literal", start)
-                c = peek(0)
-                if c == "'":
-                    advance(1)  # consume closing quote
-                    break
-                # Note: escaping not supported in this minimal lexer.
-                buf.append(c)
-                advance(1)
-            s = "".join(buf)
-            tokens.append(Token(TokenType.STRING, f"'{s}'", s, start))
-            continue
-
-        # Integer literal
-        if ch.isdigit():
-            start = cur_pos()
-            j = i
-            while j < len(sql) and sql[j].isdigit():
-                j += 1
-            lex = sql[i:j]
-            tokens.append(Token(TokenType.INT, lex, int(lex), start))
-            advance(j - i)
-            continue
-
-        # Identifier / keyword / boolean / NULL
-        if ch.isalpha() or ch == "_":
-            start = cur_pos()
-            j = i
-            while j < len(sql) and (sql[j].isalnum() or sql[j] == "_"):
-                j += 1
-
-            lex = sql[i:j]
-            upper = lex.upper()
-
-            if upper == "TRUE":
-                tokens.append(Token(TokenType.BOOL, lex, True, start))
-            elif upper == "FALSE":
-                tokens.append(Token(TokenType.BOOL, lex, False, start))
-            elif upper == "NULL":
-                tokens.append(Token(TokenType.NULL, lex, None, start))
-            elif upper in KEYWORDS:
-                tokens.append(Token(KEYWORDS[upper], lex, upper, start))
-            else:
-                tokens.append(Token(TokenType.IDENT, lex, lex, start))
-
-            advance(j - i)
-            continue
-
-        # Unknown character
-        raise SqlSyntaxError(f"Unexpected character: {ch!r}", cur_pos())
-
-    tokens.append(Token(TokenType.EOF, "", None, Position(line=line, col=col)))
+    line_start = 0  # index of the first character of the current line
+    next_nl = sql.find("\n")
+    if next_nl < 0:
+        next_nl = n
+    n_params = 0
+
+    for m in _TOKEN_RE.finditer(sql):
+        kind: int = m.lastindex  # type: ignore[assignment]  # never None: every alternative is a group
+        i = m.start(kind)
+        lex = m.group(kind)
+        while i > next_nl:
+            line += 1
+            line_start = next_nl + 1
+            next_nl = sql.find("\n", line_start)
+            if next_nl < 0:
+                next_nl = n
+        col = i - line_start + 1
+
+        if kind == _WORD:
+            word = word_cache.get(lex)
+            if word is None:
+                word = _classify_word(lex)
+                if len(word_cache) < WORD_CACHE_SIZE:
+                    word_cache[lex] = word
+            typ, value = word
+            if typ is TokenType.IDENT:
+                lex = value  # the interned copy
+            append(Token(typ, lex, value, line, col))
+        elif kind == _SYM:
+            append(Token(symbols[lex], lex, None, line, col))
+        elif kind == _INT:
+            append(Token(TokenType.INT, lex, int(lex), line, col))
+        elif kind == _STRING:
+            append(Token(TokenType.STRING, lex, lex[1:-1].replace("''", "'"), line, col))
+        elif kind == _PARAM:
+            append(Token(TokenType.PARAM, lex, n_params, line, col))
+            n_params += 1
+        elif lex == "'":
+            raise SqlSyntaxError("Unterminated string literal", Position(line, col))
+        else:
+            raise SqlSyntaxError(f"Unexpected character: {lex!r}", Position(line, col))
+
+    # Newlines after the last token still count for the EOF position
+    line += sql.count("\n", line_start)
+    line_start = sql.rfind("\n") + 1
+    append(Token(TokenType.EOF, "", None, line, n - line_start + 1))
     return tokens
@@ -9,12 +9,16 @@ Responsibilities:
 - Support a minimal SQL subset:
     - CREATE TABLE
     - CREATE INDEX
-    - INSERT
-    - SELECT (with optional JOINs and WHERE)
+    - ALTER TABLE ... ADD [COLUMN]
+    - INSERT (one or more VALUES rows)
+    - SELECT (with optional JOINs, WHERE, ORDER BY and LIMIT)
     - UPDATE
     - DELETE
 - WHERE supports only equality predicates combined with AND.
 - Literals supported: INT, STRING, BOOL, NULL
+- '?' placeholders are accepted wherever a literal is, and as the LIMIT count.
+  parse_sql()/parse_script() reject them; prepared statements parse through
+  simpledb/prepared.py.
 
 Notes:
 - This parser does not attempt to be ANSI SQL compliant; it is intentionally small.
@@ -26,6 +30,7 @@ from __future__ import annotations
 from dataclasses import dataclass
 
 from .ast import (
+    AlterTableAddColumn,
     Assignment,
     ColumnDef,
     ColumnRef,
@@ -35,6 +40,8 @@ from .ast import (
     Delete,
     Insert,
     JoinClause,
+    OrderItem,
+    Param,
     Select,
     Statement,
     TypeSpec,
@@ -45,46 +52,51 @@ from .errors import Position, SqlSyntaxError
 from .lexer import Token, TokenType, tokenize
 
 
-@dataclass
+@dataclass(slots=True)
 class Parser:
     """
     Stateful parser over a token list.
 
     Attributes:
-        tokens: List of Token.
+        tokens: List of Token, terminated by an EOF token (as tokenize() returns).
         i: Current token index.
+
+    Notes:
+        The primitives below index self.tokens directly: the parser never
+        consumes past EOF (no grammar rule expects or matches EOF), so the
+        current index always points at a real token. Token types are enum
+        singletons and compare with `is`. Token values already have their AST
+        type (IDENT -> str, INT -> int, ...), so they are used without str()/int().
     """
     tokens: list[Token]
     i: int = 0
 
-    def peek(self, offset: int = 0) -> Token:
-        """Return the token at current index + offset without consuming."""
-        j = self.i + offset
-        if j >= len(self.tokens):
-            return self.tokens[-1]
-        return self.tokens[j]
+    def peek(self) -> Token:
+        """Return the current token without consuming it."""
+        return self.tokens[self.i]
 
     def at(self, typ: TokenType) -> bool:
         """Check whether current token is of a specific type."""
-        return self.peek().typ == typ
+        return self.tokens[self.i].typ is typ
 
     def consume(self) -> Token:
         """Consume and return the current token."""
-        t = self.peek()
+        t = self.tokens[self.i]
         self.i += 1
         return t
 
     def expect(self, typ: TokenType, msg: str) -> Token:
         """Consume a token of the expected type, otherwise raise syntax error."""
-        t = self.peek()
-        if t.typ != typ:
+        t = self.tokens[self.i]
+        if t.typ is not typ:
             raise SqlSyntaxError(msg, t.pos)
-        return self.consume()
+        self.i += 1
+        return t
 
     def match(self, typ: TokenType) -> bool:
         """If current token matches typ, consume it and return True."""
-        if self.at(typ):
-            self.consume()
+        if self.tokens[self.i].typ is typ:
+            self.i += 1
             return True
         return False
 
@@ -129,18 +141,11 @@ class Parser:
 
     def parse_statement(self) -> Statement:
         """Dispatch based on the first keyword token."""
-        t = self.peek()
-        if t.typ == TokenType.CREATE:
-            return self.parse_create()
-        if t.typ == TokenType.INSERT:
-            return self.parse_insert()
-        if t.typ == TokenType.SELECT:
-            return self.parse_select()
-        if t.typ == TokenType.UPDATE:
-            return self.parse_update()
-        if t.typ == TokenType.DELETE:
-            return self.parse_delete()
-        raise SqlSyntaxError(f"Unexpected token: {t.lexeme!r}", t.pos)
+        t = self.tokens[self.i]
+        parse = _STATEMENT_PARSERS.get(t.typ)
+        if parse is None:
+            raise SqlSyntaxError(f"Unexpected token: {t.lexeme!r}", t.pos)
+        return parse(self)
 
     # ---------------- CREATE ----------------
 
@@ -159,12 +164,24 @@ class Parser:
 
         raise SqlSyntaxError("Expected TABLE or INDEX after CREATE", self.peek().pos)
 
+    def parse_alter(self) -> AlterTableAddColumn:
+        """
+        Parse:
+          ALTER TABLE <name> ADD [COLUMN] <coldef>
+        """
+        self.expect(TokenType.ALTER, "Expected ALTER")
+        self.expect(TokenType.TABLE, "Expected TABLE after ALTER")
+        table = self.expect(TokenType.IDENT, "Expected table name").value
+        self.expect(TokenType.ADD, "Expected ADD after table name")
+        self.match(TokenType.COLUMN)
+        return AlterTableAddColumn(table_name=table, column=self.parse_column_def())
+
     def parse_create_table_after_keyword(self) -> CreateTable:
         """
         Parse:
           CREATE TABLE <name> ( <coldef>, <coldef>, ... )
         """
-        table = str(self.expect(TokenType.IDENT, "Expected table name").value)
+        table = self.expect(TokenType.IDENT, "Expected table name").value
         self.expect(TokenType.LPAREN, "Expected '(' after table name")
 
         cols: list[ColumnDef] = []
@@ -181,7 +198,7 @@ class Parser:
           <colname> <type> [NOT NULL] [UNIQUE] [PRIMARY KEY]
         Constraints may appear in any order.
         """
-        col_name = str(self.expect(TokenType.IDENT, "Expected column name").value)
+        col_name = self.expect(TokenType.IDENT, "Expected column name").value
         typ = self.parse_type_spec()
 
         not_null = False
@@ -220,13 +237,13 @@ class Parser:
           INTEGER
           VARCHAR(255)
         """
-        type_name = str(self.expect(TokenType.IDENT, "Expected type name").value).upper()
+        type_name = self.expect(TokenType.IDENT, "Expected type name").value.upper()
         params: list[int] = []
 
         if self.match(TokenType.LPAREN):
-            params.append(int(self.expect(TokenType.INT, "Expected integer type parameter").value))
+            params.append(self.expect(TokenType.INT, "Expected integer type parameter").value)
             while self.match(TokenType.COMMA):
-                params.append(int(self.expect(TokenType.INT, "Expected integer type parameter").value))
+                params.append(self.expect(TokenType.INT, "Expected integer type parameter").value)
             self.expect(TokenType.RPAREN, "Expected ')' after type parameters")
 
         return TypeSpec(name=type_name, params=params)
@@ -234,44 +251,55 @@ class Parser:
     def parse_create_index_after_keyword(self) -> CreateIndex:
         """
         Parse:
-          CREATE INDEX <idx_name> ON <table>(<column>)
+          CREATE INDEX <idx_name> ON <table>(<column> [, <column>]*)
         """
-        idx_name = str(self.expect(TokenType.IDENT, "Expected index name").value)
+        idx_name = self.expect(TokenType.IDENT, "Expected index name").value
         self.expect(TokenType.ON, "Expected ON after index name")
-        table = str(self.expect(TokenType.IDENT, "Expected table name").value)
+        table = self.expect(TokenType.IDENT, "Expected table name").value
         self.expect(TokenType.LPAREN, "Expected '(' after table name")
-        col = str(self.expect(TokenType.IDENT, "Expected column name").value)
+        cols = [self.expect(TokenType.IDENT, "Expected column name").value]
+        while self.match(TokenType.COMMA):
+            cols.append(self.expect(TokenType.IDENT, "Expected column name").value)
         self.expect(TokenType.RPAREN, "Expected ')' after column name")
-        return CreateIndex(index_name=idx_name, table_name=table, column_name=col)
+        return CreateIndex(index_name=idx_name, table_name=table, column_names=cols)
 
     # ---------------- INSERT ----------------
 
     def parse_insert(self) -> Insert:
         """
         Parse:
-          INSERT INTO table (c1, c2, ...) VALUES (v1, v2, ...)
+          INSERT INTO table (c1, c2, ...) VALUES (v1, v2, ...) [, (v1, v2, ...)]*
         """
         self.expect(TokenType.INSERT, "Expected INSERT")
         self.expect(TokenType.INTO, "Expected INTO after INSERT")
-        table = str(self.expect(TokenType.IDENT, "Expected table name").value)
+        table = self.expect(TokenType.IDENT, "Expected table name").value
 
         self.expect(TokenType.LPAREN, "Expected '(' before column list")
-        cols = [str(self.expect(TokenType.IDENT, "Expected column name").value)]
+        cols = [self.expect(TokenType.IDENT, "Expected column name").value]
         while self.match(TokenType.COMMA):
-            cols.append(str(self.expect(TokenType.IDENT, "Expected column name").value))
+            cols.append(self.expect(TokenType.IDENT, "Expected column name").value)
         self.expect(TokenType.RPAREN, "Expected ')' after column list")
 
         self.expect(TokenType.VALUES, "Expected VALUES")
+        rows = [self.parse_values_row(len(cols))]
+        while self.match(TokenType.COMMA):
+            rows.append(self.parse_values_row(len(cols)))
+
+        return Insert(table_name=table, columns=cols, values=rows[0], extra_rows=rows[1:])
+
+    def parse_values_row(self, ncols: int) -> list:
+        """
+        Parse one parenthesised VALUES row of exactly `ncols` literals.
+        """
         self.expect(TokenType.LPAREN, "Expected '(' before values")
         vals = [self.parse_literal()]
         while self.match(TokenType.COMMA):
             vals.append(self.parse_literal())
         self.expect(TokenType.RPAREN, "Expected ')' after values")
 
-        if len(cols) != len(vals):
+        if len(vals) != ncols:
             raise SqlSyntaxError("Number of columns does not match number of values", self.peek().pos)
-
-        return Insert(table_name=table, columns=cols, values=vals)
+        return vals
 
     # ---------------- SELECT (+ JOIN, WHERE) ----------------
 
@@ -279,11 +307,12 @@ class Parser:
         """
         Parse:
           SELECT <cols> FROM <table> [JOIN <t2> ON a=b]* [WHERE cond AND cond ...]
+                 [ORDER BY colref [ASC|DESC] (',' colref [ASC|DESC])*] [LIMIT INT]
         """
         self.expect(TokenType.SELECT, "Expected SELECT")
         cols = self.parse_select_list()
         self.expect(TokenType.FROM, "Expected FROM")
-        from_table = str(self.expect(TokenType.IDENT, "Expected table name").value)
+        from_table = self.expect(TokenType.IDENT, "Expected table name").value
 
         joins: list[JoinClause] = []
         while self.match(TokenType.JOIN):
@@ -293,7 +322,28 @@ class Parser:
         if self.match(TokenType.WHERE):
             where = self.parse_where_clause_after_where()
 
-        return Select(columns=cols, from_table=from_table, joins=joins, where=where)
+        order_by: list[OrderItem] = []
+        if self.match(TokenType.ORDER):
+            self.expect(TokenType.BY, "Expected BY after ORDER")
+            order_by.append(self.parse_order_item())
+            while self.match(TokenType.COMMA):
+                order_by.append(self.parse_order_item())
+
+        limit: int | Param | None = None
+        if self.match(TokenType.LIMIT):
+            if self.at(TokenType.PARAM):
+                limit = Param(self.consume().value)
+            else:
+                limit = self.expect(TokenType.INT, "Expected integer after LIMIT").value
+
+        return Select(
+            columns=cols,
+            from_table=from_table,
+            joins=joins,
+            where=where,
+            order_by=order_by,
+            limit=limit,
+        )
 
     def parse_select_list(self) -> list[ColumnRef] | None:
         """
@@ -307,12 +357,23 @@ class Parser:
             cols.append(self.parse_column_ref())
         return cols
 
+    def parse_order_item(self) -> OrderItem:
+        """
+        Parse:
+          colref [ASC|DESC]
+        """
+        col = self.parse_column_ref()
+        if self.match(TokenType.DESC):
+            return OrderItem(column=col, descending=True)
+        self.match(TokenType.ASC)
+        return OrderItem(column=col, descending=False)
+
     def parse_join_clause(self) -> JoinClause:
         """
         Parse:
           JOIN <table> ON <colref> = <colref>
         """
-        table = str(self.expect(TokenType.IDENT, "Expected table name after JOIN").value)
+        table = self.expect(TokenType.IDENT, "Expected table name after JOIN").value
         self.expect(TokenType.ON, "Expected ON in JOIN clause")
         left = self.parse_column_ref()
         self.expect(TokenType.EQ, "Expected '=' in JOIN condition")
@@ -327,7 +388,7 @@ class Parser:
           UPDATE <table> SET c=v [,c=v]* [WHERE ...]
         """
         self.expect(TokenType.UPDATE, "Expected UPDATE")
-        table = str(self.expect(TokenType.IDENT, "Expected table name").value)
+        table = self.expect(TokenType.IDENT, "Expected table name").value
         self.expect(TokenType.SET, "Expected SET")
 
         assignments = [self.parse_assignment()]
@@ -345,7 +406,7 @@ class Parser:
         Parse:
           <ident> = <literal>
         """
-        col = str(self.expect(TokenType.IDENT, "Expected column name").value)
+        col = self.expect(TokenType.IDENT, "Expected column name").value
         self.expect(TokenType.EQ, "Expected '=' in assignment")
         val = self.parse_literal()
         return Assignment(column=col, value=val)
@@ -359,7 +420,7 @@ class Parser:
         """
         self.expect(TokenType.DELETE, "Expected DELETE")
         self.expect(TokenType.FROM, "Expected FROM after DELETE")
-        table = str(self.expect(TokenType.IDENT, "Expected table name").value)
+        table = self.expect(TokenType.IDENT, "Expected table name").value
 
         where = None
         if self.match(TokenType.WHERE):
@@ -396,9 +457,9 @@ class Parser:
         Parse:
           IDENT | IDENT '.' IDENT
         """
-        first = str(self.expect(TokenType.IDENT, "Expected identifier").value)
+        first = self.expect(TokenType.IDENT, "Expected identifier").value
         if self.match(TokenType.DOT):
-            second = str(self.expect(TokenType.IDENT, "Expected identifier after '.'").value)
+            second = self.expect(TokenType.IDENT, "Expected identifier after '.'").value
             return ColumnRef(table=first, column=second)
         return ColumnRef(table=None, column=first)
 
@@ -407,26 +468,50 @@ class Parser:
         Parse a literal value.
 
         Returns:
-            int | str | bool | None
+            int | str | bool | None, or Param for a '?' placeholder
 
         Raises:
             SqlSyntaxError if token is not a supported literal type.
         """
-        t = self.peek()
-        if t.typ == TokenType.INT:
-            return int(self.consume().value)
-        if t.typ == TokenType.STRING:
-            return str(self.consume().value)
-        if t.typ == TokenType.BOOL:
-            return bool(self.consume().value)
-        if t.typ == TokenType.NULL:
-            self.consume()
-            return None
+        t = self.tokens[self.i]
+        typ = t.typ
+        if typ in _LITERAL_TYPES:
+            self.i += 1
+            return t.value
+        if typ is TokenType.PARAM:
+            self.i += 1
+            return Param(t.value)
         raise SqlSyntaxError("Expected literal (INT, STRING, BOOL, NULL)", t.pos)
 
 
+# First token of a statement -> Parser method that parses it
+_STATEMENT_PARSERS = {
+    TokenType.CREATE: Parser.parse_create,
+    TokenType.ALTER: Parser.parse_alter,
+    TokenType.INSERT: Parser.parse_insert,
+    TokenType.SELECT: Parser.parse_select,
+    TokenType.UPDATE: Parser.parse_update,
+    TokenType.DELETE: Parser.parse_delete,
+}
+
+# Literal tokens whose lexer value is already the AST value (int/str/bool/None)
+_LITERAL_TYPES = frozenset({TokenType.INT, TokenType.STRING, TokenType.BOOL, TokenType.NULL})
+
+
 # ---------- public helpers ----------
 
+def _reject_params(tokens: list[Token]) -> None:
+    """
+    Raise if a plain (non-prepared) statement contains '?' placeholders.
+
+    Without this, an unbound Param would reach the executor and silently
+    match nothing.
+    """
+    for t in tokens:
+        if t.typ is TokenType.PARAM:
+            raise SqlSyntaxError("Parameter placeholders require a prepared statement", t.pos)
+
+
 def parse_sql(sql: str) -> Statement:
     """
     Parse exactly one SQL statement.
@@ -441,6 +526,8 @@ def parse_sql(sql: str) -> Statement:
         SqlSyntaxError: if parsing fails or multiple statements provided.
     """
     tokens = tokenize(sql)
+    if "?" in sql:  # no '?' anywhere: no placeholder token to look for
+        _reject_params(tokens)
     return Parser(tokens).parse_one()
 
 
@@ -455,4 +542,6 @@ def parse_script(sql: str) -> list[Statement]:
         List of AST Statements.
     """
     tokens = tokenize(sql)
+    if "?" in sql:  # no '?' anywhere: no placeholder token to look for
+        _reject_params(tokens)
     return Parser(tokens).parse_script()
\ No newline at end of file
@@ -14,8 +14,12 @@ by both the REPL and a demo web app without extra dependencies.
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Any
 
+# Distinct (count, message template) pairs kept by rows_ok()
+ROWS_OK_CACHE_SIZE = 512
+
 
 @dataclass(frozen=True)
 class CommandOk:
@@ -44,4 +48,23 @@ class QueryResult:
     """
     columns: list[str]
     rows: list[list[Any]]
-    stats: dict[str, Any] | None = None
\ No newline at end of file
+    stats: dict[str, Any] | None = None
+
+
+@lru_cache(maxsize=ROWS_OK_CACHE_SIZE)
+def rows_ok(rows_affected: int, template: str) -> CommandOk:
+    """
+    Shared CommandOk for a DML row count.
+
+    CommandOk is immutable, so one instance per (count, template) can be
+    returned to every caller: a loop of single-row INSERTs formats
+    "1 row inserted" once instead of once per statement.
+
+    Args:
+        rows_affected: Number of rows affected.
+        template: Message with an {n} placeholder, e.g. "{n} rows deleted".
+
+    Returns:
+        CommandOk(rows_affected, template.format(n=rows_affected)).
+    """
+    return CommandOk(rows_affected=rows_affected, message=template.format(n=rows_affected))
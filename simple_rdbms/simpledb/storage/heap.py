@@ -10,29 +10,88 @@ Responsibilities:
 - Maintain tombstones for logical deletes:
     <db_dir>/data/<table>.tombstones.json
 - Provide:
-    - insert(row) -> rid
+    - insert(row) -> rid / insert_many(rows) -> rids
     - scan_active() -> iterator of active (not deleted) rows
     - get_by_rid(rid) -> row dict or None if not found/deleted
+    - get_many(rids) -> iterator of active rows (one file open)
+    - rids_where_equal(column, value) -> rids, via an in-memory column vector
     - tombstone(rid) to logically delete
+    - flush() to persist the in-memory next_rid counter
+    - open_cached(cache, db_dir, table) to reuse open heaps across statements
 
 Design notes:
-- JSONL is chosen for readability and ease of debugging.
+- JSONL is chosen for readability and ease of debugging. It also stays the
+  fast option without third-party packages: the stdlib has no fast binary
+  record decoder that is stable across Python versions (marshal is not, and
+  pickle is unsafe on disk), and schema-ordered arrays instead of objects
+  halve the file size but parse no faster once rebuilt into dicts. Hot reads
+  avoid decoding instead (column vectors, index point reads).
 - A separate tombstone file avoids inflating the JSONL file with delete records.
 - The RID directory enables index-backed point reads (seek + readline).
+- next_rid is kept in memory and written to the meta file every
+  META_FLUSH_INTERVAL rids, on flush() and at interpreter exit. A stale meta
+  file is harmless: open() never hands out a rid at or below the highest one
+  already in the (per-batch saved) RID directory.
 - This is not crash-safe (no WAL/FSYNC/transactions) by design for this assignment.
+- Uses orjson when it is installed (optional; stdlib json otherwise) to encode
+  and decode row lines. orjson writes non-ASCII text as raw UTF-8 where json
+  writes \\u escapes; both read back the same, so files may mix the two.
 """
 
 from __future__ import annotations
 
+import atexit
 import json
-from dataclasses import dataclass
+import mmap
+import os
+import weakref
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Iterable
+from typing import Any, BinaryIO, Iterable, Iterator
 
 from ..errors import ExecutionError
 from .rid_directory import RidDirectory
 from .tombstones import Tombstones
 
+try:
+    import orjson
+except ImportError:  # optional speedup
+    orjson = None
+
+# The meta file is rewritten at least once per this many assigned rids
+META_FLUSH_INTERVAL = 1024
+
+# Heaps with an unsaved next_rid, by id() (dataclass instances are
+# unhashable); flushed at interpreter exit
+_UNFLUSHED: "weakref.WeakValueDictionary[int, HeapTable]" = weakref.WeakValueDictionary()
+
+
+@atexit.register
+def _flush_all() -> None:
+    for heap in list(_UNFLUSHED.values()):
+        try:
+            heap.flush()
+        except OSError:
+            pass  # e.g. the database directory was already removed
+
+
+if orjson is not None:
+    _loads_line = orjson.loads
+else:
+    def _loads_line(line: bytes) -> Any:
+        """Parse one UTF-8 JSON line (stdlib json)."""
+        return json.loads(line.decode("utf-8"))
+
+
+def _dumps_line(obj: dict[str, Any]) -> bytes:
+    """Serialize a row as one compact UTF-8 JSON line (orjson if available)."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj) + b"\n"
+        except orjson.JSONEncodeError:
+            pass  # e.g. an integer beyond 64 bits; stdlib json has no such limit
+    return (json.dumps(obj, separators=(",", ":")) + "\n").encode("utf-8")
+
 
 @dataclass
 class HeapTable:
@@ -45,12 +104,19 @@ class HeapTable:
         meta_path: Path to table meta JSON file (currently only next_rid).
         rid_dir: RidDirectory for rid -> byte offset.
         tombstones: Tombstones set for logical deletions.
+        columns: In-memory column vectors, column -> (rids, values); built on
+            first use by column_vector() and appended to by insert_many().
+        next_rid: In-memory rid counter (None until the first insert).
+        meta_rid: next_rid as last written to the meta file.
     """
     table_name: str
     data_path: Path
     meta_path: Path
     rid_dir: RidDirectory
     tombstones: Tombstones
+    columns: dict[str, tuple[list[int], list[Any]]] = field(default_factory=dict, repr=False)
+    next_rid: int | None = field(default=None, repr=False)
+    meta_rid: int = field(default=0, repr=False)
 
     @classmethod
     def open(cls, db_dir: Path, table_name: str) -> "HeapTable":
@@ -95,6 +161,27 @@ class HeapTable:
 
         return ht
 
+    @classmethod
+    def open_cached(cls, cache: dict[str, "HeapTable"], db_dir: Path, table_name: str) -> "HeapTable":
+        """
+        Return the cached heap for a table, opening it on first use.
+
+        The RID directory and tombstones stay in memory between statements, so
+        this is only valid while every write goes through the cached instance.
+
+        Args:
+            cache: table name -> HeapTable (kept at Database level).
+            db_dir: Database root directory.
+            table_name: Table name.
+
+        Returns:
+            HeapTable instance (cached).
+        """
+        heap = cache.get(table_name)
+        if heap is None:
+            heap = cache[table_name] = cls.open(db_dir, table_name)
+        return heap
+
     def _load_meta(self) -> dict[str, Any]:
         """
         Load meta file.
@@ -108,6 +195,13 @@ class HeapTable:
         """Persist meta file."""
         self.meta_path.write_text(json.dumps(meta, indent=2), encoding="utf-8")
 
+    def flush(self) -> None:
+        """Persist the in-memory next_rid to the meta file (no-op if unchanged)."""
+        if self.next_rid is not None and self.next_rid != self.meta_rid:
+            self._save_meta({"next_rid": self.next_rid})
+            self.meta_rid = self.next_rid
+        _UNFLUSHED.pop(id(self), None)
+
     def rebuild_directory_from_data(self) -> None:
         """
         Rebuild the rid -> byte offset directory by scanning the JSONL data file.
@@ -130,7 +224,7 @@ class HeapTable:
                 if not line:
                     continue
                 try:
-                    obj = json.loads(line.decode("utf-8"))
+                    obj = _loads_line(line)
                 except json.JSONDecodeError as e:
                     raise ExecutionError(f"Corrupt record in {self.data_path}: {e}") from e
 
@@ -154,23 +248,53 @@ class HeapTable:
         Returns:
             Assigned integer rid.
         """
-        meta = self._load_meta()
-        rid = int(meta["next_rid"])
-        meta["next_rid"] = rid + 1
-        self._save_meta(meta)
+        return self.insert_many([row])[0]
+
+    def insert_many(self, rows: list[dict[str, Any]]) -> list[int]:
+        """
+        Append rows to the heap file and return their assigned rids.
+
+        The data file and the RID directory are each written once for the
+        whole batch; the meta file only every META_FLUSH_INTERVAL rids (see
+        flush()).
 
-        stored = {"_rid": rid, **row}
-        line = (json.dumps(stored, separators=(",", ":")) + "\n").encode("utf-8")
+        Args:
+            rows: Dicts of logical column -> value. Do NOT include '_rid'.
 
-        # Write and capture byte offset for directory
+        Returns:
+            Assigned integer rids, in row order.
+        """
+        if not rows:
+            return []
+
+        first = self.next_rid
+        if first is None:
+            self.meta_rid = int(self._load_meta()["next_rid"])
+            first = max(self.meta_rid, max(self.rid_dir.mapping, default=0) + 1)
+        self.next_rid = first + len(rows)
+        if self.next_rid - self.meta_rid >= META_FLUSH_INTERVAL:
+            self.flush()
+        else:
+            _UNFLUSHED[id(self)] = self
+
+        rids = list(range(first, first + len(rows)))
+        lines = [_dumps_line({"_rid": rid, **row}) for rid, row in zip(rids, rows)]
+
+        # Write and capture byte offsets for directory
         with self.data_path.open("ab") as f:
             offset = f.tell()
-            f.write(line)
+            f.write(b"".join(lines))
 
-        self.rid_dir.set(rid, offset)
+        for rid, line in zip(rids, lines):
+            self.rid_dir.set(rid, offset)
+            offset += len(line)
         self.rid_dir.save()
 
-        return rid
+        for col, (col_rids, col_vals) in self.columns.items():
+            col_rids.extend(rids)
+            col_vals.extend(row.get(col) for row in rows)
+
+        return rids
 
     def tombstone(self, rid: int) -> None:
         """
@@ -186,31 +310,122 @@ class HeapTable:
         Iterate all active rows (not tombstoned).
 
         Yields:
-            Row dicts including '_rid' and column keys.
+            Row dicts including '_rid' (already an int: insert_many writes it
+            as a JSON number) and column keys.
 
         Notes:
             This is a full scan of the heap file. Indexes can avoid scans for
             selective WHERE queries.
         """
+        # One streaming pass over a read-only mmap of the data file: each line
+        # is found with mm.find (memchr) and parsed straight from the slice,
+        # without the buffered reader's per-line bookkeeping. Tombstones live
+        # in their own file, so each line is decided on its own; the (live)
+        # tombstone set is bound once instead of calling Tombstones.contains
+        # per row. Blank lines are rare, so they are only looked for when a
+        # line fails to parse (a trailing '\r' is JSON whitespace already).
+        deleted = self.tombstones.deleted
+        loads = _loads_line
         with self.data_path.open("rb") as f:
-            for bline in f:
-                line = bline.strip()
-                if not line:
-                    continue
-                try:
-                    obj = json.loads(line.decode("utf-8"))
-                except json.JSONDecodeError as e:
-                    raise ExecutionError(f"Corrupt record in {self.data_path}: {e}") from e
+            size = os.fstat(f.fileno()).st_size
+            if not size:
+                return  # mmap rejects empty files
+            with mmap.mmap(f.fileno(), size, access=mmap.ACCESS_READ) as mm:
+                find = mm.find
+                pos = 0
+                while pos < size:
+                    nl = find(b"\n", pos)
+                    if nl == -1:
+                        nl = size  # last line without a newline
+                    bline = mm[pos:nl]
+                    pos = nl + 1
+                    try:
+                        obj = loads(bline)
+                    except json.JSONDecodeError as e:
+                        if not bline.strip():
+                            continue
+                        raise ExecutionError(f"Corrupt record in {self.data_path}: {e}") from e
+
+                    # Ignore any legacy delete markers if encountered
+                    if ("_op" in obj or "_deleted" in obj) and (
+                        obj.get("_op") == "DELETE" or obj.get("_deleted") is True
+                    ):
+                        continue
+
+                    rid = obj.get("_rid")
+                    if rid in deleted and isinstance(rid, int):
+                        continue
+
+                    yield obj
+
+    def column_vector(self, column: str) -> tuple[list[int], list[Any]]:
+        """
+        Return (rids, values) of one column, building it by a scan on first use.
 
-                # Ignore any legacy delete markers if encountered
-                if obj.get("_op") == "DELETE" or obj.get("_deleted") is True:
-                    continue
+        Rows tombstoned after the vector was built stay in it; readers must
+        skip them (see rids_where_equal).
 
-                rid = obj.get("_rid")
-                if isinstance(rid, int) and self.tombstones.contains(rid):
-                    continue
+        Args:
+            column: Column name (rows without it read as NULL).
+
+        Returns:
+            Parallel lists of rids and values, in heap order.
+        """
+        vec = self.columns.get(column)
+        if vec is None:
+            rids: list[int] = []
+            vals: list[Any] = []
+            for row in self.scan_active():
+                rids.append(row["_rid"])
+                vals.append(row.get(column))
+            vec = self.columns[column] = (rids, vals)
+        return vec
+
+    def rids_where_equal(self, column: str, value: Any) -> list[int]:
+        """
+        Rids of active rows whose `column` equals `value`, from the column vector.
 
-                yield obj
+        The search runs in list.index() (C-level comparisons), so only
+        matching positions cost Python work; no row is decoded.
+
+        Args:
+            column: Column name.
+            value: Value to compare with (==, like the row-by-row filter).
+
+        Returns:
+            Matching rids in heap order.
+        """
+        rids, vals = self.column_vector(column)
+        contains = self.tombstones.contains
+        out: list[int] = []
+        i = -1
+        while True:
+            try:
+                i = vals.index(value, i + 1)
+            except ValueError:
+                return out
+            rid = rids[i]
+            if not contains(rid):
+                out.append(rid)
+
+    def get_many(self, rids: Iterable[int]) -> Iterator[dict[str, Any]]:
+        """
+        Retrieve active rows by rid, opening the data file once.
+
+        Args:
+            rids: Row ids (missing or deleted ones are skipped).
+
+        Yields:
+            Row dicts, in the order of `rids`.
+
+        Raises:
+            ExecutionError: on directory mismatch or corrupt data.
+        """
+        with self.data_path.open("rb") as f:
+            for rid in rids:
+                row = self._read_rid(f, int(rid))
+                if row is not None:
+                    yield row
 
     def get_by_rid(self, rid: int) -> dict[str, Any] | None:
         """
@@ -226,6 +441,13 @@ class HeapTable:
             ExecutionError: on directory mismatch or corrupt data.
         """
         rid = int(rid)
+        if self.tombstones.contains(rid) or self.rid_dir.get(rid) is None:
+            return None
+        with self.data_path.open("rb") as f:
+            return self._read_rid(f, rid)
+
+    def _read_rid(self, f: BinaryIO, rid: int) -> dict[str, Any] | None:
+        """Read one row by rid from an open data file (None if deleted/missing)."""
         if self.tombstones.contains(rid):
             return None
 
@@ -233,25 +455,20 @@ class HeapTable:
         if off is None:
             return None
 
-        with self.data_path.open("rb") as f:
-            f.seek(off)
-            line = f.readline()
-            if not line:
-                raise ExecutionError(f"RID offset past EOF: {self.table_name} rid={rid}")
-            try:
-                obj = json.loads(line.decode("utf-8"))
-            except json.JSONDecodeError as e:
-                raise ExecutionError(f"Corrupt record at rid={rid} in {self.data_path}: {e}") from e
-
-            actual = obj.get("_rid")
-            if int(actual) != rid:
-                # If this happens, the directory is out-of-sync with the file.
-                raise ExecutionError(
-                    f"RID directory mismatch for {self.table_name}: expected {rid}, got {actual}. "
-                    "Consider rebuilding the directory."
-                )
-
-            if self.tombstones.contains(rid):
-                return None
-
-            return obj
\ No newline at end of file
+        f.seek(off)
+        line = f.readline()
+        if not line:
+            raise ExecutionError(f"RID offset past EOF: {self.table_name} rid={rid}")
+        try:
+            obj = _loads_line(line)
+        except json.JSONDecodeError as e:
+            raise ExecutionError(f"Corrupt record at rid={rid} in {self.data_path}: {e}") from e
+
+        actual = obj.get("_rid")
+        if int(actual) != rid:
+            # If this happens, the directory is out-of-sync with the file.
+            raise ExecutionError(
+                f"RID directory mismatch for {self.table_name}: expected {rid}, got {actual}. "
+                "Consider rebuilding the directory."
+            )
+        return obj
@@ -42,4 +42,39 @@ def test_duplicate_table_name_errors(tmp_path):
 def test_only_one_primary_key_supported(tmp_path):
     db = Database.open(tmp_path)
     with pytest.raises(ExecutionError):
-        db.execute("CREATE TABLE t (a INTEGER PRIMARY KEY, b INTEGER PRIMARY KEY);")
\ No newline at end of file
+        db.execute("CREATE TABLE t (a INTEGER PRIMARY KEY, b INTEGER PRIMARY KEY);")
+
+
+def test_add_column_reads_null_for_existing_rows(tmp_path):
+    db = Database.open(tmp_path)
+    db.execute("CREATE TABLE c (id INTEGER PRIMARY KEY, name TEXT);")
+    db.execute("INSERT INTO c (id, name) VALUES (1, 'Food');")
+    db.execute("CREATE TABLE t (id INTEGER PRIMARY KEY, c_id INTEGER);")
+    db.execute("INSERT INTO t (id, c_id) VALUES (7, 1);")
+
+    with pytest.raises(ExecutionError):
+        db.execute("ALTER TABLE c ADD COLUMN name_lc TEXT NOT NULL;")
+    db.execute("ALTER TABLE c ADD name_lc TEXT;")
+
+    assert db.execute("SELECT id, name_lc FROM c;").rows == [[1, None]]
+    res = db.execute("SELECT t.id, c.name_lc FROM t JOIN c ON t.c_id = c.id;")
+    assert res.rows == [[7, None]]
+
+    db.execute("UPDATE c SET name_lc = 'food' WHERE id = 1;")
+    assert Database.open(tmp_path).execute("SELECT name_lc FROM c;").rows == [["food"]]
+
+
+def test_row_types_validated_per_column(tmp_path):
+    db = Database.open(tmp_path)
+    db.execute("CREATE TABLE t (n INTEGER, s VARCHAR(3), b BOOLEAN);")
+
+    for values in ("(TRUE, 'x', TRUE)", "(1, 'long', TRUE)", "(1, 2, TRUE)", "(1, 'x', 1)"):
+        with pytest.raises(ExecutionError):
+            db.execute(f"INSERT INTO t (n, s, b) VALUES {values};")
+    db.execute("INSERT INTO t (n, s, b) VALUES (1, 'abc', FALSE);")
+
+    # Validators follow schema changes
+    db.execute("ALTER TABLE t ADD COLUMN d DATE;")
+    with pytest.raises(ExecutionError):
+        db.execute("UPDATE t SET d = 5;")
+    db.execute("UPDATE t SET d = '2024-01-01';")
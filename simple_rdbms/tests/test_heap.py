@@ -0,0 +1,38 @@
+import json
+
+from simpledb import Database
+from simpledb.storage.heap import HeapTable
+
+
+def test_heap_handles_reused_across_statements(tmp_path):
+    db = Database.open(tmp_path)
+    db.execute("CREATE TABLE users (id INTEGER PRIMARY KEY, email VARCHAR(255));")
+    heap = db.heap_cache["users"]
+
+    db.execute("INSERT INTO users (id, email) VALUES (1, 'a@b.com');")
+    db.execute("INSERT INTO users (id, email) VALUES (2, 'c@d.com');")
+    db.execute("DELETE FROM users WHERE id = 1;")
+    assert db.heap_cache["users"] is heap
+    assert db.execute("SELECT id FROM users;").rows == [[2]]
+
+    # A fresh Database reads the same state from disk
+    assert Database.open(tmp_path).execute("SELECT id FROM users;").rows == [[2]]
+
+
+def test_scan_reads_blank_and_unterminated_lines(tmp_path):
+    heap = HeapTable.open(tmp_path, "t")
+    assert list(heap.scan_active()) == []
+    heap.data_path.write_bytes(b'{"_rid":1,"a":1}\r\n\n{"_rid":2,"a":2}')
+    assert [row["a"] for row in heap.scan_active()] == [1, 2]
+
+
+def test_next_rid_survives_unflushed_meta(tmp_path):
+    heap = HeapTable.open(tmp_path, "t")
+    assert heap.insert_many([{"a": 1}, {"a": 2}]) == [1, 2]
+    assert json.loads(heap.meta_path.read_text())["next_rid"] == 1  # not flushed yet
+
+    # A second handle resumes after the rids already in the RID directory
+    assert HeapTable.open(tmp_path, "t").insert({"a": 3}) == 3
+
+    heap.flush()
+    assert json.loads(heap.meta_path.read_text())["next_rid"] == 3
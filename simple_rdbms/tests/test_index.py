@@ -1,5 +1,40 @@
+import pytest
+
 from simpledb import Database
 from simpledb.result import QueryResult
+from simpledb.errors import ConstraintError
+from simpledb.storage.heap import HeapTable
+
+
+@pytest.fixture
+def scan_spy(monkeypatch):
+    """Call to start recording the id of every row HeapTable.scan_active yields."""
+    def install() -> list:
+        seen = []
+        orig = HeapTable.scan_active
+
+        def counting_scan(self):
+            for row in orig(self):
+                seen.append(row["id"])
+                yield row
+
+        monkeypatch.setattr(HeapTable, "scan_active", counting_scan)
+        return seen
+
+    return install
+
+
+@pytest.fixture
+def forbid_scan(monkeypatch):
+    """Call to make any later HeapTable.scan_active fail with `reason`."""
+    def install(reason: str) -> None:
+        def no_scan(self):
+            raise AssertionError(reason)
+            yield
+
+        monkeypatch.setattr(HeapTable, "scan_active", no_scan)
+
+    return install
 
 
 def test_index_backed_select(tmp_path):
@@ -15,4 +50,149 @@ def test_index_backed_select(tmp_path):
     assert res.rows == [[2]]
     assert res.stats is not None
     assert res.stats["plan"] == "index"
-    assert res.stats["index"] == "idx_email"
\ No newline at end of file
+    assert res.stats["index"] == "idx_email"
+
+
+def test_composite_index_used_when_all_columns_bound(tmp_path):
+    db = Database.open(tmp_path)
+    db.execute("CREATE TABLE tx (id INTEGER PRIMARY KEY, user_id INTEGER, ym VARCHAR(7));")
+    db.execute("INSERT INTO tx (id, user_id, ym) VALUES (1, 10, '2024-01');")
+    db.execute("INSERT INTO tx (id, user_id, ym) VALUES (2, 10, '2024-02');")
+    db.execute("INSERT INTO tx (id, user_id, ym) VALUES (3, 20, '2024-01');")
+    db.execute("CREATE INDEX idx_tx_user_ym ON tx(user_id, ym);")
+    db.execute("INSERT INTO tx (id, user_id, ym) VALUES (4, 10, '2024-01');")
+
+    res = db.execute("SELECT id FROM tx WHERE ym = '2024-01' AND user_id = 10;")
+    assert res.rows == [[1], [4]]
+    assert res.stats["plan"] == "index"
+    assert res.stats["index"] == "idx_tx_user_ym"
+
+    # Only a prefix bound: a hash index cannot help
+    res = db.execute("SELECT id FROM tx WHERE user_id = 10;")
+    assert res.stats["plan"] == "scan"
+
+    db.execute("UPDATE tx SET ym = '2024-02' WHERE id = 4;")
+    db.execute("DELETE FROM tx WHERE id = 1;")
+    res = db.execute("SELECT id FROM tx WHERE user_id = 10 AND ym = '2024-02';")
+    assert sorted(res.rows) == [[2], [4]]
+    assert db.execute("SELECT id FROM tx WHERE user_id = 10 AND ym = '2024-01';").rows == []
+
+
+def test_index_choice_prefers_wider_key_on_tie(tmp_path):
+    db = Database.open(tmp_path)
+    db.execute("CREATE TABLE tx (id INTEGER PRIMARY KEY, user_id INTEGER, ym VARCHAR(7));")
+    db.execute("CREATE INDEX idx_tx_user ON tx(user_id);")
+    db.execute("CREATE INDEX idx_tx_user_ym ON tx(user_id, ym);")
+    db.execute("INSERT INTO tx (id, user_id, ym) VALUES (1, 10, '2024-01');")
+
+    res = db.execute("SELECT id FROM tx WHERE user_id = 10 AND ym = '2024-01';")
+    assert res.rows == [[1]]
+    assert res.stats["index"] == "idx_tx_user_ym"
+
+
+def test_primary_key_lookup_stops_scan_at_match(tmp_path, monkeypatch, scan_spy):
+    db = Database.open(tmp_path)
+    db.execute("CREATE TABLE t (id INTEGER PRIMARY KEY, owner INTEGER, code TEXT UNIQUE);")
+    for i in range(1, 11):
+        db.execute(f"INSERT INTO t (id, owner, code) VALUES ({i}, {i % 2}, 'c{i}');")
+
+    seen = scan_spy()
+
+    assert db.execute("SELECT code FROM t WHERE id = 3;").rows == [["c3"]]
+    assert seen == [1, 2, 3]
+
+    seen.clear()
+    # The PK row exists but fails the other predicate: still no further rows read
+    assert db.execute("SELECT id FROM t WHERE owner = 0 AND id = 3;").rows == []
+    assert seen == [1, 2, 3]
+
+    seen.clear()
+    assert db.execute("UPDATE t SET owner = 5 WHERE code = 'c2';").rows_affected == 1
+    assert seen[:2] == [1, 2]
+    monkeypatch.undo()
+    assert db.execute("SELECT id FROM t WHERE owner = 5;").rows == [[2]]
+    assert db.execute("DELETE FROM t WHERE id = 4;").rows_affected == 1
+    assert db.execute("SELECT id FROM t WHERE id = 4;").rows == []
+
+
+def test_primary_key_and_unique_conflicts(tmp_path):
+    db = Database.open(tmp_path)
+    db.execute("CREATE TABLE users (id INTEGER PRIMARY KEY, email VARCHAR(255) UNIQUE, name TEXT);")
+    db.execute("INSERT INTO users (id, email, name) VALUES (1, 'a@b.com', 'a');")
+    db.execute("INSERT INTO users (id, email, name) VALUES (2, NULL, 'b');")
+    db.execute("INSERT INTO users (id, email, name) VALUES (3, NULL, 'c');")
+
+    with pytest.raises(ConstraintError):
+        db.execute("INSERT INTO users (id, email) VALUES (1, 'x@y.com');")
+    with pytest.raises(ConstraintError):
+        db.execute("INSERT INTO users (id, email) VALUES (4, 'a@b.com');")
+    with pytest.raises(ConstraintError):
+        db.execute("UPDATE users SET email = 'z@z.com' WHERE email = NULL;")
+
+    # A row may keep its own key values when updated
+    assert db.execute("UPDATE users SET name = 'aa', email = 'a@b.com' WHERE id = 1;").rows_affected == 1
+    assert db.execute("SELECT name FROM users WHERE id = 1;").rows == [["aa"]]
+
+
+def test_indexed_key_columns_checked_without_scan(tmp_path, forbid_scan):
+    db = Database.open(tmp_path)
+    db.execute("CREATE TABLE users (id INTEGER PRIMARY KEY, email VARCHAR(255) UNIQUE);")
+    db.execute("CREATE INDEX idx_users_id ON users(id);")
+    db.execute("CREATE INDEX idx_users_email ON users(email);")
+    db.execute("INSERT INTO users (id, email) VALUES (1, 'a@b.com');")
+
+    forbid_scan("constraint check scanned the heap")
+
+    with pytest.raises(ConstraintError):
+        db.execute("INSERT INTO users (id, email) VALUES (1, 'x@y.com');")
+    with pytest.raises(ConstraintError):
+        db.execute("INSERT INTO users (id, email) VALUES (2, 'a@b.com');")
+    db.execute("INSERT INTO users (id, email) VALUES (2, 'c@d.com');")
+    assert db.execute("UPDATE users SET email = 'a@b.com' WHERE id = 1;").rows_affected == 1
+    with pytest.raises(ConstraintError):
+        db.execute("UPDATE users SET email = 'a@b.com' WHERE id = 2;")
+
+
+def test_column_vector_tracks_writes(tmp_path, forbid_scan):
+    db = Database.open(tmp_path)
+    db.execute("CREATE TABLE tx (id INTEGER PRIMARY KEY, user_id INTEGER, note TEXT);")
+    db.execute("INSERT INTO tx (id, user_id, note) VALUES (1, 10, 'a'), (2, 20, 'b'), (3, 10, 'c');")
+
+    res = db.execute("SELECT id FROM tx WHERE user_id = 10;")
+    assert res.rows == [[1], [3]]
+    assert res.stats["plan"] == "scan" and res.stats["column"] == "user_id"
+
+    db.execute("INSERT INTO tx (id, user_id, note) VALUES (4, 10, 'd');")
+    db.execute("UPDATE tx SET user_id = 20 WHERE id = 1;")
+    db.execute("DELETE FROM tx WHERE id = 3;")
+
+    forbid_scan("column vector not reused")
+    assert db.execute("SELECT id FROM tx WHERE user_id = 10;").rows == [[4]]
+    assert db.execute("SELECT id FROM tx WHERE user_id = 20 ORDER BY id;").rows == [[1], [2]]
+
+
+def test_update_of_non_key_columns_skips_constraint_scan(tmp_path, scan_spy):
+    db = Database.open(tmp_path)
+    db.execute("CREATE TABLE t (id INTEGER PRIMARY KEY, code TEXT UNIQUE, note TEXT);")
+    db.execute("INSERT INTO t (id, code, note) VALUES (1, 'a', NULL), (2, 'b', NULL), (3, 'c', NULL);")
+
+    seen = scan_spy()
+
+    assert db.execute("UPDATE t SET note = 'x' WHERE id = 2;").rows_affected == 1
+    assert seen == [1, 2]
+
+    # Assigning a key column still checks it against the other rows
+    with pytest.raises(ConstraintError):
+        db.execute("UPDATE t SET code = 'a' WHERE id = 2;")
+
+
+def test_text_equality_uses_column_vector(tmp_path):
+    db = Database.open(tmp_path)
+    db.execute("CREATE TABLE tx (id INTEGER PRIMARY KEY, kind TEXT, flag BOOLEAN);")
+    db.execute("INSERT INTO tx (id, kind, flag) VALUES (1, 'in', TRUE), (2, 'out', FALSE), (3, 'in', NULL);")
+
+    res = db.execute("SELECT id FROM tx WHERE kind = 'in';")
+    assert res.rows == [[1], [3]]
+    assert res.stats["column"] == "kind"
+    assert db.execute("SELECT id FROM tx WHERE flag = FALSE;").rows == [[2]]
+    assert db.execute("SELECT id FROM tx WHERE kind = 'in' AND flag = TRUE;").rows == [[1]]
@@ -1,4 +1,7 @@
+import pytest
+
 from simpledb import Database
+from simpledb.errors import ExecutionError
 from simpledb.result import QueryResult
 
 
@@ -29,4 +32,26 @@ def test_join_transactions_categories(tmp_path):
         [101, "Rent"],
     ]
     assert res.stats is not None
-    assert res.stats["plan"] == "join"
\ No newline at end of file
+    assert res.stats["plan"] == "join"
+
+
+def test_join_scan_star_order_and_column_errors(tmp_path):
+    db = Database.open(tmp_path)
+    db.execute("CREATE TABLE a (id INTEGER PRIMARY KEY, v TEXT);")
+    db.execute("CREATE TABLE b (id INTEGER PRIMARY KEY, a_id INTEGER, w TEXT);")
+    db.execute("INSERT INTO a (id, v) VALUES (1, 'x'), (2, 'y');")
+    db.execute("INSERT INTO b (id, a_id, w) VALUES (10, 2, 'p'), (11, 1, 'q'), (12, 2, 'r');")
+
+    res = db.execute("SELECT * FROM a JOIN b ON a.id = b.a_id ORDER BY b.id DESC LIMIT 2;")
+    assert res.columns == ["a.id", "a.v", "b.id", "b.a_id", "b.w"]
+    assert res.rows == [[2, "y", 12, 2, "r"], [1, "x", 11, 1, "q"]]
+    assert res.stats["steps"][0]["method"] == "scan"
+
+    res = db.execute("SELECT b.w FROM a JOIN b ON a.id = b.a_id WHERE v = 'y' ORDER BY b.w;")
+    assert res.rows == [["p"], ["r"]]
+
+    # Column references are checked even when nothing matches
+    with pytest.raises(ExecutionError):
+        db.execute("SELECT a.id FROM a JOIN b ON a.id = b.a_id WHERE id = 5;")
+    with pytest.raises(ExecutionError):
+        db.execute("SELECT a.id FROM a JOIN b ON a.id = b.a_id WHERE a.nope = 5;")
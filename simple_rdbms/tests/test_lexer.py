@@ -38,4 +38,49 @@ def test_tokenize_select_join_where_and():
 
 def test_unterminated_string_raises():
     with pytest.raises(SqlSyntaxError):
-        tokenize("INSERT INTO t (name) VALUES ('oops);")
\ No newline at end of file
+        tokenize("INSERT INTO t (name) VALUES ('oops);")
+
+
+def test_string_escape_and_positions():
+    tokens = tokenize("SELECT name\nFROM t WHERE name = 'it''s';")
+    s = [t for t in tokens if t.typ == TokenType.STRING][0]
+    assert s.value == "it's"
+    assert (s.pos.line, s.pos.col) == (2, 21)
+    frm = [t for t in tokens if t.typ == TokenType.FROM][0]
+    assert (frm.pos.line, frm.pos.col) == (2, 1)
+
+
+def test_positions_across_lines_and_errors():
+    tokens = tokenize("SELECT 'a\nb' , x  \n\n  y = ?  \n")
+    assert [(t.typ, t.pos.line, t.pos.col) for t in tokens] == [
+        (TokenType.SELECT, 1, 1),
+        (TokenType.STRING, 1, 8),
+        (TokenType.COMMA, 2, 4),
+        (TokenType.IDENT, 2, 6),
+        (TokenType.IDENT, 4, 3),
+        (TokenType.EQ, 4, 5),
+        (TokenType.PARAM, 4, 7),
+        (TokenType.EOF, 5, 1),
+    ]
+    with pytest.raises(SqlSyntaxError) as exc:
+        tokenize("SELECT a\n  FROM t @")
+    assert (exc.value.position.line, exc.value.position.col) == (2, 10)
+    assert "Unexpected character: '@'" in str(exc.value)
+
+
+def test_words_keep_lexeme_case_and_share_identifiers():
+    a = tokenize("select Amount from tx;")
+    b = tokenize("SELECT " + "".join(["Am", "ount"]) + " FROM tx;")
+    assert (a[0].typ, a[0].lexeme, a[0].value) == (TokenType.SELECT, "select", "SELECT")
+    assert b[1].value == "Amount"
+    assert a[1].value is b[1].value
+    assert tokenize("x = TRUE")[2].value is True
+
+
+def test_long_string_literals():
+    body = "ab ''c'' " * 200
+    tokens = tokenize(f"VALUES ('{body}', '''');")
+    strings = [t.value for t in tokens if t.typ == TokenType.STRING]
+    assert strings == [body.replace("''", "'"), "'"]
+    with pytest.raises(SqlSyntaxError, match="Unterminated"):
+        tokenize(f"VALUES ('{body}'');")
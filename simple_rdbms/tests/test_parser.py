@@ -1,6 +1,6 @@
 import pytest
 
-from simpledb.ast import CreateIndex, CreateTable, Delete, Insert, Select, Update
+from simpledb.ast import AlterTableAddColumn, CreateIndex, CreateTable, Delete, Insert, Select, Update
 from simpledb.errors import SqlSyntaxError
 from simpledb.parser import parse_sql
 
@@ -29,7 +29,7 @@ def test_parse_create_index():
     assert stmt.column_name == "email"
 import pytest
 
-from simpledb.ast import CreateIndex, CreateTable, Delete, Insert, Select, Update
+from simpledb.ast import AlterTableAddColumn, CreateIndex, CreateTable, Delete, Insert, Select, Update
 from simpledb.errors import SqlSyntaxError
 from simpledb.parser import parse_sql
 
@@ -142,4 +142,34 @@ def test_parse_delete():
 
 def test_parse_errors_on_missing_paren():
     with pytest.raises(SqlSyntaxError):
-        parse_sql("CREATE TABLE t (id INTEGER;")
\ No newline at end of file
+        parse_sql("CREATE TABLE t (id INTEGER;")
+
+
+def test_parse_select_order_by_limit():
+    stmt = parse_sql("SELECT id FROM transactions WHERE user_id = 1 ORDER BY date DESC, id LIMIT 10;")
+    assert isinstance(stmt, Select)
+    assert [(o.column.column, o.descending) for o in stmt.order_by] == [("date", True), ("id", False)]
+    assert stmt.limit == 10
+
+
+def test_parse_create_composite_index():
+    stmt = parse_sql("CREATE INDEX idx_tx_user_ym ON transactions(user_id, ym);")
+    assert isinstance(stmt, CreateIndex)
+    assert stmt.column_names == ["user_id", "ym"]
+
+
+def test_parse_alter_table_add_column():
+    stmt = parse_sql("ALTER TABLE categories ADD COLUMN name_lc VARCHAR(50);")
+    assert isinstance(stmt, AlterTableAddColumn)
+    assert stmt.table_name == "categories"
+    assert stmt.column.name == "name_lc"
+    assert stmt.column.typ.params == [50]
+
+
+def test_parse_multi_row_insert():
+    stmt = parse_sql("INSERT INTO users (id, email) VALUES (1, 'a'), (2, NULL), (3, 'c');")
+    assert isinstance(stmt, Insert)
+    assert stmt.rows() == [[1, "a"], [2, None], [3, "c"]]
+
+    with pytest.raises(SqlSyntaxError):
+        parse_sql("INSERT INTO users (id, email) VALUES (1, 'a'), (2);")
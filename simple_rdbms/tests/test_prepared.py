@@ -0,0 +1,150 @@
+import pytest
+
+from simpledb import Database
+from simpledb.errors import ConstraintError, ExecutionError, SqlSyntaxError
+
+
+def _seed(db):
+    db.execute("CREATE TABLE tx (id INTEGER PRIMARY KEY, user_id INTEGER, note TEXT);")
+    ins = db.prepare("INSERT INTO tx (id, user_id, note) VALUES (?, ?, ?);")
+    for row in [(1, 10, "a"), (2, 10, "O'Reilly"), (3, 20, None), (4, 10, "c")]:
+        db.execute_prepared(ins, row)
+
+
+def test_prepared_insert_select_update_delete(tmp_path):
+    db = Database.open(tmp_path)
+    _seed(db)
+
+    sel = "SELECT id, note FROM tx WHERE user_id = ? ORDER BY id LIMIT ?;"
+    assert db.execute_prepared(sel, (10, 2)).rows == [[1, "a"], [2, "O'Reilly"]]
+    assert db.execute_prepared(sel, (20, 5)).rows == [[3, None]]
+
+    res = db.execute_prepared("UPDATE tx SET note = ? WHERE id = ? AND user_id = ?;", ("b", 1, 10))
+    assert res.rows_affected == 1
+    res = db.execute_prepared("DELETE FROM tx WHERE id = ?;", (4,))
+    assert res.rows_affected == 1
+
+    assert db.execute_prepared(sel, (10, 10)).rows == [[1, "b"], [2, "O'Reilly"]]
+
+
+def test_prepare_is_cached_and_ast_not_mutated(tmp_path):
+    db = Database.open(tmp_path)
+    _seed(db)
+
+    sql = "SELECT id FROM tx WHERE user_id = ?;"
+    p = db.prepare(sql)
+    assert db.prepare(sql) is p
+    assert p.param_count == 1
+
+    db.execute_prepared(p, (10,))
+    assert db.execute_prepared(p, (20,)).rows == [[3]]
+
+
+def test_prepared_parameter_errors(tmp_path):
+    db = Database.open(tmp_path)
+    _seed(db)
+
+    with pytest.raises(ExecutionError):
+        db.execute_prepared("SELECT id FROM tx WHERE user_id = ?;", ())
+    with pytest.raises(ExecutionError):
+        db.execute_prepared("SELECT id FROM tx WHERE user_id = ?;", ([10],))
+    with pytest.raises(ExecutionError):
+        db.execute_prepared("SELECT id FROM tx LIMIT ?;", (-1,))
+    # Plain execute() must not run a statement with unbound placeholders
+    with pytest.raises(SqlSyntaxError):
+        db.execute("SELECT id FROM tx WHERE user_id = ?;")
+
+
+def test_cached_parse_resolves_against_current_schema(tmp_path):
+    db = Database.open(tmp_path)
+    _seed(db)
+
+    sql = "SELECT * FROM tx WHERE id = 1;"
+    assert db.execute(sql).columns == ["id", "user_id", "note"]
+    db.execute("ALTER TABLE tx ADD COLUMN ym TEXT;")
+    res = db.execute(sql)
+    assert res.columns == ["id", "user_id", "note", "ym"]
+    assert res.rows == [[1, 10, "a", None]]
+
+
+def test_named_prepared_statements(tmp_path):
+    db = Database.open(tmp_path)
+    _seed(db)
+
+    p = db.prepare("SELECT id FROM tx WHERE user_id = ? ORDER BY id;", name="by_user")
+    assert p.execute((20,)).rows == [[3]]
+    assert db.execute_named("by_user", (10,)).rows == [[1], [2], [4]]
+
+    db.deallocate("by_user")
+    with pytest.raises(ExecutionError):
+        db.execute_named("by_user", (10,))
+
+
+def test_executemany_inserts_as_one_batch(tmp_path):
+    db = Database.open(tmp_path)
+    _seed(db)
+
+    ins = "INSERT INTO tx (id, user_id, note) VALUES (?, ?, ?);"
+    res = db.executemany(ins, [(5, 30, "x"), (6, 30, None), (7, 30, "y")])
+    assert res.rows_affected == 3
+    assert db.execute_prepared("SELECT id FROM tx WHERE user_id = ?;", (30,)).rows == [[5], [6], [7]]
+
+    # All-or-nothing: a duplicate key anywhere rejects the whole batch
+    with pytest.raises(ConstraintError):
+        db.executemany(ins, [(8, 40, "a"), (1, 40, "b")])
+    with pytest.raises(ConstraintError):
+        db.executemany(ins, [(8, 40, "a"), (8, 40, "b")])
+    assert db.execute_prepared("SELECT id FROM tx WHERE user_id = ?;", (40,)).rows == []
+
+    res = db.executemany("DELETE FROM tx WHERE id = ?;", [(5,), (6,), (99,)])
+    assert res.rows_affected == 2
+    with pytest.raises(ExecutionError):
+        db.executemany("SELECT id FROM tx WHERE id = ?;", [(1,)])
+
+
+def test_dml_results_are_shared_and_keep_messages(tmp_path):
+    db = Database.open(tmp_path)
+    _seed(db)
+
+    ins = "INSERT INTO tx (id, user_id, note) VALUES (?, ?, ?);"
+    a = db.execute_prepared(ins, (5, 30, "x"))
+    b = db.execute_prepared(ins, (6, 30, "y"))
+    assert a is b
+    assert (a.rows_affected, a.message) == (1, "1 row inserted")
+
+    res = db.execute_prepared("UPDATE tx SET note = ? WHERE user_id = ?;", ("z", 30))
+    assert (res.rows_affected, res.message) == (2, "2 rows updated")
+    res = db.execute_prepared("DELETE FROM tx WHERE user_id = ?;", (99,))
+    assert (res.rows_affected, res.message) == (0, "0 rows deleted")
+
+
+def test_script_parse_is_cached(tmp_path):
+    db = Database.open(tmp_path)
+    _seed(db)
+
+    script = "UPDATE tx SET note = 'n' WHERE id = 1; SELECT * FROM tx WHERE id = 1;"
+    first = db.execute_script(script)
+    db.execute("ALTER TABLE tx ADD COLUMN ym TEXT;")
+    second = db.execute_script(script)
+    assert first[1].rows == [[1, 10, "n"]]
+    assert second[1].rows == [[1, 10, "n", None]]
+    assert db._parse_script_cached.cache_info().hits == 1
+
+    with pytest.raises(SqlSyntaxError):
+        db.execute_script("DELETE FROM tx; SELECT FROM;")
+    assert len(db.execute("SELECT id FROM tx;").rows) == 4
+
+
+def test_statements_of_one_shape_share_a_prepared_parse(tmp_path):
+    db = Database.open(tmp_path)
+    db.execute("CREATE TABLE a (id INTEGER PRIMARY KEY, s VARCHAR(5));")
+    db.execute("CREATE TABLE b (id INTEGER PRIMARY KEY, s VARCHAR(9));")
+    for i, s in [(1, "x"), (2, "it''s"), (3, "7")]:
+        db.execute(f"INSERT INTO a (id, s) VALUES ({i}, '{s}');")
+    assert len([p for p in db._shapes.values() if p is not None]) == 1
+
+    sel = "SELECT id, s FROM a{} WHERE id = {};"
+    assert [db.execute(sel.format("", i)).rows for i in (1, 2, 3)] == [[[1, "x"]], [[2, "it's"]], [[3, "7"]]]
+    # A digit inside a name is not a literal; a different name is a different shape
+    with pytest.raises(ExecutionError):
+        db.execute(sel.format("2", 1))
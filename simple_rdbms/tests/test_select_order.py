@@ -0,0 +1,86 @@
+from simpledb import Database
+from simpledb.result import QueryResult
+
+
+def _seed(db):
+    db.execute("CREATE TABLE tx (id INTEGER PRIMARY KEY, user_id INTEGER, date DATE, note TEXT);")
+    db.execute("INSERT INTO tx (id, user_id, date, note) VALUES (1, 10, '2024-01-02', 'b');")
+    db.execute("INSERT INTO tx (id, user_id, date, note) VALUES (2, 10, '2024-01-03', NULL);")
+    db.execute("INSERT INTO tx (id, user_id, date, note) VALUES (3, 20, '2024-01-01', 'a');")
+    db.execute("INSERT INTO tx (id, user_id, date, note) VALUES (4, 10, '2024-01-03', 'c');")
+
+
+def test_order_by_multiple_keys_and_limit(tmp_path):
+    db = Database.open(tmp_path)
+    _seed(db)
+
+    res = db.execute("SELECT id FROM tx ORDER BY date DESC, id DESC;")
+    assert isinstance(res, QueryResult)
+    assert res.rows == [[4], [2], [1], [3]]
+
+    res = db.execute("SELECT id FROM tx WHERE user_id = 10 ORDER BY date, id LIMIT 2;")
+    assert res.rows == [[1], [2]]
+
+
+def test_order_by_nulls_and_limit_without_order(tmp_path):
+    db = Database.open(tmp_path)
+    _seed(db)
+
+    res = db.execute("SELECT id FROM tx ORDER BY note;")
+    assert res.rows == [[2], [3], [1], [4]]
+
+    res = db.execute("SELECT id FROM tx LIMIT 1;")
+    assert res.rows == [[1]]
+
+    db.execute("CREATE INDEX idx_tx_user ON tx(user_id);")
+    res = db.execute("SELECT id FROM tx WHERE user_id = 10 LIMIT 0;")
+    assert res.rows == []
+    assert res.stats["plan"] == "index"
+
+
+def test_order_by_with_limit_matches_full_sort(tmp_path):
+    db = Database.open(tmp_path)
+    _seed(db)
+    db.execute("INSERT INTO tx (id, user_id, date, note) VALUES (5, 20, '2024-01-03', NULL);")
+
+    for order in ("date DESC, note", "note DESC, id", "user_id, date DESC", "note"):
+        full = db.execute(f"SELECT id FROM tx ORDER BY {order};").rows
+        for n in range(0, 7):
+            res = db.execute(f"SELECT id FROM tx ORDER BY {order} LIMIT {n};")
+            assert res.rows == full[:n], (order, n)
+
+
+def test_compiled_scan_filters_projects_and_limits(tmp_path):
+    db = Database.open(tmp_path)
+    _seed(db)
+
+    assert db.execute("SELECT note, id FROM tx WHERE user_id = 10 AND date = '2024-01-03';").rows == [[None, 2], ["c", 4]]
+    assert db.execute("SELECT id FROM tx WHERE user_id = 10 LIMIT 2;").rows == [[1], [2]]
+    assert db.execute("SELECT id FROM tx WHERE user_id = 20;").rows == [[3]]
+    assert db.execute("SELECT id FROM tx LIMIT 0;").rows == []
+
+
+def test_select_star_after_add_column(tmp_path):
+    db = Database.open(tmp_path)
+    _seed(db)
+    db.execute("ALTER TABLE tx ADD COLUMN ym TEXT;")
+    db.execute("INSERT INTO tx (id, user_id, date, note, ym) VALUES (5, 30, '2024-02-01', 'd', '2024-02');")
+
+    res = db.execute("SELECT * FROM tx;")
+    assert res.columns == ["id", "user_id", "date", "note", "ym"]
+    assert res.rows[0] == [1, 10, "2024-01-02", "b", None]
+    assert res.rows[-1] == [5, 30, "2024-02-01", "d", "2024-02"]
+    assert db.execute("SELECT id FROM tx WHERE ym = NULL LIMIT 2;").rows == [[1], [2]]
+    assert db.execute("SELECT id FROM tx WHERE ym = '2024-02';").rows == [[5]]
+
+
+def test_order_by_projects_sort_columns_once(tmp_path):
+    db = Database.open(tmp_path)
+    _seed(db)
+
+    res = db.execute("SELECT note, id, note FROM tx WHERE user_id = 10 ORDER BY note DESC;")
+    assert res.rows == [["c", 4, "c"], ["b", 1, "b"], [None, 2, None]]
+    res = db.execute("SELECT date, id FROM tx WHERE user_id = 10 ORDER BY date DESC, id LIMIT 2;")
+    assert res.rows == [["2024-01-03", 2], ["2024-01-03", 4]]
+    res = db.execute("SELECT note FROM tx WHERE user_id = 10 ORDER BY id DESC LIMIT 2;")
+    assert res.rows == [["c"], [None]]
@@ -52,4 +52,4 @@ def test_basic_type_validation_integer(tmp_path):
     db = Database.open(tmp_path)
     db.execute("CREATE TABLE t (a INTEGER);")
     with pytest.raises(ExecutionError):
-        db.execute("INSERT INTO t (a) VALUES ('not-int');")
\ No newline at end of file
+        db.execute("INSERT INTO t (a) VALUES ('not-int');")